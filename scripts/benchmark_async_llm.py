@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark the asyncio LLM classifier against a local fake OpenAI server.
+
+No network access or API key needed. Scenarios:
+1. Sequential baseline (concurrency 1, no client-side rate limit)
+2. Concurrent requests at several concurrency limits
+3. Concurrent requests against a server that enforces a rate limit (429s),
+   showing backoff recovering every request
+
+Each run checks that predictions come back in input order.
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+import pandas as pd
+from openai import AsyncOpenAI
+
+from fake_openai_server import start_fake_server
+from profanity_filter import ProfanityFilter
+from profanity_filter.async_llm import AsyncLLMClassifier
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the async LLM classifier")
+    parser.add_argument('--messages', type=int, default=200,
+                        help="Messages per run (default: 200)")
+    parser.add_argument('--latency', type=float, default=0.1,
+                        help="Fake server latency per request in seconds (default: 0.1)")
+    return parser.parse_args()
+
+
+async def run_classifier(server, prompt_template, messages, **kwargs):
+    """Return (predictions, seconds, stats) for one classifier run."""
+    async with AsyncOpenAI(base_url=server.base_url, api_key="local", max_retries=0) as client:
+        classifier = AsyncLLMClassifier(client, prompt_template, base_delay=0.2, **kwargs)
+
+        start = time.perf_counter()
+        predictions = await classifier.classify_many(messages)
+        return predictions, time.perf_counter() - start, classifier.stats
+
+
+def main():
+    args = parse_args()
+    prompt_template = Path('data/prompt_template.txt').read_text()
+    sample = pd.read_csv('data/gametox_sample_50.csv')['message'].astype(str).tolist()
+    # Unique suffixes so identical in-flight messages are not coalesced
+    messages = [f"{sample[i % len(sample)]} #{i}" for i in range(args.messages)]
+
+    # The fake server answers with the word-list verdict, so order can be checked
+    word_filter = ProfanityFilter.from_file('data/profanity_words.txt')
+    expected = [1 if word_filter.check(m) else 0 for m in messages]
+
+    scenarios = [
+        ("sequential", {}, dict(concurrency=1, requests_per_minute=None)),
+        ("concurrency=5", {}, dict(concurrency=5, requests_per_minute=None)),
+        ("concurrency=20", {}, dict(concurrency=20, requests_per_minute=None)),
+        ("concurrency=50", {}, dict(concurrency=50, requests_per_minute=None)),
+        ("server limit 50 rps, no client limit", dict(rate_limit=50),
+         dict(concurrency=50, requests_per_minute=None)),
+        ("server limit 50 rps, bucket 2700 rpm", dict(rate_limit=50),
+         dict(concurrency=50, requests_per_minute=2700, burst=5)),
+    ]
+
+    print("=" * 90)
+    print("ASYNC LLM CLASSIFIER BENCHMARK (local fake server)")
+    print("=" * 90)
+    print(f"Messages per run: {len(messages)}   Server latency: {args.latency * 1000:.0f} ms")
+    print()
+    print(f"{'Scenario':<40} {'Seconds':<10} {'Msg/s':<10} {'Requests':<10} {'429s':<8} {'Failed':<8}")
+    print("-" * 90)
+
+    for name, server_kwargs, classifier_kwargs in scenarios:
+        server = start_fake_server(latency=args.latency, word_filter=word_filter, **server_kwargs)
+        try:
+            predictions, seconds, stats = asyncio.run(run_classifier(
+                server, prompt_template, messages, **classifier_kwargs
+            ))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert predictions == expected, f"Predictions out of order in scenario {name!r}"
+        print(f"{name:<40} {seconds:<10.2f} {len(messages) / seconds:<10.1f} "
+              f"{stats['requests']:<10} {stats['rate_limited']:<8} {stats['failures']:<8}")
+
+    print()
+    print("✓ Predictions returned in input order for every scenario")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Compare CSV and Parquet loading of GameTox.
+
+Each loader runs in a fresh process and reports:
+1. Load time (best of --runs)
+2. DataFrame memory (memory_usage(deep=True))
+3. Peak memory while loading: Python/numpy allocations (tracemalloc)
+   plus the Arrow memory pool, so temporary parser buffers count too
+
+The Parquet file is written next to the CSV first if it does not exist
+(same as scripts/convert_to_parquet.py).
+"""
+
+import argparse
+import multiprocessing
+import time
+from pathlib import Path
+
+from profanity_filter.columnar import convert_csv, parquet_path
+
+COLUMNS = ['message', 'label']
+
+
+def load(loader, path):
+    """Run one loader in this process; returns (seconds, frame bytes, peak bytes)."""
+    import tracemalloc
+
+    import pandas as pd
+
+    from profanity_filter.columnar import has_pyarrow, read_table
+
+    pool = None
+    if has_pyarrow():
+        import pyarrow
+
+        pool = pyarrow.default_memory_pool()
+
+    loaders = {
+        'csv (all columns)': lambda: pd.read_csv(path),
+        'csv (usecols)': lambda: pd.read_csv(path, usecols=COLUMNS),
+        'csv (object strings)': lambda: pd.read_csv(path, usecols=COLUMNS,
+                                                    dtype={'message': object}),
+        'parquet (columns)': lambda: read_table(path, COLUMNS),
+    }
+    # Traced load for memory first (tracing slows it down), then an untraced one for time
+    arrow_before = pool.max_memory() if pool is not None else 0
+    tracemalloc.start()
+    frame_bytes = int(loaders[loader]().memory_usage(deep=True).sum())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if pool is not None:
+        peak += max(pool.max_memory() - arrow_before, 0)
+
+    start = time.perf_counter()
+    loaders[loader]()
+    return time.perf_counter() - start, frame_bytes, peak
+
+
+def measure(loader, path, runs):
+    """Best time over fresh processes, memory from the first one."""
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for _ in range(runs):
+        with context.Pool(1) as pool:
+            results.append(pool.apply(load, (loader, path)))
+    return min(result[0] for result in results), results[0][1], results[0][2]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark CSV vs Parquet loading")
+    parser.add_argument('--input', default='data/gametox.csv',
+                        help="CSV to compare (default: data/gametox.csv)")
+    parser.add_argument('--runs', type=int, default=3,
+                        help="Fresh-process runs per loader (default: 3)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    csv_file = Path(args.input)
+    parquet_file = parquet_path(csv_file)
+    if not parquet_file.exists():
+        print(f"Converting {csv_file} -> {parquet_file}...")
+        convert_csv(csv_file)
+
+    print("=" * 80)
+    print("COLUMNAR INGESTION BENCHMARK")
+    print("=" * 80)
+    print(f"{csv_file}: {csv_file.stat().st_size / 1e6:.1f} MB, "
+          f"{parquet_file}: {parquet_file.stat().st_size / 1e6:.1f} MB")
+    print()
+    print(f"{'Loader':<24} {'Load (s)':<10} {'Speedup':<9} {'Frame (MB)':<12} {'Peak (MB)':<10}")
+    print("-" * 80)
+    baseline = None
+    for loader in ('csv (all columns)', 'csv (usecols)', 'csv (object strings)',
+                   'parquet (columns)'):
+        path = parquet_file if loader.startswith('parquet') else csv_file
+        seconds, frame_bytes, peak_bytes = measure(loader, path, args.runs)
+        baseline = baseline or seconds
+        print(f"{loader:<24} {seconds:<10.3f} {baseline / seconds:<9.1f} "
+              f"{frame_bytes / 1e6:<12.1f} {peak_bytes / 1e6:<10.1f}")
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Measure what duplicate collapsing saves on GameTox.
+
+For exact and near-duplicate (MinHash) grouping this script reports:
+1. The dedup ratio (rows per classified representative) and grouping time
+2. Level 1 flagging time over every row vs over representatives only
+   (plain regex and the fuzzy filter, whose per-row cost is higher), and
+   how many rows get a different verdict after fan-out ('near+wl' only
+   merges messages the regex filter flags alike, as the scripts do)
+3. LLM calls avoided, and the time they would have cost at --llm-seconds
+   per call
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.dedup import Deduplicator
+from profanity_filter.fuzzy import FuzzyFilter
+
+
+def best_of(func, runs=3):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark dedup before classification")
+    parser.add_argument('--input', default='data/gametox.csv',
+                        help="CSV with a 'message' column (default: data/gametox.csv)")
+    parser.add_argument('--llm-seconds', type=float, default=0.5,
+                        help="Assumed seconds per LLM classification (default: 0.5)")
+    parser.add_argument('--threshold', type=float, default=0.7,
+                        help="Near-duplicate Jaccard threshold (default: 0.7)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    messages = pd.read_csv(args.input)['message']
+    filters = [('regex', ProfanityFilter.from_file('data/profanity_words.txt')),
+               ('fuzzy', FuzzyFilter.from_file('data/profanity_words.txt', cache_size=0))]
+
+    print("=" * 90)
+    print("DEDUP BENCHMARK")
+    print("=" * 90)
+    print(f"Corpus: {args.input} ({len(messages):,} rows)")
+    print()
+    print(f"{'Mode':<7} {'Unique':<9} {'Ratio':<8} {'Group (s)':<10} {'Filter':<7} "
+          f"{'All rows (s)':<13} {'Dedup (s)':<10} {'Speedup':<8} {'Changed':<8}")
+    print("-" * 90)
+
+    llm_rows = []
+    modes = [('exact', {}), ('near', {}), ('near+wl', {'word_filter': filters[0][1]})]
+    for mode, options in modes:
+        deduplicator = Deduplicator(near_duplicates=mode != 'exact', threshold=args.threshold,
+                                    **options)
+        group_seconds, groups = best_of(lambda: deduplicator(messages), runs=1)
+        representatives = groups.representatives(messages)
+        for name, word_filter in filters:
+            full_seconds, full = best_of(lambda: word_filter.flag_series(messages))
+            dedup_seconds, flags = best_of(lambda: word_filter.flag_series(representatives))
+            dedup_seconds += group_seconds
+            changed = int((groups.expand(flags.to_numpy()) != full.to_numpy()).sum())
+            print(f"{mode:<7} {len(groups):<9,} {len(messages) / len(groups):<8.1f} "
+                  f"{group_seconds:<10.3f} {name:<7} {full_seconds:<13.3f} {dedup_seconds:<10.3f} "
+                  f"{full_seconds / dedup_seconds:<8.1f} {changed:<8,}")
+        llm_rows.append((mode, len(groups)))
+    print()
+
+    print(f"LLM calls at {args.llm_seconds:g}s each (before any verdict cache):")
+    print(f"  no dedup: {len(messages):,} calls, {len(messages) * args.llm_seconds / 60:,.1f} min")
+    for mode, unique in llm_rows:
+        saved = len(messages) - unique
+        print(f"  {mode:<8}: {unique:,} calls, {unique * args.llm_seconds / 60:,.1f} min "
+              f"({saved:,} calls / {saved * args.llm_seconds / 60:,.1f} min saved)")
+
+
+if __name__ == '__main__':
+    main()
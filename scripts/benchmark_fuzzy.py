@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Fuzzy matching: what it catches, what it costs, and how it scales.
+
+This script:
+1. Scores the exact and fuzzy filters on GameTox (data/gametox.csv, falling
+   back to the 50-message sample) side by side
+2. Builds a "misspelling" copy of the messages the exact filter catches,
+   with one random edit per matched word (fuk, shiit, biatch, fcuk), and
+   reports how many each filter still catches
+3. Times both filters per message
+4. Times one token lookup against synthetic word lists of growing size,
+   SymSpell index vs comparing the token with every word
+"""
+
+import argparse
+import random
+import string
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.fuzzy import FuzzyFilter, SymSpellIndex, edit_distance
+from profanity_filter.metrics import calculate_metrics
+
+LIST_SIZES = [10, 1_000, 10_000, 100_000]
+
+
+def misspell(word, rng):
+    """Apply one random edit (keeping the first letter) to a word."""
+    index = rng.randrange(1, len(word))
+    style = rng.choice(['delete', 'double', 'swap', 'insert'])
+    if style == 'delete' and len(word) > 3:
+        return word[:index] + word[index + 1:]
+    if style == 'swap' and index < len(word) - 1:
+        return word[:index] + word[index + 1] + word[index] + word[index + 2:]
+    if style == 'insert':
+        return word[:index] + rng.choice('aeiouy') + word[index:]
+    return word[:index] + word[index] + word[index:]
+
+
+def misspelling_corpus(messages, word_filter, rng):
+    """Replace every matched word in caught messages with a misspelling."""
+    misspelled = []
+    for message in messages:
+        matches = word_filter.explain(message)
+        if not matches:
+            continue
+        lowered = message.lower()
+        for match in reversed(matches):
+            lowered = lowered[:match['start']] + misspell(match['word'], rng) + lowered[match['end']:]
+        misspelled.append(lowered)
+    return misspelled
+
+
+def per_message_us(func, messages, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for message in messages:
+            func(message)
+        best = min(best, time.perf_counter() - start)
+    return best / len(messages) * 1e6
+
+
+def lookup_us(func, tokens):
+    start = time.perf_counter()
+    for token in tokens:
+        func(token)
+    return (time.perf_counter() - start) / len(tokens) * 1e6
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy matching recall and cost")
+    parser.add_argument('--input', default='data/gametox.csv',
+                        help="GameTox CSV (default: data/gametox.csv, else the 50-message sample)")
+    parser.add_argument('--rows', type=int, default=200_000,
+                        help="Maximum rows to score (default: 200,000)")
+    parser.add_argument('--distance', type=int, default=1,
+                        help="Maximum edit distance (default: 1)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=LIST_SIZES,
+                        help="Word-list sizes for the scaling test (default: 10 1000 10000 100000)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(42)
+    source = Path(args.input)
+    if not source.exists():
+        source = Path('data/gametox_sample_50.csv')
+    df = pd.read_csv(source, usecols=['message', 'label'], nrows=args.rows).dropna(subset=['label'])
+    messages = df['message'].fillna('').astype(str).tolist()
+
+    exact = ProfanityFilter.from_file('data/profanity_words.txt')
+    fuzzy = FuzzyFilter.from_file('data/profanity_words.txt', max_distance=args.distance)
+
+    print("=" * 70)
+    print("FUZZY MATCHING BENCHMARK")
+    print("=" * 70)
+    print(f"Corpus: {source} ({len(messages):,} labelled messages), distance <= {args.distance}")
+    print()
+
+    print(f"{'Filter':<10} {'Flagged':<10} {'False pos':<10} {'Accuracy':<10} {'Precision':<10} "
+          f"{'Recall':<10} {'F1':<8}")
+    print("-" * 70)
+    for name, word_filter in [('exact', exact), ('fuzzy', fuzzy)]:
+        predictions = word_filter.check_many(messages)
+        metrics = calculate_metrics(df['label'], predictions)
+        print(f"{name:<10} {sum(predictions):<10,} {metrics['fp']:<10,} {metrics['accuracy']:<10.3f} "
+              f"{metrics['precision']:<10.3f} {metrics['recall']:<10.3f} {metrics['f1']:<8.3f}")
+    print()
+
+    misspelled = misspelling_corpus(messages, exact, rng)
+    print(f"Misspelling set: {len(misspelled):,} caught messages with their matches misspelled")
+    for name, word_filter in [('exact', exact), ('fuzzy', fuzzy)]:
+        caught = sum(word_filter.check_many(misspelled))
+        rate = caught / len(misspelled) if misspelled else 0
+        print(f"  {name:<8} still catches {caught:,} ({rate:.1%})")
+    for example in misspelled[:5]:
+        print(f"  {example!r:<45} -> {fuzzy.describe(example)}")
+    print()
+
+    timed = messages * max(1, 20_000 // max(1, len(messages)))
+    exact_us = per_message_us(exact.check, timed)
+    fuzzy_us = per_message_us(fuzzy.check, timed)
+    print("Per-message cost (token results memoized after the first pass):")
+    print(f"  exact check:  {exact_us:.2f} us")
+    print(f"  fuzzy check:  {fuzzy_us:.2f} us (+{fuzzy_us - exact_us:.2f} us)")
+    cold = FuzzyFilter.from_file('data/profanity_words.txt', max_distance=args.distance,
+                                 cache_size=0)
+    print(f"  fuzzy, no memo: {per_message_us(cold.check, timed, repeat=1):.2f} us")
+    print()
+
+    print("Per-token lookup vs word-list size:")
+    print(f"{'Words':<10} {'Build (s)':<11} {'SymSpell (us)':<15} {'Brute force (us)':<18}")
+    print("-" * 70)
+    tokens = [misspell(rng.choice(exact.words), rng) for _ in range(200)]
+    tokens += [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+               for _ in range(200)]
+    for size in args.sizes:
+        words = list(exact.words)
+        while len(words) < size:
+            words.append(''.join(rng.choice(string.ascii_lowercase)
+                                 for _ in range(rng.randint(4, 9))))
+        start = time.perf_counter()
+        index = SymSpellIndex(words, args.distance)
+        build_seconds = time.perf_counter() - start
+        symspell_us = lookup_us(index.lookup, tokens)
+        sample = tokens[::20]
+        brute_us = lookup_us(lambda token: [w for w in words
+                                            if edit_distance(token, w, args.distance)
+                                            <= args.distance], sample)
+        print(f"{size:<10,} {build_seconds:<11.3f} {symspell_us:<15.1f} {brute_us:<18,.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Measure how long `import profanity_filter` takes in a fresh interpreter.
+
+Long-lived services and short worker processes both pay this cost, so the
+package must stay light: no pandas at import time. Exits non-zero if the
+median import time exceeds the budget or if pandas gets pulled in.
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+IMPORT_BUDGET_MS = 50.0
+RUNS = 10
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import profanity_filter
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(elapsed_ms, 'pandas' in sys.modules)
+"""
+
+
+def measure_once():
+    """Return (import time in ms, whether pandas was imported)."""
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(output[0]), output[1] == 'True'
+
+
+def main():
+    timings = []
+    pandas_loaded = False
+    for _ in range(RUNS):
+        elapsed_ms, loaded = measure_once()
+        timings.append(elapsed_ms)
+        pandas_loaded = pandas_loaded or loaded
+
+    median_ms = statistics.median(timings)
+
+    print("=" * 70)
+    print("IMPORT TIME: profanity_filter")
+    print("=" * 70)
+    print(f"Runs:          {RUNS}")
+    print(f"Median:        {median_ms:.2f} ms")
+    print(f"Max:           {max(timings):.2f} ms")
+    print(f"Budget:        {IMPORT_BUDGET_MS:.2f} ms")
+    print(f"pandas loaded: {pandas_loaded}")
+    print()
+
+    if pandas_loaded:
+        print("✗ profanity_filter must not import pandas at import time")
+        return 1
+    if median_ms > IMPORT_BUDGET_MS:
+        print("✗ Import time is over budget")
+        return 1
+
+    print("✓ Import time within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Measure incremental re-scoring against a full Level 1 rescan.
+
+For a set of candidate terms this script reports:
+1. One-time cost: building, saving and loading the inverted index
+2. Per-term what-if time from the index vs a full flag_series rescan with
+   the term added to the word list (and checks both give the same metrics)
+3. Time to apply a whole word-list diff (add all terms, then remove them)
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.index import CorpusIndex, IncrementalScorer, lazy_texts
+from profanity_filter.matcher import load_profanity_words
+from profanity_filter.metrics import calculate_metrics
+
+DEFAULT_TERMS = ['trash', 'noob', 'idiot', 'stupid', 'loser', 'garbage', 'retard', 'kys']
+
+
+def best_of(func, runs=3):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark incremental re-scoring")
+    parser.add_argument('--input', default='data/gametox.csv',
+                        help="Labelled CSV (default: data/gametox.csv)")
+    parser.add_argument('--terms', nargs='+', default=DEFAULT_TERMS,
+                        help="Candidate terms to evaluate")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    df = pd.read_csv(args.input, usecols=['message', 'label'])
+    words = load_profanity_words('data/profanity_words.txt')
+
+    print("=" * 80)
+    print("INCREMENTAL RE-SCORING BENCHMARK")
+    print("=" * 80)
+    print(f"Corpus: {args.input} ({len(df):,} rows), {len(words)} listed words")
+    print()
+
+    build_seconds, index = best_of(lambda: CorpusIndex.build(args.input), runs=1)
+    scorer = IncrementalScorer(index, words, texts=lazy_texts(args.input))
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'index.npz'
+        save_seconds, _ = best_of(lambda: index.save(path, scorer.state()), runs=1)
+        load_seconds, _ = best_of(lambda: CorpusIndex.load(path))
+        size = path.stat().st_size
+    print(f"Index build: {build_seconds:.3f}s, save: {save_seconds:.3f}s, "
+          f"load: {load_seconds:.3f}s ({size / 1e6:.1f} MB, {len(index.vocab):,} tokens)")
+    print()
+
+    print(f"{'Term':<12} {'Rows':<8} {'Rescan (ms)':<13} {'Index (ms)':<12} {'Speedup':<9} "
+          f"{'Same':<5}")
+    print("-" * 80)
+    for term in args.terms:
+        rescan_filter = ProfanityFilter(words + [term])
+        rescan_seconds, flags = best_of(lambda: rescan_filter.flag_series(df['message']))
+        expected = calculate_metrics(df['label'], flags)
+        index_seconds, result = best_of(lambda: scorer.what_if(term))
+        same = 'yes' if result['metrics'] == expected else 'NO'
+        print(f"{term:<12} {result['rows']:<8,} {rescan_seconds * 1e3:<13.1f} "
+              f"{index_seconds * 1e3:<12.3f} {rescan_seconds / index_seconds:<9.0f} {same:<5}")
+    print()
+
+    add_seconds, _ = best_of(lambda: scorer.update(words + args.terms), runs=1)
+    remove_seconds, _ = best_of(lambda: scorer.update(words), runs=1)
+    print(f"Word-list diff of {len(args.terms)} terms: add {add_seconds * 1e3:.1f} ms, "
+          f"remove {remove_seconds * 1e3:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
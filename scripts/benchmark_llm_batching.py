@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark batched multi-message LLM prompts against the single-message path.
+
+For each batch size the 50-message GameTox sample is classified and scored
+with profanity_filter.metrics.calculate_metrics, next to messages/second and the
+number of API requests. By default everything runs against the local fake
+OpenAI server (no network, no cost); pass --base-url and set
+OPENROUTER_API_KEY to measure a real model's accuracy at each batch size.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+from openai import AsyncOpenAI
+
+from fake_openai_server import start_fake_server
+from profanity_filter.async_llm import AsyncLLMClassifier
+from profanity_filter.metrics import calculate_metrics
+
+BATCH_SIZES = [1, 5, 10, 25, 50]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark batched LLM prompts")
+    parser.add_argument('--base-url', default=None,
+                        help="OpenAI-compatible API (default: start a local fake server)")
+    parser.add_argument('--latency', type=float, default=0.3,
+                        help="Fake server latency per request in seconds (default: 0.3)")
+    parser.add_argument('--malformed-rate', type=float, default=0.1,
+                        help="Fake server: fraction of batch replies missing a line (default: 0.1)")
+    parser.add_argument('--concurrency', type=int, default=5,
+                        help="Maximum requests in flight (default: 5)")
+    parser.add_argument('--rpm', type=float, default=None,
+                        help="Client-side requests per minute limit (default: none)")
+    return parser.parse_args()
+
+
+async def classify(base_url, api_key, messages, batch_size, args):
+    prompt_template = Path('data/prompt_template.txt').read_text()
+    batch_prompt_template = Path('data/prompt_template_batch.txt').read_text()
+    async with AsyncOpenAI(base_url=base_url, api_key=api_key, max_retries=0) as client:
+        classifier = AsyncLLMClassifier(
+            client, prompt_template, concurrency=args.concurrency,
+            requests_per_minute=args.rpm, batch_size=batch_size,
+            batch_prompt_template=batch_prompt_template
+        )
+        start = time.perf_counter()
+        predictions = await classifier.classify_many(messages)
+        return predictions, time.perf_counter() - start, classifier.stats
+
+
+def main():
+    args = parse_args()
+    df = pd.read_csv('data/gametox_sample_50.csv')
+    messages = df['message'].astype(str).tolist()
+
+    server = None
+    if args.base_url is None:
+        server = start_fake_server(latency=args.latency, malformed_rate=args.malformed_rate)
+        base_url, api_key = server.base_url, "local"
+    else:
+        base_url, api_key = args.base_url, os.getenv("OPENROUTER_API_KEY", "local")
+
+    print("=" * 95)
+    print("BATCHED LLM PROMPT BENCHMARK")
+    print("=" * 95)
+    print(f"Endpoint: {base_url}   Messages: {len(messages)}")
+    print()
+    print(f"{'Batch':<7} {'Seconds':<9} {'Msg/s':<9} {'Requests':<10} {'Fallbacks':<11} "
+          f"{'Accuracy':<10} {'Precision':<10} {'Recall':<8} {'F1':<6}")
+    print("-" * 95)
+
+    try:
+        for batch_size in BATCH_SIZES:
+            predictions, seconds, stats = asyncio.run(
+                classify(base_url, api_key, messages, batch_size, args)
+            )
+            metrics = calculate_metrics(df['label'], predictions)
+            print(f"{batch_size:<7} {seconds:<9.2f} {len(messages) / seconds:<9.1f} "
+                  f"{stats['requests']:<10} {stats['batch_fallbacks']:<11} "
+                  f"{metrics['accuracy']:<10.3f} {metrics['precision']:<10.3f} "
+                  f"{metrics['recall']:<8.3f} {metrics['f1']:<6.3f}")
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    print()
+    print("Batch 1 is the existing single-message path (one prompt per message).")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Measure how the verdict cache cuts LLM calls on repetitive chat traffic.
+
+Replays a repetitive message stream (drawn from the GameTox sample) against
+the local fake OpenAI server three times:
+1. no cache
+2. cold cache (LRU + fresh SQLite file)
+3. warm cache from disk (new process-level LRU, same SQLite file)
+
+Repeats that arrive while the first copy is still in flight are coalesced
+into one request, so even the no-cache run makes one call per unique message.
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from openai import AsyncOpenAI
+
+from fake_openai_server import start_fake_server
+from profanity_filter.async_llm import AsyncLLMClassifier
+from profanity_filter.cache import VerdictCache
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the LLM verdict cache")
+    parser.add_argument('--messages', type=int, default=500,
+                        help="Messages in the replayed stream (default: 500)")
+    parser.add_argument('--latency', type=float, default=0.1,
+                        help="Fake server latency per request in seconds (default: 0.1)")
+    return parser.parse_args()
+
+
+async def replay(server, prompt_template, messages, cache):
+    async with AsyncOpenAI(base_url=server.base_url, api_key="local", max_retries=0) as client:
+        classifier = AsyncLLMClassifier(client, prompt_template, concurrency=20,
+                                        requests_per_minute=None, cache=cache)
+        start = time.perf_counter()
+        predictions = await classifier.classify_many(messages)
+        return predictions, time.perf_counter() - start, classifier.stats
+
+
+def main():
+    args = parse_args()
+    prompt_template = Path('data/prompt_template.txt').read_text()
+    sample = pd.read_csv('data/gametox_sample_50.csv')['message'].astype(str).tolist()
+
+    # Chat is heavy-tailed: a few short messages repeat constantly
+    rng = random.Random(42)
+    weights = [1 / (rank + 1) for rank in range(len(sample))]
+    messages = rng.choices(sample, weights=weights, k=args.messages)
+    unique = len({m.strip().lower() for m in messages})
+
+    server = start_fake_server(latency=args.latency)
+    print("=" * 90)
+    print("LLM VERDICT CACHE BENCHMARK (local fake server)")
+    print("=" * 90)
+    print(f"Messages: {len(messages)}   Unique: {unique}   Server latency: {args.latency * 1000:.0f} ms")
+    print()
+    print(f"{'Run':<25} {'Seconds':<10} {'API calls':<12} {'Coalesced':<10} {'Mem hits':<10} {'Disk hits':<10} {'Hit rate':<10}")
+    print("-" * 90)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / 'verdicts.sqlite'
+            baseline = None
+            for name, make_cache in [
+                ("no cache", lambda: None),
+                ("cold cache", lambda: VerdictCache(db_path)),
+                ("warm cache (from disk)", lambda: VerdictCache(db_path)),
+            ]:
+                cache = make_cache()
+                predictions, seconds, stats = asyncio.run(
+                    replay(server, prompt_template, messages, cache)
+                )
+                if baseline is None:
+                    baseline = predictions
+                assert predictions == baseline, f"Cached verdicts differ in run {name!r}"
+
+                mem_hits = cache.stats['memory_hits'] if cache else 0
+                disk_hits = cache.stats['disk_hits'] if cache else 0
+                hit_rate = f"{cache.hit_rate * 100:.1f}%" if cache else "-"
+                print(f"{name:<25} {seconds:<10.2f} {stats['requests']:<12} "
+                      f"{stats['coalesced']:<10} {mem_hits:<10} {disk_hits:<10} {hit_rate:<10}")
+                if cache:
+                    cache.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
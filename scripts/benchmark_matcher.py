@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark the precompiled WordMatcher against the old per-word regex loop.
+
+This script:
+1. Builds word lists of growing size (10 -> 10,000 entries) by padding the
+   real profanity list with synthetic words
+2. Checks that both approaches return the same 0/1 result on every message
+3. Reports messages/second for each approach at each list size
+"""
+
+import random
+import re
+import string
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from profanity_filter import WordMatcher, load_profanity_words
+
+WORD_LIST_SIZES = [10, 100, 1000, 10000]
+NUM_MESSAGES = 2000
+# The per-word loop gets too slow to time on every message for big lists
+LEGACY_MAX_MESSAGES = 50
+
+
+def legacy_regex_filter(text, profanity_words):
+    """Original compare_approaches.regex_filter: one search per word."""
+    text_lower = text.lower()
+    for word in profanity_words:
+        pattern = r'\b' + re.escape(word) + r'\b'
+        if re.search(pattern, text_lower):
+            return 1
+    return 0
+
+
+def synthetic_words(base_words, size, rng):
+    """Pad the real word list with random lowercase words up to size."""
+    words = list(base_words)[:size]
+    seen = set(words)
+    while len(words) < size:
+        word = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def load_messages(sample_file, count, rng):
+    """Repeat the sample messages up to the requested count."""
+    messages = pd.read_csv(sample_file)['message'].dropna().astype(str).tolist()
+    return [rng.choice(messages) for _ in range(count)]
+
+
+def time_calls(func, messages):
+    """Return (results, messages/second) for func applied to every message."""
+    start = time.perf_counter()
+    results = [func(message) for message in messages]
+    elapsed = time.perf_counter() - start
+    rate = len(messages) / elapsed if elapsed > 0 else float('inf')
+    return results, rate
+
+
+def main():
+    rng = random.Random(42)
+    base_words = load_profanity_words(Path('data/profanity_words.txt'))
+    messages = load_messages(Path('data/gametox_sample_50.csv'), NUM_MESSAGES, rng)
+    legacy_messages = messages[:LEGACY_MAX_MESSAGES]
+
+    print("=" * 70)
+    print("WORD MATCHER BENCHMARK")
+    print("=" * 70)
+    print(f"Messages per run: {len(messages)} (legacy loop: {len(legacy_messages)})")
+    print()
+    print(f"{'Words':<10} {'Build (ms)':<12} {'Legacy msg/s':<15} {'Matcher msg/s':<15} {'Speedup':<10}")
+    print("-" * 70)
+
+    for size in WORD_LIST_SIZES:
+        words = synthetic_words(base_words, size, rng)
+
+        start = time.perf_counter()
+        matcher = WordMatcher(words)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        legacy_results, legacy_rate = time_calls(
+            lambda m: legacy_regex_filter(m, words), legacy_messages
+        )
+        matcher_results, matcher_rate = time_calls(
+            lambda m: 1 if matcher.contains(m) else 0, messages
+        )
+
+        # Same 0/1 answer as the per-word loop
+        assert legacy_results == matcher_results[:len(legacy_results)], \
+            f"Matcher disagrees with per-word loop at {size} words"
+
+        speedup = f"{matcher_rate / legacy_rate:,.1f}x"
+        print(f"{size:<10} {build_ms:<12.1f} {legacy_rate:<15,.0f} {matcher_rate:<15,.0f} {speedup:<10}")
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized metrics engine against the old Python-loop version.
+
+The old compare_approaches.calculate_metrics made four generator passes over
+zipped Python lists; profanity_filter.metrics encodes each row once and
+counts with np.bincount. Both must return identical metrics.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from profanity_filter.metrics import calculate_metrics, grouped_confusion_counts
+
+ROW_COUNTS = [100_000, 1_000_000, 10_000_000, 100_000_000]
+LEGACY_MAX_ROWS = 1_000_000
+
+
+def legacy_calculate_metrics(y_true, y_pred):
+    """Original compare_approaches.calculate_metrics (Python loops)."""
+    y_true = [int(y) for y in y_true]
+    y_pred = [int(y) for y in y_pred]
+
+    tp = sum(1 for true, pred in zip(y_true, y_pred) if true == 1 and pred == 1)
+    fp = sum(1 for true, pred in zip(y_true, y_pred) if true == 0 and pred == 1)
+    tn = sum(1 for true, pred in zip(y_true, y_pred) if true == 0 and pred == 0)
+    fn = sum(1 for true, pred in zip(y_true, y_pred) if true == 1 and pred == 0)
+
+    return {'tp': tp, 'fp': fp, 'tn': tn, 'fn': fn}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark confusion-matrix computation")
+    parser.add_argument('--max-rows', type=int, default=ROW_COUNTS[-1],
+                        help="Largest row count to run (default: 100,000,000)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rng = np.random.default_rng(42)
+
+    print("=" * 80)
+    print("METRICS ENGINE BENCHMARK")
+    print("=" * 80)
+    print(f"{'Rows':<14} {'Legacy (s)':<12} {'Vectorized (s)':<16} {'Grouped (s)':<13} {'Rows/s':<15} {'Speedup':<10}")
+    print("-" * 80)
+
+    for rows in [r for r in ROW_COUNTS if r <= args.max_rows]:
+        y_true = (rng.random(rows) < 0.145).astype(np.int8)
+        y_pred = (rng.random(rows) < 0.05).astype(np.int8)
+        groups = rng.integers(0, 5, rows, dtype=np.int8)
+
+        start = time.perf_counter()
+        metrics = calculate_metrics(y_true, y_pred)
+        vectorized = time.perf_counter() - start
+
+        start = time.perf_counter()
+        grouped = grouped_confusion_counts(y_true, y_pred, groups, 5)
+        grouped_seconds = time.perf_counter() - start
+        assert grouped.sum() == rows
+
+        legacy_str, speedup_str = "-", "-"
+        if rows <= LEGACY_MAX_ROWS:
+            start = time.perf_counter()
+            legacy = legacy_calculate_metrics(y_true, y_pred)
+            legacy_seconds = time.perf_counter() - start
+            assert all(legacy[key] == metrics[key] for key in legacy), "Counts differ"
+            legacy_str = f"{legacy_seconds:.3f}"
+            speedup_str = f"{legacy_seconds / vectorized:,.0f}x"
+
+        print(f"{rows:<14,} {legacy_str:<12} {vectorized:<16.4f} {grouped_seconds:<13.4f} "
+              f"{rows / vectorized:<15,.0f} {speedup_str:<10}")
+
+    print()
+
+
+if __name__ == '__main__':
+    main()
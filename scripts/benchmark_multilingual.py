@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Per-locale matchers on mixed-language chat.
+
+This script:
+1. Measures startup (seconds and traced memory) of the lazily loading
+   MultilingualFilter, what compiling every locale's matcher would add,
+   and one combined matcher over all lists
+2. Builds a mixed-language corpus: GameTox messages plus synthetic chat in
+   every other locale (clean lines and lines with one of that locale's
+   words), shuffled together
+3. Times check_many and flag_series on that corpus for the English-only
+   filter, the routed MultilingualFilter and the combined matcher, and
+   reports recall on the synthetic toxic lines and false positives the
+   combined list makes on clean foreign lines ("con" is "with" in Spanish)
+4. Shows which matchers get loaded as more languages show up
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.columnar import read_table, resolve_dataset
+from profanity_filter.multilingual import DEFAULT_LOCALES_DIR, MultilingualFilter
+
+# Clean chat vocabulary per locale for the synthetic lines
+VOCABULARY = {
+    'es': 'vamos equipo jugar que por favor eres muy bueno con el mid ahora nada gracias '
+          'hola todos siempre esto tengo juego rapido',
+    'de': 'ich du bist nicht gut spiel spielen danke hallo mal doch jetzt warum mit dem team '
+          'schnell noch schon sehr',
+    'fr': 'je tu est pas les des une mais pour avec qui quoi tout merci bonjour salut '
+          'jouer vous nous vite',
+    'pt': 'voce nao muito obrigado jogo jogar isso aqui uma mas vai pra cara mano time '
+          'rapido para com',
+    'ru': 'давай играть команда привет спасибо быстро нет да мид хорошо играй помоги '
+          'почему опять',
+}
+
+
+def synthetic_lines(locale, words, count, toxic_share, rng):
+    """(message, label) pairs: short chat lines, some with one listed word."""
+    vocabulary = VOCABULARY.get(locale, 'gg').split()
+    lines = []
+    for _ in range(count):
+        tokens = rng.sample(vocabulary, rng.randint(2, 6))
+        label = rng.random() < toxic_share
+        if label:
+            tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(words))
+        lines.append((' '.join(tokens), int(label)))
+    return lines
+
+
+def traced(build):
+    """Seconds and peak traced MB of build()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak / 1e6
+
+
+def best_seconds(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark per-locale matchers")
+    parser.add_argument('--input', default=None,
+                        help="GameTox CSV or Parquet (default: data/gametox.parquet if "
+                             "converted, else data/gametox.csv, else the 50-message sample)")
+    parser.add_argument('--locales', default=str(DEFAULT_LOCALES_DIR),
+                        help=f"Per-locale word lists (default: {DEFAULT_LOCALES_DIR})")
+    parser.add_argument('--rows', type=int, default=100_000,
+                        help="GameTox rows in the corpus (default: 100,000)")
+    parser.add_argument('--foreign-share', type=float, default=0.3,
+                        help="Share of the corpus in other languages (default: 0.3)")
+    parser.add_argument('--toxic-share', type=float, default=0.2,
+                        help="Share of synthetic lines with a listed word (default: 0.2)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(42)
+    source = Path(args.input or resolve_dataset('data/gametox.csv'))
+    if not source.exists():
+        source = Path('data/gametox_sample_50.csv')
+
+    print("=" * 78)
+    print("MULTILINGUAL MATCHER BENCHMARK")
+    print("=" * 78)
+
+    # 1. Startup
+    lazy, lazy_seconds, lazy_mb = traced(lambda: MultilingualFilter.from_directory(args.locales))
+    locales = lazy.locales
+
+    eager = MultilingualFilter.from_directory(args.locales)
+
+    def build_eager():
+        return [eager.filter_for(locale) for locale in eager.locales]
+
+    def build_combined():
+        word_filter = ProfanityFilter(lazy.words)
+        word_filter.matcher
+        return word_filter
+
+    _, eager_seconds, eager_mb = traced(build_eager)
+    combined, combined_seconds, combined_mb = traced(build_combined)
+    print(f"Locales: {', '.join(locales)} ({len(lazy.words)} words in total)")
+    print()
+    print(f"{'Startup':<34} {'Seconds':<10} {'Traced MB':<10}")
+    print("-" * 78)
+    print(f"{'lazy (directory listing)':<34} {lazy_seconds:<10.4f} {lazy_mb:<10.3f}")
+    print(f"{'+ every locale compiled':<34} {eager_seconds:<10.4f} {eager_mb:<10.3f}")
+    print(f"{'combined (one matcher, all lists)':<34} {combined_seconds:<10.4f} "
+          f"{combined_mb:<10.3f}")
+    print()
+
+    # 2. Mixed-language corpus
+    english = read_table(source, ['message', 'label']).head(args.rows).dropna()
+    foreign_locales = [locale for locale in locales if locale not in lazy.default_locales]
+    per_locale = int(len(english) * args.foreign_share / (1 - args.foreign_share)
+                     / max(len(foreign_locales), 1))
+    synthetic = {locale: synthetic_lines(locale, lazy.words_for(locale), per_locale,
+                                         args.toxic_share, rng)
+                 for locale in foreign_locales}
+    rows = [(message, label, 'en') for message, label in
+            zip(english['message'].astype(str), english['label'])]
+    rows += [(message, label, locale) for locale, lines in synthetic.items()
+             for message, label in lines]
+    rng.shuffle(rows)
+    corpus = pd.DataFrame(rows, columns=['message', 'label', 'locale'])
+    messages = corpus['message'].tolist()
+    column = corpus['message'].astype('str')
+    print(f"Corpus: {len(corpus):,} messages, {len(english):,} from {source} and "
+          f"{per_locale:,} synthetic per locale ({', '.join(foreign_locales)})")
+    print()
+
+    # 3. Throughput and quality
+    english_only = ProfanityFilter.from_file(lazy.locale_files['en'])
+    routed = MultilingualFilter.from_directory(args.locales)
+    filters = [('english only', english_only), ('routed per locale', routed),
+               ('combined list', combined)]
+    foreign = corpus['locale'] != 'en'
+    print(f"{'Filter':<20} {'check_many msg/s':<18} {'flag_series msg/s':<19} "
+          f"{'Foreign recall':<15} {'Foreign FP':<10}")
+    print("-" * 78)
+    for name, word_filter in filters:
+        check_seconds = best_seconds(lambda: word_filter.check_many(messages))
+        series_seconds = best_seconds(lambda: word_filter.flag_series(column))
+        flagged = word_filter.flag_series(column).to_numpy()
+        toxic = (corpus['label'] == 1).to_numpy() & foreign.to_numpy()
+        clean = (corpus['label'] == 0).to_numpy() & foreign.to_numpy()
+        recall = flagged[toxic].mean() if toxic.any() else float('nan')
+        print(f"{name:<20} {len(messages) / check_seconds:<18,.0f} "
+              f"{len(messages) / series_seconds:<19,.0f} {recall:<15.1%} "
+              f"{int(flagged[clean].sum()):<10,}")
+    print()
+    print("Per-locale recall of the routed filter (synthetic toxic lines):")
+    flagged = routed.flag_series(column).to_numpy()
+    for locale in foreign_locales:
+        toxic = ((corpus['locale'] == locale) & (corpus['label'] == 1)).to_numpy()
+        if toxic.any():
+            print(f"  {locale}: {flagged[toxic].mean():.1%} of {int(toxic.sum()):,}")
+    print()
+
+    # 4. Lazy loading as languages show up
+    print("Matchers loaded as languages show up:")
+    word_filter = MultilingualFilter.from_directory(args.locales)
+    seen = ['en']
+    stages = [('English only', corpus[corpus['locale'] == 'en'])]
+    for locale in foreign_locales:
+        seen.append(locale)
+        stages.append((f"+ {locale}", corpus[corpus['locale'].isin(seen)]))
+    for name, stage in stages:
+        word_filter.flag_series(stage['message'].astype('str'))
+        print(f"  {name:<14} loaded: {', '.join(word_filter.loaded_locales)}")
+
+
+if __name__ == '__main__':
+    main()
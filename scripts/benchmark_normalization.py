@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Measure what leetspeak/obfuscation normalization buys and what it costs.
+
+This script:
+1. Scores the plain and normalizing filters on GameTox (data/gametox.csv,
+   falling back to the 50-message sample) and prints recall/precision/F1
+   side by side
+2. Builds an "evasion" copy of the messages the plain filter catches, with
+   obfuscations applied (sh1t, f.u.c.k, a$$, fuuuck, Cyrillic lookalikes),
+   and reports how many each filter still catches
+3. Times both filters per message (normalize + search vs lower + search)
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.metrics import calculate_metrics
+from profanity_filter.normalize import normalize_text
+
+LEET_OUT = {'i': '1', 'e': '3', 'a': '@', 's': '$', 'o': '0', 't': '7'}
+CYRILLIC_OUT = {'a': 'а', 'e': 'е', 'o': 'о', 'c': 'с', 'p': 'р', 'x': 'х'}
+
+
+def obfuscate(word, rng):
+    """Apply one random evasion to a word."""
+    style = rng.choice(['leet', 'dots', 'spaces', 'repeat', 'cyrillic'])
+    if style == 'leet':
+        return ''.join(LEET_OUT.get(c, c) for c in word)
+    if style == 'dots':
+        return '.'.join(word)
+    if style == 'spaces':
+        return ' '.join(word)
+    if style == 'repeat':
+        index = rng.randrange(len(word))
+        return word[:index] + word[index] * rng.randint(3, 6) + word[index + 1:]
+    return ''.join(CYRILLIC_OUT.get(c, c) for c in word)
+
+
+def evasion_corpus(messages, word_filter, rng):
+    """Replace every matched word in caught messages with an obfuscated form."""
+    evasions = []
+    for message in messages:
+        matches = word_filter.explain(message)
+        if not matches:
+            continue
+        lowered = message.lower()
+        for match in reversed(matches):
+            lowered = lowered[:match['start']] + obfuscate(match['word'], rng) + lowered[match['end']:]
+        evasions.append(lowered)
+    return evasions
+
+
+def per_message_us(func, messages, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for message in messages:
+            func(message)
+        best = min(best, time.perf_counter() - start)
+    return best / len(messages) * 1e6
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark normalization recall and cost")
+    parser.add_argument('--input', default='data/gametox.csv',
+                        help="GameTox CSV (default: data/gametox.csv, else the 50-message sample)")
+    parser.add_argument('--rows', type=int, default=200_000,
+                        help="Maximum rows to score (default: 200,000)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(42)
+    source = Path(args.input)
+    if not source.exists():
+        source = Path('data/gametox_sample_50.csv')
+    df = pd.read_csv(source, usecols=['message', 'label'], nrows=args.rows).dropna(subset=['label'])
+    messages = df['message'].fillna('').astype(str).tolist()
+
+    plain = ProfanityFilter.from_file('data/profanity_words.txt')
+    normalizing = ProfanityFilter.from_file('data/profanity_words.txt', normalize=True)
+
+    print("=" * 70)
+    print("NORMALIZATION BENCHMARK")
+    print("=" * 70)
+    print(f"Corpus: {source} ({len(messages):,} labelled messages)")
+    print()
+
+    print(f"{'Filter':<14} {'Flagged':<10} {'Accuracy':<10} {'Precision':<10} {'Recall':<10} {'F1':<8}")
+    print("-" * 70)
+    for name, word_filter in [('plain', plain), ('normalized', normalizing)]:
+        predictions = word_filter.check_many(messages)
+        metrics = calculate_metrics(df['label'], predictions)
+        print(f"{name:<14} {sum(predictions):<10,} {metrics['accuracy']:<10.3f} "
+              f"{metrics['precision']:<10.3f} {metrics['recall']:<10.3f} {metrics['f1']:<8.3f}")
+    print()
+
+    evasions = evasion_corpus(messages, plain, rng)
+    print(f"Evasion set: {len(evasions):,} caught messages with their matches obfuscated")
+    for name, word_filter in [('plain', plain), ('normalized', normalizing)]:
+        caught = sum(word_filter.check_many(evasions))
+        rate = caught / len(evasions) if evasions else 0
+        print(f"  {name:<12} still catches {caught:,} ({rate:.1%})")
+    for example in evasions[:5]:
+        print(f"  {example!r:<45} -> {normalize_text(example)!r}")
+    print()
+
+    timed = messages * max(1, 20_000 // max(1, len(messages)))
+    plain_us = per_message_us(plain.check, timed)
+    normalizing_us = per_message_us(normalizing.check, timed)
+    normalize_us = per_message_us(normalize_text, timed)
+    print("Per-message cost:")
+    print(f"  plain check:       {plain_us:.2f} us")
+    print(f"  normalized check:  {normalizing_us:.2f} us (+{normalizing_us - plain_us:.2f} us)")
+    print(f"  normalize_text:    {normalize_us:.2f} us")
+
+
+if __name__ == '__main__':
+    main()
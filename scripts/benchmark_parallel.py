@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark multi-core Level 1 batch flagging.
+
+Builds a synthetic corpus by repeating the GameTox sample, scans it with
+1, 2, 4 and 8 worker processes, checks that every run produces the same
+confusion matrix and flagged-row output, and reports the speedup.
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.streaming import scan_csv
+
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark --workers N speedup")
+    parser.add_argument('--rows', type=int, default=1_000_000,
+                        help="Rows in the synthetic corpus (default: 1,000,000)")
+    parser.add_argument('--chunksize', type=int, default=50_000,
+                        help="Rows per chunk (default: 50,000)")
+    return parser.parse_args()
+
+
+def build_corpus(sample_file, rows, output_path):
+    """Repeat the sample messages until the corpus has the requested rows."""
+    sample = pd.read_csv(sample_file)
+    repeats = rows // len(sample) + 1
+    corpus = pd.concat([sample] * repeats, ignore_index=True).head(rows)
+    corpus.to_csv(output_path, index=False)
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+def main():
+    args = parse_args()
+    word_filter = ProfanityFilter.from_file('data/profanity_words.txt')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_file = Path(tmp) / 'corpus.csv'
+        output_file = Path(tmp) / 'flagged.csv'
+        build_corpus(Path('data/gametox_sample_50.csv'), args.rows, corpus_file)
+
+        print("=" * 70)
+        print("PARALLEL FLAGGING BENCHMARK")
+        print("=" * 70)
+        print(f"Rows: {args.rows:,}   Chunk size: {args.chunksize:,}   CPUs available: {os.cpu_count()}")
+        print()
+        print(f"{'Workers':<10} {'Seconds':<10} {'Rows/s':<15} {'Speedup':<10} {'TP/FP/TN/FN':<25}")
+        print("-" * 70)
+
+        baseline_seconds = None
+        baseline_output = None
+        for workers in WORKER_COUNTS:
+            start = time.perf_counter()
+            result = scan_csv(corpus_file, word_filter, 'message', 'label',
+                              output_file=output_file, chunksize=args.chunksize,
+                              workers=workers)
+            seconds = time.perf_counter() - start
+
+            counts = (result['tp'], result['fp'], result['tn'], result['fn'])
+            output = (counts, file_digest(output_file))
+            if baseline_output is None:
+                baseline_seconds, baseline_output = seconds, output
+            assert output == baseline_output, f"Result differs with {workers} workers"
+
+            speedup = f"{baseline_seconds / seconds:.2f}x"
+            counts_str = '/'.join(str(c) for c in counts)
+            print(f"{workers:<10} {seconds:<10.2f} {args.rows / seconds:<15,.0f} {speedup:<10} {counts_str:<25}")
+
+    print()
+    print("✓ Identical confusion matrix and flagged rows for every worker count")
+
+
+if __name__ == '__main__':
+    main()
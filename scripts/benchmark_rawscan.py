@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Compare memory-mapped raw log scanning with the pandas scan paths.
+
+Runs the Level 1 word list over the same GameTox rows as:
+1. scan_csv on the CSV (whole file, then chunked)
+2. scan_csv on the Parquet copy (if pyarrow is installed)
+3. scan_raw on the "label<TAB>message" log, with each available engine
+
+and reports seconds, MB/s of the input file and rows/s, and checks that
+every path produces the same confusion counts. Missing Parquet/log copies
+are written first.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.columnar import convert_csv, has_pyarrow, parquet_path
+from profanity_filter.rawscan import export_log, scan_raw
+from profanity_filter.streaming import scan_csv
+
+
+def best_of(func, runs=3):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark raw log scanning")
+    parser.add_argument('--input', default='data/gametox.csv',
+                        help="Labelled CSV (default: data/gametox.csv)")
+    parser.add_argument('--runs', type=int, default=3,
+                        help="Runs per path, best kept (default: 3)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    csv_file = Path(args.input)
+    log_file = csv_file.with_suffix('.log')
+    if not log_file.exists():
+        print(f"Exporting {csv_file} -> {log_file}...")
+        export_log(csv_file, log_file)
+    word_filter = ProfanityFilter.from_file('data/profanity_words.txt')
+
+    paths = [
+        ('csv (whole file)', csv_file,
+         lambda: scan_csv(csv_file, word_filter, 'message', 'label', chunksize=None)),
+        ('csv (100k chunks)', csv_file,
+         lambda: scan_csv(csv_file, word_filter, 'message', 'label')),
+    ]
+    if has_pyarrow():
+        parquet_file = parquet_path(csv_file)
+        if not parquet_file.exists():
+            print(f"Converting {csv_file} -> {parquet_file}...")
+            convert_csv(csv_file)
+        paths.append(('parquet (whole file)', parquet_file,
+                      lambda: scan_csv(parquet_file, word_filter, 'message', 'label',
+                                       chunksize=None)))
+    for engine in (('arrow', 're') if has_pyarrow() else ('re',)):
+        paths.append((f'raw mmap ({engine})', log_file,
+                      lambda engine=engine: scan_raw(log_file, word_filter, engine=engine)))
+
+    print("=" * 80)
+    print("RAW LOG SCAN BENCHMARK")
+    print("=" * 80)
+    print(f"{'Path':<22} {'Input (MB)':<11} {'Seconds':<9} {'MB/s':<9} {'Rows/s':<12} "
+          f"{'Decoded':<10} {'Same':<5}")
+    print("-" * 80)
+    reference = None
+    for name, path, run in paths:
+        seconds, result = best_of(run, args.runs)
+        counts = tuple(result[key] for key in ('tp', 'fp', 'tn', 'fn'))
+        reference = reference or counts
+        size = path.stat().st_size / 1e6
+        decoded = f"{result['candidates']:,}" if 'candidates' in result else 'all rows'
+        print(f"{name:<22} {size:<11.1f} {seconds:<9.3f} {size / seconds:<9.1f} "
+              f"{result['total'] / seconds:<12,.0f} {decoded:<10} "
+              f"{'yes' if counts == reference else 'NO':<5}")
+    print()
+    print("Decoded = lines the raw matcher handed to check(); the pandas paths parse every row.")
+
+
+if __name__ == '__main__':
+    main()
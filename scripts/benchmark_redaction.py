@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Redaction latency against the boolean check.
+
+This script:
+1. Times check(), spans() and redact() per message on GameTox, separately
+   for clean and flagged messages, plain and normalized
+2. Times the column versions: flag_series() vs redact_series() vs mapping
+   redact() over every row
+3. Times masking a message with many hits: one join over slices
+   (Redactor) vs rebuilding the string once per match
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.columnar import read_table, resolve_dataset
+from profanity_filter.redact import Redactor, mask_word
+
+HIT_COUNTS = [10, 100, 1_000, 10_000]
+
+
+def per_message_us(func, messages, repeat=3):
+    if not messages:
+        return float('nan')
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for message in messages:
+            func(message)
+        best = min(best, time.perf_counter() - start)
+    return best / len(messages) * 1e6
+
+
+def best_seconds(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def rebuild_per_match(word_filter, text):
+    """Naive masking: a new string for every match (quadratic in hits)."""
+    for match in reversed(word_filter.explain(text)):
+        text = text[:match['start']] + mask_word(text[match['start']:match['end']]) + \
+            text[match['end']:]
+    return text
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark redaction vs boolean check")
+    parser.add_argument('--input', default=None,
+                        help="GameTox CSV or Parquet (default: data/gametox.parquet if "
+                             "converted, else data/gametox.csv, else the 50-message sample)")
+    parser.add_argument('--rows', type=int, default=200_000,
+                        help="Maximum rows to time (default: 200,000)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    source = Path(args.input or resolve_dataset('data/gametox.csv'))
+    if not source.exists():
+        source = Path('data/gametox_sample_50.csv')
+    series = read_table(source, ['message'])['message'].head(args.rows)
+    messages = series.dropna().astype(str).tolist()
+
+    print("=" * 78)
+    print("REDACTION BENCHMARK")
+    print("=" * 78)
+    print(f"Corpus: {source} ({len(messages):,} messages)")
+    print()
+
+    print("Per message (microseconds):")
+    print(f"{'Filter':<12} {'Messages':<10} {'Count':<9} {'check':<9} {'spans':<9} "
+          f"{'redact':<9} {'redact/check':<12}")
+    print("-" * 78)
+    for name, normalize in [('plain', False), ('normalized', True)]:
+        word_filter = ProfanityFilter.from_file('data/profanity_words.txt', normalize=normalize)
+        redactor = Redactor(word_filter)
+        flags = word_filter.check_many(messages)
+        groups = [('clean', [m for m, flag in zip(messages, flags) if not flag]),
+                  ('flagged', [m for m, flag in zip(messages, flags) if flag])]
+        for group, group_messages in groups:
+            check = per_message_us(word_filter.check, group_messages)
+            spans = per_message_us(redactor.spans, group_messages)
+            redact = per_message_us(redactor.redact, group_messages)
+            print(f"{name:<12} {group:<10} {len(group_messages):<9,} {check:<9.2f} "
+                  f"{spans:<9.2f} {redact:<9.2f} {redact / check:.2f}x")
+    print()
+
+    print("Whole column (seconds):")
+    word_filter = ProfanityFilter.from_file('data/profanity_words.txt')
+    redactor = Redactor(word_filter)
+    column = pd.Series(messages, dtype='str')
+    flag_seconds = best_seconds(lambda: word_filter.flag_series(column))
+    series_seconds = best_seconds(lambda: redactor.redact_series(column))
+    map_seconds = best_seconds(lambda: column.map(redactor.redact))
+    print(f"  flag_series (boolean)       {flag_seconds:.3f}s")
+    print(f"  redact_series               {series_seconds:.3f}s "
+          f"({series_seconds / flag_seconds:.2f}x the boolean column)")
+    print(f"  map(redact) over every row  {map_seconds:.3f}s")
+    same = redactor.redact_series(column).equals(column.map(redactor.redact))
+    print(f"  Same output: {'yes' if same else 'NO'}")
+    print()
+
+    print("Masking a message with many hits (milliseconds):")
+    print(f"{'Hits':<10} {'Length':<10} {'one join':<12} {'rebuild per match':<18}")
+    print("-" * 78)
+    for hits in HIT_COUNTS:
+        text = ' '.join(['you idiot'] * hits)
+        joined = best_seconds(lambda: redactor.redact(text)) * 1e3
+        rebuilt = best_seconds(lambda: rebuild_per_match(word_filter, text)) * 1e3
+        assert redactor.redact(text) == rebuild_per_match(word_filter, text)
+        print(f"{hits:<10,} {len(text):<10,} {joined:<12.2f} {rebuilt:<18.2f}")
+
+
+if __name__ == '__main__':
+    main()
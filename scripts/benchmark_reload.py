@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark hot-reloading the word list at growing list sizes.
+
+For each size (1k -> 100k terms) the script:
+1. Rewrites a temporary word-list file with that many terms
+2. Lets the ReloadingFilter watcher notice it and rebuild in the background
+   while a reader thread keeps calling check() on chat messages
+3. Reports the rebuild time, the reader's check latency during the rebuild
+   (p50/p99/max - it must not stall) and that the new list is live
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from profanity_filter import load_profanity_words
+from profanity_filter.metrics import percentile
+from profanity_filter.reload import ReloadingFilter
+
+LIST_SIZES = [1_000, 10_000, 50_000, 100_000]
+
+
+def synthetic_words(base_words, size, rng):
+    """Pad the real word list with random lowercase words up to size."""
+    words = list(base_words)[:size]
+    seen = set(words)
+    while len(words) < size:
+        word = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark word-list hot reload")
+    parser.add_argument('--sizes', type=int, nargs='+', default=LIST_SIZES,
+                        help="Word-list sizes (default: 1000 10000 50000 100000)")
+    parser.add_argument('--poll-interval', type=float, default=0.05,
+                        help="Watcher poll interval in seconds (default: 0.05)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(42)
+    base_words = load_profanity_words('data/profanity_words.txt')
+    messages = pd.read_csv('data/gametox_sample_50.csv')['message'].dropna().astype(str).tolist()
+
+    print("=" * 90)
+    print("WORD-LIST HOT RELOAD BENCHMARK")
+    print("=" * 90)
+    print(f"{'Words':<10} {'Rebuild (s)':<13} {'Swap seen (s)':<15} {'Checks':<10} "
+          f"{'p50 (us)':<10} {'p99 (us)':<10} {'Max (ms)':<10}")
+    print("-" * 90)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        words_file = Path(tmp) / 'words.txt'
+        words_file.write_text('\n'.join(base_words) + '\n')
+
+        with ReloadingFilter(words_file, poll_interval=args.poll_interval) as word_filter:
+            for size in args.sizes:
+                words = synthetic_words(base_words, size, rng)
+                marker = f"zzreload{size}"
+                words.append(marker)
+
+                latencies = []
+                stop = threading.Event()
+
+                def reader():
+                    index = 0
+                    while not stop.is_set():
+                        start = time.perf_counter()
+                        word_filter.check(messages[index % len(messages)])
+                        latencies.append(time.perf_counter() - start)
+                        index += 1
+
+                thread = threading.Thread(target=reader)
+                thread.start()
+
+                reloads = word_filter.stats['reloads']
+                start = time.perf_counter()
+                # Write to a temp name and rename, as an editor or deploy would
+                staging = words_file.with_suffix('.tmp')
+                staging.write_text('\n'.join(words) + '\n')
+                staging.replace(words_file)
+                while word_filter.stats['reloads'] == reloads:
+                    time.sleep(0.005)
+                swap_seconds = time.perf_counter() - start
+
+                stop.set()
+                thread.join()
+                assert word_filter.check(f"you {marker}"), "New word list is not live"
+
+                print(f"{size:<10,} {word_filter.stats['last_rebuild_seconds']:<13.3f} "
+                      f"{swap_seconds:<15.3f} {len(latencies):<10,} "
+                      f"{percentile(latencies, 50) * 1e6:<10.1f} "
+                      f"{percentile(latencies, 99) * 1e6:<10.1f} {max(latencies) * 1e3:<10.2f}")
+
+    print()
+    print("Swap seen includes the watcher's poll interval and the settle check.")
+
+
+if __name__ == '__main__':
+    main()
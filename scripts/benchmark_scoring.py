@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Bulk-scoring benchmark: binary flag_series vs SeverityScorer.score_series.
+
+Both run over the same column (the GameTox messages repeated up to --rows)
+with the same scored word list, and the script checks that score > 0 flags
+exactly the rows flag_series flags. It also times the per-message scalar
+score() loop, which is what score_series replaces.
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from profanity_filter.scoring import DEFAULT_SCORES_FILE, SeverityScorer
+
+ROWS = 200_000
+
+
+def best_of(func, runs=3):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark severity scoring")
+    parser.add_argument('--input', default='data/gametox.csv',
+                        help="CSV with a 'message' column (default: data/gametox.csv)")
+    parser.add_argument('--scores', default=str(DEFAULT_SCORES_FILE),
+                        help="Scored word list (default: data/profanity_scores.csv)")
+    parser.add_argument('--rows', type=int, default=ROWS,
+                        help=f"Rows to score (default: {ROWS:,})")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    messages = pd.read_csv(args.input)['message']
+    repeats = -(-args.rows // len(messages))
+    series = pd.concat([messages] * repeats, ignore_index=True).iloc[:args.rows]
+
+    scorer = SeverityScorer.from_file(args.scores)
+    flag_seconds, flagged = best_of(lambda: scorer.word_filter.flag_series(series))
+    score_seconds, scores = best_of(lambda: scorer.score_series(series))
+    assert (scores['score'] > 0).equals(flagged), "score_series disagrees with flag_series"
+
+    sample = series.iloc[:20_000]
+    scalar_seconds, _ = best_of(lambda: [scorer.score(text) for text in sample], runs=1)
+    scalar_seconds *= len(series) / len(sample)
+
+    print("=" * 70)
+    print("SEVERITY SCORING BENCHMARK")
+    print("=" * 70)
+    print(f"Rows: {len(series):,}  Scored terms: {len(scorer.terms)}  "
+          f"Flagged: {int(flagged.sum()):,}")
+    print()
+    print(f"{'Method':<28} {'Seconds':<10} {'Rows/s':<12} {'vs flag_series':<14}")
+    print("-" * 70)
+    for name, seconds in [('flag_series (binary)', flag_seconds),
+                          ('score_series (vectorized)', score_seconds),
+                          ('score() per row (est.)', scalar_seconds)]:
+        print(f"{name:<28} {seconds:<10.3f} {len(series) / seconds:<12,.0f} "
+              f"{seconds / flag_seconds:.2f}x")
+    print()
+    print("Tier counts:")
+    for tier_name, count in scores['tier'].value_counts().items():
+        print(f"  {tier_name:<8} {count:,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Load-test the filter service on localhost.
+
+Starts scripts/filter_service.py in a separate process (or targets --url),
+then drives it with keep-alive connections from an asyncio client and
+reports requests/second, texts/second and p50/p99 latency for:
+- POST /check at several concurrency levels (exercises micro-batching)
+- POST /check_batch with --batch-size texts per request
+
+Messages are drawn from the GameTox sample.
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from urllib.parse import urlparse
+
+import pandas as pd
+
+from profanity_filter.metrics import percentile
+
+CONCURRENCY_LEVELS = [1, 16, 64]
+
+
+async def open_client(host, port):
+    return await asyncio.open_connection(host, port)
+
+
+async def post(reader, writer, host, path, payload):
+    """Send one keep-alive POST and return the decoded JSON response."""
+    body = json.dumps(payload).encode('utf-8')
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+                 f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                 .encode('latin-1') + body)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    data = await reader.readexactly(length)
+    if b' 200 ' not in status_line:
+        raise RuntimeError(f"{status_line.decode().strip()}: {data.decode()}")
+    return json.loads(data)
+
+
+async def run_load(host, port, path, payloads, concurrency):
+    """Send every payload over `concurrency` connections; returns (seconds, latencies)."""
+    latencies = []
+    queue = list(reversed(payloads))
+
+    async def worker():
+        reader, writer = await open_client(host, port)
+        try:
+            while queue:
+                payload = queue.pop()
+                start = time.perf_counter()
+                await post(reader, writer, host, path, payload)
+                latencies.append(time.perf_counter() - start)
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+async def wait_until_up(host, port, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            reader, writer = await open_client(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load-test the filter service")
+    parser.add_argument('--url', default=None,
+                        help="Running service, e.g. http://127.0.0.1:8088 (default: start one)")
+    parser.add_argument('--port', type=int, default=8089,
+                        help="Port for the service started by this script (default: 8089)")
+    parser.add_argument('--requests', type=int, default=5000,
+                        help="Requests per /check scenario (default: 5000)")
+    parser.add_argument('--batch-size', type=int, default=100,
+                        help="Texts per /check_batch request (default: 100)")
+    parser.add_argument('--max-batch', type=int, default=64,
+                        help="Service micro-batch limit when started here (default: 64)")
+    return parser.parse_args()
+
+
+async def benchmark(host, port, messages, args):
+    await wait_until_up(host, port)
+    rows = []
+    for concurrency in CONCURRENCY_LEVELS:
+        payloads = [{'text': messages[i % len(messages)]} for i in range(args.requests)]
+        seconds, latencies = await run_load(host, port, '/check', payloads, concurrency)
+        rows.append(('/check', concurrency, len(payloads), len(payloads), seconds, latencies))
+
+    batches = max(1, args.requests // args.batch_size)
+    payloads = [{'texts': [messages[(b * args.batch_size + i) % len(messages)]
+                           for i in range(args.batch_size)]} for b in range(batches)]
+    seconds, latencies = await run_load(host, port, '/check_batch', payloads, 4)
+    rows.append((f"/check_batch x{args.batch_size}", 4, batches, batches * args.batch_size,
+                 seconds, latencies))
+
+    reader, writer = await open_client(host, port)
+    writer.write(f"GET /stats HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+    stats = (await reader.read()).split(b'\r\n\r\n', 1)[1]
+    writer.close()
+    return rows, json.loads(stats)
+
+
+def main():
+    args = parse_args()
+    messages = pd.read_csv('data/gametox_sample_50.csv')['message'].dropna().astype(str).tolist()
+
+    process = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port
+    else:
+        host, port = '127.0.0.1', args.port
+        process = subprocess.Popen(
+            [sys.executable, 'scripts/filter_service.py', '--port', str(port),
+             '--max-batch', str(args.max_batch)],
+            stdout=subprocess.DEVNULL,
+        )
+
+    try:
+        rows, stats = asyncio.run(benchmark(host, port, messages, args))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print("=" * 90)
+    print("FILTER SERVICE LOAD TEST")
+    print("=" * 90)
+    print(f"Service: http://{host}:{port}")
+    print()
+    print(f"{'Endpoint':<20} {'Conns':<7} {'Requests':<10} {'Req/s':<10} {'Texts/s':<10} "
+          f"{'p50 (ms)':<10} {'p99 (ms)':<10}")
+    print("-" * 90)
+    for endpoint, concurrency, requests, texts, seconds, latencies in rows:
+        print(f"{endpoint:<20} {concurrency:<7} {requests:<10,} {requests / seconds:<10,.0f} "
+              f"{texts / seconds:<10,.0f} {percentile(latencies, 50) * 1e3:<10.2f} "
+              f"{percentile(latencies, 99) * 1e3:<10.2f}")
+    print()
+    batching = stats['batching']
+    mean = batching['items'] / batching['batches'] if batching['batches'] else 0
+    print(f"Micro-batching: {batching['batches']:,} batches, mean size {mean:.1f}, "
+          f"largest {batching['largest']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: text word list vs compiled binary dictionary.
+
+For each list size the script writes a synthetic word list, compiles it
+with profanity_filter.compiled, and then starts fresh Python processes that
+load each format and answer their first check():
+- text:   ProfanityFilter.from_file(...) -> builds the trie regex and compiles it
+- binary: CompiledFilter(...)            -> mmaps the file, nothing to build
+
+It also reports steady-state microseconds per message for both, so the
+startup win can be weighed against per-message cost.
+"""
+
+import argparse
+import json
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from profanity_filter import ProfanityFilter, load_profanity_words
+from profanity_filter.compiled import CompiledFilter, compile_dictionary
+
+LIST_SIZES = [10, 1_000, 10_000, 100_000]
+RUNS = 3
+
+LOADERS = {
+    'text': ("from profanity_filter import ProfanityFilter\n"
+             "word_filter = ProfanityFilter.from_file(path)\n"),
+    'binary': ("from profanity_filter.compiled import CompiledFilter\n"
+               "word_filter = CompiledFilter(path)\n"),
+}
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+path = sys.argv[1]
+{loader}word_filter.check("warm up the matcher")
+print(json.dumps(time.perf_counter() - start))
+"""
+
+
+def synthetic_words(base_words, size, rng):
+    """Pad the real word list with random lowercase words up to size."""
+    words = list(base_words)[:size]
+    seen = set(words)
+    while len(words) < size:
+        word = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def cold_start(kind, path):
+    """Best-of-RUNS seconds to load `path` and answer one check in a new process."""
+    script = CHILD.format(loader=LOADERS[kind])
+    timings = []
+    for _ in range(RUNS):
+        output = subprocess.run([sys.executable, '-c', script, str(path)], check=True,
+                                capture_output=True, text=True,
+                                cwd=Path(__file__).resolve().parent).stdout
+        timings.append(json.loads(output))
+    return min(timings)
+
+
+def per_message_us(word_filter, messages):
+    start = time.perf_counter()
+    word_filter.check_many(messages)
+    return (time.perf_counter() - start) / len(messages) * 1e6
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark text vs binary dictionary startup")
+    parser.add_argument('--sizes', type=int, nargs='+', default=LIST_SIZES,
+                        help="Word-list sizes (default: 10 1000 10000 100000)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(42)
+    base_words = load_profanity_words('data/profanity_words.txt')
+    messages = pd.read_csv('data/gametox_sample_50.csv')['message'].dropna().astype(str).tolist()
+    messages = messages * 200
+
+    print("=" * 95)
+    print("COLD START: TEXT WORD LIST vs COMPILED DICTIONARY")
+    print("=" * 95)
+    print(f"{'Words':<10} {'Compile (s)':<13} {'Size (KB)':<11} {'Text start (s)':<16} "
+          f"{'Binary start (s)':<18} {'Speedup':<9} {'Text us/msg':<12} {'Binary us/msg':<13}")
+    print("-" * 95)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            words_file = Path(tmp) / f'words_{size}.txt'
+            dictionary_file = Path(tmp) / f'words_{size}.pfd'
+            words_file.write_text('\n'.join(synthetic_words(base_words, size, rng)) + '\n')
+
+            start = time.perf_counter()
+            compile_dictionary(words_file, dictionary_file)
+            compile_seconds = time.perf_counter() - start
+
+            text_seconds = cold_start('text', words_file.resolve())
+            binary_seconds = cold_start('binary', dictionary_file.resolve())
+
+            text_filter = ProfanityFilter.from_file(words_file)
+            binary_filter = CompiledFilter(dictionary_file)
+            assert text_filter.check_many(messages) == binary_filter.check_many(messages), \
+                f"Formats disagree at {size} words"
+
+            print(f"{size:<10,} {compile_seconds:<13.3f} "
+                  f"{dictionary_file.stat().st_size / 1024:<11,.1f} {text_seconds:<16.3f} "
+                  f"{binary_seconds:<18.4f} {text_seconds / binary_seconds:<9.0f} "
+                  f"{per_message_us(text_filter, messages):<12.2f} "
+                  f"{per_message_us(binary_filter, messages):<13.2f}")
+
+    print()
+    print("Start times cover loading the list and the first check, excluding interpreter startup.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Throughput / latency / memory benchmark suite for the Level 1 filters.
+
+This script:
+1. Builds a synthetic corpus (random chat words with ~15% profanity mixed in)
+   and a real corpus (data/gametox.csv, or the 50-message sample repeated
+   when the full dataset is not downloaded) at each requested size
+2. Runs every registered filter implementation on every corpus/size in a
+   fresh process, so peak RSS belongs to that run alone
+3. Records messages/second, p50/p99 per-message latency and peak RSS
+4. Writes machine-readable JSON (results/benchmarks/) and, with --compare,
+   flags throughput regressions against an earlier results file
+
+New matchers are benchmarked by adding a factory to IMPLEMENTATIONS.
+
+Usage:
+    python scripts/benchmark_suite.py
+    python scripts/benchmark_suite.py --sizes 1000 10000 --compare results/benchmarks/old.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+CORPORA = ['synthetic', 'real']
+# Vectorized implementations are timed per batch; latency is batch time / batch size
+BATCH_SIZE = 1_000
+WARMUP_MESSAGES = 100
+REGRESSION_THRESHOLD = 0.10
+RESULTS_DIR = Path('results/benchmarks')
+
+CHAT_WORDS = ("gg wp noob lol push mid top bot jungle gank report team carry "
+              "lag ult heal tank dps rush base win lose play game nice bad "
+              "the a you me we they is are was go get got need help pls now").split()
+
+
+# --- Implementations -------------------------------------------------------
+# Each factory takes the loaded ProfanityFilter and returns (kind, func):
+#   'message': func(text) -> 0/1, timed per call
+#   'batch':   func(list of texts) -> sequence of 0/1, timed per BATCH_SIZE batch
+
+def _regex_filter(word_filter):
+    from compare_approaches import regex_filter
+    return 'message', lambda text: regex_filter(text, word_filter)
+
+
+def _check_many(word_filter):
+    return 'batch', word_filter.check_many
+
+
+def _str_contains(word_filter):
+    import pandas as pd
+    return 'batch', lambda texts: word_filter.flag_series(pd.Series(texts, dtype=object))
+
+
+IMPLEMENTATIONS = {
+    'regex_filter': _regex_filter,
+    'check_many': _check_many,
+    'str_contains': _str_contains,
+}
+
+
+# --- Corpora ---------------------------------------------------------------
+
+def synthetic_corpus(words, size, seed=42):
+    """Random 3-15 word chat messages, ~15% containing a listed word."""
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(size):
+        tokens = [rng.choice(CHAT_WORDS) for _ in range(rng.randint(3, 15))]
+        if rng.random() < 0.15:
+            tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(words))
+        messages.append(' '.join(tokens))
+    return messages
+
+
+def real_corpus(size):
+    """The first `size` GameTox messages, repeating the sample if the full CSV is absent."""
+    import pandas as pd
+    source = Path('data/gametox.csv')
+    if not source.exists():
+        source = Path('data/gametox_sample_50.csv')
+    messages = pd.read_csv(source, usecols=['message'], nrows=size)['message']
+    messages = messages.fillna('').astype(str).tolist()
+    repeats = size // len(messages) + 1
+    return (messages * repeats)[:size], source.name
+
+
+def build_corpus(name, words, size):
+    if name == 'synthetic':
+        return synthetic_corpus(words, size), 'synthetic'
+    return real_corpus(size)
+
+
+# --- Runner ----------------------------------------------------------------
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(implementation, corpus, size, words_file):
+    """
+    Benchmark one implementation on one corpus size (runs in a fresh process).
+
+    Returns:
+        dict: throughput, latency percentiles, peak RSS and the flagged count
+    """
+    from profanity_filter import ProfanityFilter
+    from profanity_filter.metrics import percentile
+
+    word_filter = ProfanityFilter.from_file(words_file)
+    messages, source = build_corpus(corpus, word_filter.words, size)
+    kind, func = IMPLEMENTATIONS[implementation](word_filter)
+
+    # Compile the pattern and warm caches before timing
+    warmup = messages[:WARMUP_MESSAGES]
+    if kind == 'message':
+        for text in warmup:
+            func(text)
+    else:
+        func(warmup)
+    setup_rss = peak_rss_mb()
+
+    latencies = []
+    flagged = 0
+    start = time.perf_counter()
+    if kind == 'message':
+        for text in messages:
+            call_start = time.perf_counter()
+            flagged += func(text)
+            latencies.append(time.perf_counter() - call_start)
+    else:
+        for offset in range(0, len(messages), BATCH_SIZE):
+            batch = messages[offset:offset + BATCH_SIZE]
+            call_start = time.perf_counter()
+            flagged += int(sum(func(batch)))
+            latencies.append((time.perf_counter() - call_start) / len(batch))
+    seconds = time.perf_counter() - start
+
+    return {
+        'implementation': implementation,
+        'kind': kind,
+        'corpus': corpus,
+        'source': source,
+        'messages': len(messages),
+        'flagged': flagged,
+        'seconds': seconds,
+        'messages_per_second': len(messages) / seconds if seconds > 0 else float('inf'),
+        'p50_us': percentile(latencies, 50) * 1e6,
+        'p99_us': percentile(latencies, 99) * 1e6,
+        'setup_rss_mb': setup_rss,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def run_isolated(*case):
+    """Run one case in a fresh spawned process so ru_maxrss is not shared between cases."""
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(run_case, *case).result()
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def case_key(result):
+    return result['implementation'], result['corpus'], result['messages']
+
+
+def compare_results(results, baseline_file, threshold):
+    """
+    Compare throughput with a previous results file.
+
+    Returns:
+        list: (key, old msg/s, new msg/s, change) for cases slower by more than threshold
+    """
+    baseline = json.loads(Path(baseline_file).read_text())
+    previous = {case_key(r): r for r in baseline['results']}
+
+    print()
+    print(f"Comparison with {baseline_file} (commit {baseline['metadata'].get('commit')})")
+    print(f"{'Implementation':<16} {'Corpus':<10} {'Messages':<10} {'Old msg/s':<13} {'New msg/s':<13} {'Change':<8}")
+    print("-" * 75)
+
+    regressions = []
+    for result in results:
+        old = previous.get(case_key(result))
+        if old is None:
+            continue
+        change = result['messages_per_second'] / old['messages_per_second'] - 1
+        marker = '  REGRESSION' if change < -threshold else ''
+        print(f"{result['implementation']:<16} {result['corpus']:<10} {result['messages']:<10,} "
+              f"{old['messages_per_second']:<13,.0f} {result['messages_per_second']:<13,.0f} "
+              f"{change:+.1%}{marker}")
+        if change < -threshold:
+            regressions.append((case_key(result), old['messages_per_second'],
+                                result['messages_per_second'], change))
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark filter throughput, latency and memory")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Corpus sizes in messages (default: 1000 10000 100000)")
+    parser.add_argument('--implementations', nargs='+', default=list(IMPLEMENTATIONS),
+                        choices=list(IMPLEMENTATIONS), help="Implementations to run (default: all)")
+    parser.add_argument('--corpora', nargs='+', default=CORPORA, choices=CORPORA,
+                        help="Corpora to run (default: synthetic real)")
+    parser.add_argument('--words', default='data/profanity_words.txt',
+                        help="Word list (default: data/profanity_words.txt)")
+    parser.add_argument('--output', default=None,
+                        help="Results JSON (default: results/benchmarks/benchmark_<timestamp>.json)")
+    parser.add_argument('--compare', default=None,
+                        help="Earlier results JSON to check for throughput regressions")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help="Slowdown fraction counted as a regression (default: 0.10)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    started = datetime.now()
+    output_file = Path(args.output) if args.output else \
+        RESULTS_DIR / f"benchmark_{started:%Y%m%d_%H%M%S}.json"
+
+    print("=" * 100)
+    print("FILTER BENCHMARK SUITE")
+    print("=" * 100)
+    print(f"Sizes: {', '.join(f'{s:,}' for s in args.sizes)}   CPUs: {os.cpu_count()}   "
+          f"Python {platform.python_version()}")
+    print()
+    print(f"{'Implementation':<16} {'Corpus':<10} {'Messages':<10} {'Msg/s':<13} "
+          f"{'p50 (us)':<10} {'p99 (us)':<10} {'Peak RSS (MB)':<14} {'Flagged':<8}")
+    print("-" * 100)
+
+    results = []
+    for corpus in args.corpora:
+        for size in args.sizes:
+            flagged_counts = set()
+            for implementation in args.implementations:
+                result = run_isolated(implementation, corpus, size, args.words)
+                results.append(result)
+                flagged_counts.add(result['flagged'])
+                print(f"{implementation:<16} {corpus:<10} {size:<10,} "
+                      f"{result['messages_per_second']:<13,.0f} {result['p50_us']:<10.1f} "
+                      f"{result['p99_us']:<10.1f} {result['peak_rss_mb']:<14.1f} "
+                      f"{result['flagged']:<8,}")
+            # Every implementation must flag the same messages
+            assert len(flagged_counts) == 1, f"Implementations disagree on {corpus} x {size}"
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(json.dumps({
+        'metadata': {
+            'timestamp': started.isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'batch_size': BATCH_SIZE,
+            'words_file': args.words,
+        },
+        'results': results,
+    }, indent=2))
+    print()
+    print(f"Results saved to: {output_file}")
+    print("Latency for batch implementations is batch time divided by batch size.")
+
+    if args.compare:
+        regressions = compare_results(results, args.compare, args.threshold)
+        if regressions:
+            print()
+            print(f"{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark the substring username engine on millions of names.
+
+Synthetic Reddit-style usernames are built from gaming words, digits and
+separators; ~5% embed a profanity word and ~5% an allow-listed word
+("classic", "hello"). For each size the script reports names/second for:
+- the old whole-word regex (misses concatenated names)
+- the Aho-Corasick automaton walked on every name (no prefilter)
+- UsernameScanner.check (regex prefilter, automaton on hits only)
+- UsernameScanner.flag_series (the path used by level1_test_usernames.py)
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.substring import UsernameScanner
+
+SIZES = [100_000, 1_000_000, 5_000_000]
+# Walking the automaton on every name in Python is only timed up to this size
+AUTOMATON_MAX_NAMES = 1_000_000
+NAME_PARTS = ("dark shadow gamer pro king wolf dragon ninja pixel noob master lord "
+              "x xx the red blue cat dog fire ice storm night star moon").split()
+
+
+def synthetic_usernames(count, words, allow_words, seed=42):
+    rng = random.Random(seed)
+    names = []
+    for _ in range(count):
+        parts = [rng.choice(NAME_PARTS) for _ in range(rng.randint(1, 3))]
+        roll = rng.random()
+        if roll < 0.05:
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice(words))
+        elif roll < 0.10:
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice(allow_words))
+        if rng.random() < 0.5:
+            parts.append(str(rng.randint(0, 9999)))
+        separator = rng.choice(['', '', '_', '-'])
+        name = separator.join(parts)
+        names.append(name.capitalize() if rng.random() < 0.3 else name)
+    return names
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the username substring engine")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                        help="Username counts (default: 100000 1000000 5000000)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scanner = UsernameScanner.from_files()
+    word_filter = ProfanityFilter.from_file('data/profanity_words.txt')
+    automaton = scanner.automaton
+
+    print("=" * 90)
+    print("USERNAME ENGINE BENCHMARK")
+    print("=" * 90)
+    print(f"Profanity words: {len(scanner.words)}   Allow-listed words: {len(scanner.allow_words)}")
+    print()
+    print(f"{'Names':<11} {'Word regex/s':<14} {'Automaton/s':<13} {'Scanner/s':<12} "
+          f"{'Series/s':<12} {'Word flagged':<13} {'Substring flagged':<17}")
+    print("-" * 90)
+
+    for size in args.sizes:
+        names = synthetic_usernames(size, scanner.words, scanner.allow_words)
+
+        word_flags, word_seconds = timed(lambda: word_filter.check_many(names))
+        scanner_flags, scanner_seconds = timed(lambda: scanner.check_many(names))
+        series_flags, series_seconds = timed(
+            lambda: scanner.flag_series(pd.Series(names, dtype=object)).tolist()
+        )
+        assert scanner_flags == series_flags, "flag_series disagrees with check"
+
+        automaton_rate = '-'
+        if size <= AUTOMATON_MAX_NAMES:
+            _, automaton_seconds = timed(
+                lambda: [any(True for _ in automaton.iter_matches(n.lower())) for n in names]
+            )
+            automaton_rate = f"{size / automaton_seconds:,.0f}"
+
+        print(f"{size:<11,} {size / word_seconds:<14,.0f} {automaton_rate:<13} "
+              f"{size / scanner_seconds:<12,.0f} {size / series_seconds:<12,.0f} "
+              f"{sum(word_flags):<13,} {sum(scanner_flags):<17,}")
+
+    print()
+    print("Automaton/s walks every name (including allow-list words), with no prefilter.")
+
+
+if __name__ == '__main__':
+    main()
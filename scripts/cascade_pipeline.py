@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Run the tiered regex-then-LLM cascade and report how it performs.
+
+This script:
+1. Flags each message with the Level 1 word-list matcher (tier 1)
+2. Escalates unmatched messages that trip an escalation rule to the LLM (tier 2)
+3. Reports escalation rate, per-tier latency percentiles and end-to-end
+   precision/recall, next to regex-only for comparison
+
+LLM verdicts come from the API via get_llm_classification, or can be
+replayed from a predictions CSV (e.g. results/level2_llm_predictions.csv)
+to evaluate escalation policies offline.
+"""
+
+import argparse
+import os
+
+from dotenv import load_dotenv
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.cascade import (
+    CascadeFilter,
+    NearMissRule,
+    ShortMessageRule,
+    SuspiciousTokenRule,
+    load_allow_words,
+)
+from profanity_filter.columnar import read_table, write_table
+from profanity_filter.metrics import calculate_metrics
+
+RULES = {
+    'short': lambda words: ShortMessageRule(),
+    'near_miss': lambda words: NearMissRule(words, allow_words=load_allow_words()),
+    'suspicious': lambda words: SuspiciousTokenRule(),
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Regex-then-LLM cascade")
+    parser.add_argument('--input', default='data/gametox_sample_50.csv',
+                        help="Labeled messages, CSV or Parquet (default: data/gametox_sample_50.csv)")
+    parser.add_argument('--rules', default='short,near_miss,suspicious',
+                        help="Comma-separated escalation rules (default: all)")
+    parser.add_argument('--llm-predictions', default=None,
+                        help="Replay LLM verdicts from a CSV with message,llm_prediction columns")
+    parser.add_argument('--base-url', default="https://openrouter.ai/api/v1",
+                        help="OpenAI-compatible API for live LLM calls (default: OpenRouter)")
+    parser.add_argument('--output', default='results/cascade_predictions.csv',
+                        help="Per-message predictions (default: results/cascade_predictions.csv)")
+    return parser.parse_args()
+
+
+def replay_llm(predictions_file):
+    """Return an llm_classify callable that looks verdicts up in a CSV."""
+    recorded = read_table(predictions_file, ['message', 'llm_prediction'])
+    verdicts = dict(zip(recorded['message'], recorded['llm_prediction'].astype(int)))
+    missing = []
+
+    def llm_classify(text):
+        if text not in verdicts:
+            missing.append(text)
+            return 0
+        return verdicts[text]
+
+    llm_classify.missing = missing
+    return llm_classify
+
+
+def live_llm(base_url, raise_errors=False):
+    """
+    Return an llm_classify callable backed by get_llm_classification.
+
+    With raise_errors, API failures raise instead of defaulting to TOXIC.
+    """
+    from openai import OpenAI
+
+    from level2_llm_classifier import get_llm_classification, load_prompt_template
+    from profanity_filter.cache import VerdictCache
+
+    load_dotenv()
+    client = OpenAI(base_url=base_url, api_key=os.getenv("OPENROUTER_API_KEY", "local"))
+    prompt_template = load_prompt_template()
+    cache = VerdictCache('data/llm_verdict_cache.sqlite')
+
+    def llm_classify(text):
+        return get_llm_classification(client, prompt_template, text, cache=cache,
+                                      raise_errors=raise_errors)
+
+    llm_classify.missing = []
+    return llm_classify
+
+
+def main():
+    args = parse_args()
+
+    word_filter = ProfanityFilter.from_file('data/profanity_words.txt')
+    rules = [RULES[name.strip()](word_filter.words) for name in args.rules.split(',') if name.strip()]
+    if args.llm_predictions:
+        llm_classify = replay_llm(args.llm_predictions)
+    else:
+        llm_classify = live_llm(args.base_url)
+
+    df = read_table(args.input)
+    cascade = CascadeFilter(word_filter, llm_classify, rules)
+
+    print("=" * 70)
+    print("REGEX -> LLM CASCADE")
+    print("=" * 70)
+    print(f"Messages: {len(df):,}")
+    print(f"Escalation rules: {', '.join(rule.name for rule in rules) or '(none)'}")
+    print(f"LLM tier: {'replayed from ' + args.llm_predictions if args.llm_predictions else args.base_url}")
+    print()
+
+    results = cascade.classify_many(df['message'])
+    df['regex_prediction'] = [int(flag) for flag in word_filter.check_many(df['message'])]
+    df['cascade_prediction'] = [r['prediction'] for r in results]
+    df['cascade_tier'] = [r['tier'] for r in results]
+    df['cascade_reason'] = [r['reason'] for r in results]
+
+    if llm_classify.missing:
+        print(f"⚠ {len(llm_classify.missing)} escalated messages had no recorded LLM verdict (counted as CLEAN)")
+        print()
+
+    # Escalation summary
+    print("=" * 70)
+    print("ESCALATION")
+    print("=" * 70)
+    print(f"  Tier 1 regex hits (TOXIC):   {cascade.counts['regex_toxic']:,}")
+    print(f"  Cleared by rules (CLEAN):    {cascade.counts['clean']:,}")
+    print(f"  Escalated to LLM:            {cascade.counts['escalated']:,}")
+    print(f"  Escalation rate:             {cascade.escalation_rate * 100:.1f}%")
+    for name, fired in cascade.rule_counts.items():
+        print(f"    - {name:<12} {fired:,}")
+    print()
+
+    # Latency
+    print("=" * 70)
+    print("PER-TIER LATENCY (ms)")
+    print("=" * 70)
+    print(f"{'Tier':<10} {'Calls':<10} {'p50':<12} {'p90':<12} {'p99':<12}")
+    print("-" * 70)
+    for tier, stats in cascade.latency_report().items():
+        print(f"{tier:<10} {stats['calls']:<10,} {stats['p50_ms']:<12.4f} "
+              f"{stats['p90_ms']:<12.4f} {stats['p99_ms']:<12.4f}")
+    print()
+
+    # Accuracy
+    print("=" * 70)
+    print("END-TO-END METRICS")
+    print("=" * 70)
+    labels = df['label'].astype(int)
+    regex_metrics = calculate_metrics(labels, df['regex_prediction'])
+    cascade_metrics = calculate_metrics(labels, df['cascade_prediction'])
+    print(f"{'Metric':<20} {'Regex only':<15} {'Cascade':<15}")
+    print("-" * 70)
+    for metric in ['accuracy', 'precision', 'recall', 'f1']:
+        print(f"{metric.capitalize():<20} {regex_metrics[metric]:<15.3f} {cascade_metrics[metric]:<15.3f}")
+    print()
+
+    write_table(df[['message', 'label', 'regex_prediction', 'cascade_prediction',
+                    'cascade_tier', 'cascade_reason']], args.output)
+    print(f"✓ Saved per-message cascade predictions to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,85 +1,87 @@
 #!/usr/bin/env python3
 """
-Compare Regex (Level 1) vs LLM (Level 2) profanity filtering approaches.
+Compare Regex (Level 1), the local linear model and LLM (Level 2) approaches.
 
 This script:
 1. Loads the same 50-message sample used for LLM testing
 2. Applies regex-based filtering using the profanity wordlist
-3. Compares regex predictions vs LLM predictions
-4. Calculates metrics for both approaches
-5. Identifies and analyzes disagreements
+3. Applies the hashed n-gram linear classifier (trained by
+   scripts/train_linear_model.py, or on the fly if the model file is missing;
+   skipped when there is neither a model nor data/gametox.csv to train on)
+4. Calculates metrics and throughput for all three approaches
+5. Identifies and analyzes regex vs LLM disagreements
 6. Saves comprehensive comparison results
 """
 
+import time
+
 import pandas as pd
-import re
 from pathlib import Path
 
+from profanity_filter import ProfanityFilter
+from profanity_filter.columnar import resolve_dataset
+from profanity_filter.linear import DEFAULT_MODEL_FILE, LinearClassifier, load_training_data
+from profanity_filter.metrics import calculate_metrics
 
-def load_profanity_words(filepath):
-    """Load profanity words from file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        words = [line.strip().lower() for line in f if line.strip()]
-    return words
+# Per-message LLM latency measured in results/FINAL_COMPARISON.md (rate limits + API)
+LLM_SECONDS_PER_MESSAGE = 3.0
 
 
-def regex_filter(text, profanity_words):
+def regex_filter(text, word_filter):
     """
     Apply regex-based profanity filter.
 
     Returns 1 (toxic) if any profanity word found, 0 (clean) otherwise.
     Uses word boundary matching to avoid partial word matches.
+
+    Args:
+        text: Message to check
+        word_filter: ProfanityFilter built once from the profanity word list
     """
-    if pd.isna(text):
-        return 0
-
-    text_lower = text.lower()
-
-    # Check each profanity word
-    for word in profanity_words:
-        # Create pattern with word boundaries
-        pattern = r'\b' + re.escape(word) + r'\b'
-        if re.search(pattern, text_lower):
-            return 1
-
-    return 0
-
-
-def calculate_metrics(y_true, y_pred):
-    """Calculate classification metrics."""
-    # Convert to binary
-    y_true = [int(y) for y in y_true]
-    y_pred = [int(y) for y in y_pred]
-
-    # Calculate confusion matrix
-    tp = sum(1 for true, pred in zip(y_true, y_pred) if true == 1 and pred == 1)
-    fp = sum(1 for true, pred in zip(y_true, y_pred) if true == 0 and pred == 1)
-    tn = sum(1 for true, pred in zip(y_true, y_pred) if true == 0 and pred == 0)
-    fn = sum(1 for true, pred in zip(y_true, y_pred) if true == 1 and pred == 0)
-
-    # Calculate metrics
-    accuracy = (tp + tn) / (tp + tn + fp + fn) if (tp + tn + fp + fn) > 0 else 0
-    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-    recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-    f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
-
-    return {
-        'accuracy': accuracy,
-        'precision': precision,
-        'recall': recall,
-        'f1': f1,
-        'tp': tp,
-        'fp': fp,
-        'tn': tn,
-        'fn': fn
-    }
+    # Single pass over the message with the precompiled word-list pattern
+    return 1 if word_filter.check(text) else 0
+
+
+def determine_winner(values):
+    """
+    Determine which approach performed better for a metric.
+
+    Args:
+        values: dict approach name -> metric value
+    """
+    best = max(values.values())
+    winners = [name for name, value in values.items() if abs(value - best) < 0.001]
+    return "Tie" if len(winners) > 1 else winners[0]
+
 
+def load_linear_model(model_file, sample_file):
+    """
+    Load the linear model, training (and saving) it first if the file is missing.
 
-def determine_winner(regex_value, llm_value):
-    """Determine which approach performed better for a metric."""
-    if abs(regex_value - llm_value) < 0.001:
-        return "Tie"
-    return "Regex" if regex_value > llm_value else "LLM"
+    Returns:
+        LinearClassifier, or None if there is no model and no dataset to train on
+    """
+    if model_file.exists():
+        return LinearClassifier.load(model_file)
+    dataset = resolve_dataset('data/gametox.csv')
+    if not dataset.exists():
+        print(f"  ⚠ No model at {model_file} and no {dataset} to train one: "
+              f"skipping the Linear column")
+        print("    (download the dataset and run scripts/train_linear_model.py)")
+        return None
+    print(f"  No model at {model_file}; training on {dataset} (sample excluded)...")
+    train, _ = load_training_data(dataset, sample_file, holdout=0.0)
+    model = LinearClassifier.train(train['message'], train['label'])
+    model.save(model_file)
+    return model
+
+
+def messages_per_second(classify_batch, messages, target=20_000):
+    """Batch throughput over the sample repeated to about `target` messages."""
+    batch = messages * max(1, target // max(1, len(messages)))
+    start = time.perf_counter()
+    classify_batch(batch)
+    return len(batch) / max(time.perf_counter() - start, 1e-9)
 
 
 def main():
@@ -90,7 +92,7 @@ def main():
     output_file = Path('results/level1_vs_level2_comparison.csv')
 
     print("=" * 70)
-    print("REGEX vs LLM PROFANITY FILTER COMPARISON")
+    print("REGEX vs LINEAR vs LLM PROFANITY FILTER COMPARISON")
     print("=" * 70)
     print()
 
@@ -98,19 +100,27 @@ def main():
     print("Loading data files...")
     df_sample = pd.read_csv(sample_file)
     df_llm = pd.read_csv(llm_predictions_file)
-    profanity_words = load_profanity_words(profanity_words_file)
+    word_filter = ProfanityFilter.from_file(profanity_words_file)
+    linear_model = load_linear_model(DEFAULT_MODEL_FILE, sample_file)
 
     print(f"  ✓ Loaded {len(df_sample)} messages from sample")
     print(f"  ✓ Loaded {len(df_llm)} LLM predictions")
-    print(f"  ✓ Loaded {len(profanity_words)} profanity words")
+    print(f"  ✓ Loaded {len(word_filter.words)} profanity words")
+    if linear_model is not None:
+        trained_rows = linear_model.meta.get('trained_rows')
+        trained_rows = f"{trained_rows:,}" if trained_rows is not None else "unknown"
+        print(f"  ✓ Loaded linear model ({trained_rows} training rows)")
     print()
 
     # Apply regex filter to the same 50 messages
     print("Applying regex filter to messages...")
     df_sample['regex_prediction'] = df_sample['message'].apply(
-        lambda x: regex_filter(x, profanity_words)
+        lambda x: regex_filter(x, word_filter)
     )
     print("  ✓ Regex filtering complete")
+    if linear_model is not None:
+        df_sample['linear_prediction'] = linear_model.predict(df_sample['message'].tolist())
+        print("  ✓ Linear classification complete")
     print()
 
     # Merge with LLM predictions
@@ -125,39 +135,47 @@ def main():
     print("METRICS COMPARISON (Same 50 Messages)")
     print("=" * 70)
 
-    regex_metrics = calculate_metrics(
-        df_comparison['actual_label'],
-        df_comparison['regex_prediction']
-    )
-
-    llm_metrics = calculate_metrics(
-        df_comparison['actual_label'],
-        df_comparison['llm_prediction']
-    )
+    # Approach name -> prediction column (Linear only when a model was loaded)
+    columns = {'Regex': 'regex_prediction'}
+    if linear_model is not None:
+        columns['Linear'] = 'linear_prediction'
+    columns['LLM'] = 'llm_prediction'
+    metrics = {
+        name: calculate_metrics(df_comparison['actual_label'], df_comparison[column])
+        for name, column in columns.items()
+    }
 
     # Print comparison table
-    print(f"{'Metric':<20} {'Regex':<15} {'LLM':<15} {'Winner':<10}")
+    print(f"{'Metric':<16} " + ''.join(f"{name:<13} " for name in metrics) + f"{'Winner':<10}")
     print("-" * 70)
 
     for metric in ['accuracy', 'precision', 'recall', 'f1']:
-        regex_val = regex_metrics[metric]
-        llm_val = llm_metrics[metric]
-        winner = determine_winner(regex_val, llm_val)
-        print(f"{metric.capitalize():<20} {regex_val:<15.3f} {llm_val:<15.3f} {winner:<10}")
+        values = {name: approach[metric] for name, approach in metrics.items()}
+        winner = determine_winner(values)
+        print(f"{metric.capitalize():<16} "
+              + ''.join(f"{value:<13.3f} " for value in values.values()) + f"{winner:<10}")
+
+    messages = df_comparison['message'].tolist()
+    throughput = {'Regex': messages_per_second(word_filter.check_many, messages)}
+    if linear_model is not None:
+        throughput['Linear'] = messages_per_second(linear_model.predict, messages)
+    throughput['LLM'] = 1 / LLM_SECONDS_PER_MESSAGE
+    print(f"{'Messages/sec':<16} "
+          + ''.join(f"{value:<13,.0f} " for name, value in throughput.items() if name != 'LLM')
+          + f"{throughput['LLM']:<13.2f} {determine_winner(throughput):<10}")
+    print(f"  (LLM throughput from the ~{LLM_SECONDS_PER_MESSAGE:g}s per message measured "
+          f"in results/FINAL_COMPARISON.md)")
 
     print()
     print("=" * 70)
     print("CONFUSION MATRICES")
     print("=" * 70)
     print()
-    print("Regex:")
-    print(f"  True Positives:  {regex_metrics['tp']:<3}  False Positives: {regex_metrics['fp']}")
-    print(f"  False Negatives: {regex_metrics['fn']:<3}  True Negatives:  {regex_metrics['tn']}")
-    print()
-    print("LLM:")
-    print(f"  True Positives:  {llm_metrics['tp']:<3}  False Positives: {llm_metrics['fp']}")
-    print(f"  False Negatives: {llm_metrics['fn']:<3}  True Negatives:  {llm_metrics['tn']}")
-    print()
+    for name, approach in metrics.items():
+        print(f"{name}:")
+        print(f"  True Positives:  {approach['tp']:<3}  False Positives: {approach['fp']}")
+        print(f"  False Negatives: {approach['fn']:<3}  True Negatives:  {approach['tn']}")
+        print()
 
     # Find disagreements
     df_comparison['disagree'] = (
@@ -197,13 +215,15 @@ def main():
         print()
 
     # Save comparison results
-    output_df = df_comparison[[
-        'message', 'label', 'regex_prediction', 'llm_prediction'
-    ]].copy()
+    output_df = df_comparison[['message', 'label'] + list(columns.values())].copy()
 
     output_df['regex_correct'] = (
         output_df['regex_prediction'] == output_df['label'].astype(int)
     )
+    if linear_model is not None:
+        output_df['linear_correct'] = (
+            output_df['linear_prediction'] == output_df['label'].astype(int)
+        )
     output_df['llm_correct'] = (
         output_df['llm_prediction'] == output_df['label'].astype(int)
     )
@@ -226,6 +246,8 @@ def main():
     print(f"  Both wrong:         {both_wrong} messages")
     print(f"  Only Regex correct: {only_regex} messages")
     print(f"  Only LLM correct:   {only_llm} messages")
+    if linear_model is not None:
+        print(f"  Linear correct:     {int(output_df['linear_correct'].sum())} messages")
     print()
 
 
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+One-time conversion of the CSV datasets to Parquet.
+
+Writes data/<name>.parquet next to each CSV (zstd-compressed, streamed in
+chunks). The Level 1 scripts, the linear-model trainer and the incremental
+index then load the Parquet copy automatically, as long as it is not older
+than its CSV; pass --input to force a specific file.
+
+Usage:
+    python scripts/convert_to_parquet.py
+    python scripts/convert_to_parquet.py data/gametox.csv
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from profanity_filter.columnar import convert_csv
+
+DEFAULT_FILES = ['data/gametox.csv', 'data/reddit_usernames.csv']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Convert CSV datasets to Parquet")
+    parser.add_argument('files', nargs='*', default=DEFAULT_FILES,
+                        help="CSV files to convert (default: GameTox and Reddit usernames)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    print("=" * 70)
+    print("CSV -> PARQUET CONVERSION")
+    print("=" * 70)
+    for csv_file in args.files:
+        if not Path(csv_file).exists():
+            print(f"Skipping {csv_file} (not found)")
+            continue
+        start = time.perf_counter()
+        result = convert_csv(csv_file)
+        elapsed = time.perf_counter() - start
+        print(f"{csv_file} -> {result['output']}: {result['rows']:,} rows, "
+              f"{result['csv_bytes'] / 1e6:.1f} MB -> {result['parquet_bytes'] / 1e6:.1f} MB "
+              f"({elapsed:.2f}s)")
+    print()
+
+
+if __name__ == '__main__':
+    main()
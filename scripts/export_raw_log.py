@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Export a labelled dataset as a raw "label<TAB>message" log for --raw scans.
+
+One message per line; tabs and newlines inside messages become spaces and
+missing labels leave the label field empty. The result can be scanned with
+    python scripts/level1_regex_filter.py --raw
+
+Usage:
+    python scripts/export_raw_log.py
+    python scripts/export_raw_log.py --input data/gametox.parquet --output data/gametox.log
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from profanity_filter.columnar import resolve_dataset
+from profanity_filter.rawscan import export_log
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export a dataset as a raw log")
+    parser.add_argument('--input', default=None,
+                        help="CSV or Parquet (default: data/gametox.parquet if converted, "
+                             "else data/gametox.csv)")
+    parser.add_argument('--output', default='data/gametox.log',
+                        help="Raw log file (default: data/gametox.log)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    input_file = args.input or resolve_dataset('data/gametox.csv')
+    start = time.perf_counter()
+    lines = export_log(input_file, args.output)
+    print(f"✓ Wrote {lines:,} lines ({Path(args.output).stat().st_size / 1e6:.1f} MB) "
+          f"from {input_file} to {args.output} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Local fake OpenAI-compatible chat completions server.
+
+Used to measure the Level 2 classifiers without network access or API
+costs. It answers POST /v1/chat/completions with TOXIC or CLEAN (using the
+profanity word list as a stand-in model). Batch prompts with numbered
+`1. "message"` lines get one "<n>: TOXIC|CLEAN" line per message. It can
+simulate:
+- per-request latency (--latency)
+- a request rate limit that returns 429 with Retry-After (--rate-limit)
+- random 5xx failures (--error-rate)
+- malformed batch replies with the last line missing (--malformed-rate)
+
+Run standalone:
+    python scripts/fake_openai_server.py --port 8099 --latency 0.2 --rate-limit 10
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from profanity_filter import ProfanityFilter
+
+BATCH_ITEM = re.compile(r'^(\d+)\. "(.*)"$', re.MULTILINE)
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer holding the simulation settings and counters."""
+
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.2, rate_limit=None, error_rate=0.0,
+                 word_filter=None, seed=0, malformed_rate=0.0):
+        super().__init__(address, FakeOpenAIHandler)
+        self.latency = latency
+        self.rate_limit = rate_limit  # requests per second, None = unlimited
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.word_filter = word_filter or ProfanityFilter.from_file('data/profanity_words.txt')
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.recent = deque()
+        self.counters = {'requests': 0, 'ok': 0, 'rate_limited': 0, 'server_errors': 0,
+                         'malformed': 0}
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def admit(self):
+        """Return the HTTP status for the next request (200, 429 or 500)."""
+        with self.lock:
+            self.counters['requests'] += 1
+            now = time.monotonic()
+            if self.rate_limit:
+                while self.recent and now - self.recent[0] > 1.0:
+                    self.recent.popleft()
+                if len(self.recent) >= self.rate_limit:
+                    self.counters['rate_limited'] += 1
+                    return 429
+                self.recent.append(now)
+            if self.error_rate and self.random.random() < self.error_rate:
+                self.counters['server_errors'] += 1
+                return 500
+            self.counters['ok'] += 1
+            return 200
+
+    def answer(self, prompt):
+        """Stand-in model: word-list verdict per message (or per numbered item)."""
+        items = BATCH_ITEM.findall(prompt)
+        if not items:
+            return 'TOXIC' if self.word_filter.check(prompt) else 'CLEAN'
+
+        lines = [
+            f"{number}: {'TOXIC' if self.word_filter.check(text) else 'CLEAN'}"
+            for number, text in items
+        ]
+        with self.lock:
+            malformed = self.malformed_rate and self.random.random() < self.malformed_rate
+            if malformed:
+                self.counters['malformed'] += 1
+        if malformed:
+            lines = lines[:-1]
+        return '\n'.join(lines)
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            return self._send(404, {'error': {'message': 'not found'}})
+
+        status = self.server.admit()
+        if status == 429:
+            return self._send(429, {'error': {'message': 'rate limited'}},
+                              headers={'Retry-After': '1'})
+        if status == 500:
+            return self._send(500, {'error': {'message': 'internal error'}})
+
+        time.sleep(self.server.latency)
+        answer = self.server.answer(body['messages'][-1]['content'])
+        self._send(200, {
+            'id': 'chatcmpl-fake',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'fake'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': answer},
+                'finish_reason': 'stop',
+            }],
+            'usage': {'prompt_tokens': 0, 'completion_tokens': 1, 'total_tokens': 1},
+        })
+
+    def _send(self, status, payload, headers=None):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output clean
+
+
+def start_fake_server(port=0, **kwargs):
+    """Start a FakeOpenAIServer in a background thread and return it."""
+    server = FakeOpenAIServer(('127.0.0.1', port), **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible server")
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--latency', type=float, default=0.2,
+                        help="Seconds per successful request (default: 0.2)")
+    parser.add_argument('--rate-limit', type=float, default=None,
+                        help="Requests per second before returning 429")
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help="Fraction of requests answered with 500")
+    parser.add_argument('--malformed-rate', type=float, default=0.0,
+                        help="Fraction of batch replies with the last line dropped")
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(('127.0.0.1', args.port), latency=args.latency,
+                              rate_limit=args.rate_limit, error_rate=args.error_rate,
+                              malformed_rate=args.malformed_rate)
+    print(f"Fake OpenAI server listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nCounters: {server.counters}")
+
+
+if __name__ == '__main__':
+    main()
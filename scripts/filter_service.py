@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Async HTTP filtering service around the Level 1 matcher.
+
+Endpoints (JSON in, JSON out, HTTP/1.1 keep-alive):
+    POST /check         {"text": "..."}           -> one result
+    POST /check_batch   {"texts": ["...", ...]}   -> {"results": [...]}
+    POST /redact        {"text": "..."}           -> {"text": masked, "matches": spans}
+    GET  /health                                  -> status and word count
+    GET  /stats                                   -> batching / escalation counters
+
+Each result is {"toxic": bool, "tier": "regex"|"rules"|"llm", "matches": [...],
+"rule": name or null, "reason": str or null}: a CascadeFilter.classify() result
+(profanity_filter.cascade) with a boolean "toxic" in place of "prediction".
+
+Concurrent /check requests are micro-batched: they queue for at most
+--max-wait-ms (or until --max-batch are waiting) and are then screened with
+one CascadeFilter.screen_many call. With --llm, unmatched messages that trip
+an escalation rule go to get_llm_classification on worker threads; only
+those requests wait for the LLM, the rest of their batch is answered at
+once. The word list is hot-reloaded when data/profanity_words.txt changes,
+or served from a compiled dictionary (--dictionary, see profanity_dict.py)
+for instant start, or split into per-locale lists routed by language
+(--locales).
+
+Only the standard library is used (asyncio streams), like
+fake_openai_server.py.
+
+Run:
+    python scripts/filter_service.py --port 8088
+    curl -s localhost:8088/check -d '{"text": "you idiot"}'
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+from http import HTTPStatus
+
+from profanity_filter.cascade import CascadeFilter, default_rules
+from profanity_filter.redact import Redactor
+from profanity_filter.reload import ReloadingFilter
+
+MAX_BODY_BYTES = 1 << 20
+MAX_BATCH_TEXTS = 1000
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-item calls into batched calls."""
+
+    def __init__(self, process_batch, max_batch=64, max_wait=0.002):
+        """
+        Args:
+            process_batch: async callable(list of items) -> list of results
+            max_batch: Flush as soon as this many items are waiting
+            max_wait: Seconds the first waiting item may wait for company
+        """
+        self.process_batch = process_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+        self.stats = {'batches': 0, 'items': 0, 'largest': 0}
+
+    async def submit(self, item):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        self.stats['batches'] += 1
+        self.stats['items'] += len(batch)
+        self.stats['largest'] = max(self.stats['largest'], len(batch))
+        try:
+            results = await self.process_batch([item for item, _ in batch])
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class FilterService:
+    """Classification logic shared by both endpoints."""
+
+    def __init__(self, word_filter, llm_classify=None, rules=None, llm_concurrency=5,
+                 max_batch=64, max_wait=0.002):
+        """
+        Args:
+            word_filter: ReloadingFilter (or any filter with check_many/explain) for tier 1
+            llm_classify: Optional blocking callable(text) -> 0/1; run on threads
+            rules: Escalation rules (default_rules when llm_classify is set,
+                   rebuilt whenever the word list is reloaded)
+            llm_concurrency: Maximum LLM calls in flight
+        """
+        self.word_filter = word_filter
+        self.llm_classify = llm_classify
+        self._rules_source = None
+        if rules is None and llm_classify is not None:
+            self._rules_source = getattr(word_filter, 'current', word_filter)
+            rules = default_rules(self._rules_source.words)
+        # Tiers 1 and 2 are the cascade's; LLM calls are made here, on threads
+        self.cascade = CascadeFilter(word_filter, llm_classify, rules or [])
+        self.llm_concurrency = llm_concurrency
+        self._llm_slots = None
+        self.redactor = Redactor(word_filter)
+        self.batcher = MicroBatcher(self._triage_batch, max_batch, max_wait)
+        self.stats = {'requests': 0, 'texts': 0, 'regex_toxic': 0, 'escalated': 0,
+                      'llm_errors': 0}
+
+    async def _triage_batch(self, texts):
+        """
+        Regex and rule verdicts for a list of texts, without waiting on the LLM.
+
+        Returns:
+            list: (result dict, escalation task or None) per text; the task
+                  fills in the result's LLM verdict when it finishes
+        """
+        word_filter = getattr(self.word_filter, 'current', self.word_filter)
+        if self._rules_source is not None and word_filter is not self._rules_source:
+            # The word list was reloaded: near misses must follow the new words
+            self._rules_source = word_filter
+            self.cascade.rules = default_rules(word_filter.words)
+        triaged = []
+        for text, screened in zip(texts, self.cascade.screen_many(texts)):
+            result = {'toxic': bool(screened['prediction']), 'tier': screened['tier'],
+                      'matches': screened['matches'], 'rule': screened['rule'],
+                      'reason': screened['reason']}
+            escalation = None
+            if result['tier'] == 'regex':
+                self.stats['regex_toxic'] += 1
+            elif result['tier'] == 'llm':
+                escalation = asyncio.ensure_future(self._escalate(text, result))
+            triaged.append((result, escalation))
+        self.stats['texts'] += len(texts)
+        return triaged
+
+    async def check(self, text):
+        """Classify one text through the micro-batcher (the /check endpoint)."""
+        result, escalation = await self.batcher.submit(text)
+        if escalation is not None:
+            await escalation
+        return result
+
+    async def classify_batch(self, texts):
+        """Classify a list of texts; returns one result dict per text."""
+        triaged = await self._triage_batch(texts)
+        escalations = [escalation for _, escalation in triaged if escalation is not None]
+        if escalations:
+            await asyncio.gather(*escalations)
+        return [result for result, _ in triaged]
+
+    async def _escalate(self, text, result):
+        if self._llm_slots is None:
+            self._llm_slots = asyncio.Semaphore(self.llm_concurrency)
+        self.stats['escalated'] += 1
+        async with self._llm_slots:
+            try:
+                result['toxic'] = bool(await asyncio.to_thread(self.llm_classify, text))
+            except Exception as error:
+                # Fail open to the regex verdict; the client sees why
+                self.stats['llm_errors'] += 1
+                result['reason'] += f" (LLM error: {type(error).__name__})"
+
+    async def handle(self, method, path, body):
+        """Route one request; returns (HTTPStatus, payload dict)."""
+        self.stats['requests'] += 1
+        if path == '/health' and method == 'GET':
+            return HTTPStatus.OK, {'status': 'ok', 'words': len(self.word_filter.words)}
+        if path == '/stats' and method == 'GET':
+            stats = dict(self.stats, batching=self.batcher.stats)
+            if hasattr(self.word_filter, 'stats'):
+                stats['word_list'] = {key: value for key, value in self.word_filter.stats.items()
+                                      if key != 'rebuild_seconds'}
+            return HTTPStatus.OK, stats
+        if path not in ('/check', '/check_batch', '/redact'):
+            return HTTPStatus.NOT_FOUND, {'error': f"unknown path {path}"}
+        if method != 'POST':
+            return HTTPStatus.METHOD_NOT_ALLOWED, {'error': 'use POST'}
+
+        try:
+            request = json.loads(body or b'{}')
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {'error': 'body is not valid JSON'}
+        if not isinstance(request, dict):
+            return HTTPStatus.BAD_REQUEST, {'error': 'body must be a JSON object'}
+
+        if path == '/check':
+            text = request.get('text')
+            if not isinstance(text, str):
+                return HTTPStatus.BAD_REQUEST, {'error': '"text" must be a string'}
+            return HTTPStatus.OK, await self.check(text)
+
+        if path == '/redact':
+            text = request.get('text')
+            if not isinstance(text, str):
+                return HTTPStatus.BAD_REQUEST, {'error': '"text" must be a string'}
+            redacted, spans = self.redactor.redact_spans(text)
+            return HTTPStatus.OK, {'text': redacted, 'matches': spans}
+
+        texts = request.get('texts')
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            return HTTPStatus.BAD_REQUEST, {'error': '"texts" must be a list of strings'}
+        if len(texts) > MAX_BATCH_TEXTS:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {
+                'error': f"at most {MAX_BATCH_TEXTS} texts per batch"}
+        return HTTPStatus.OK, {'results': await self.classify_batch(texts)}
+
+    async def serve_connection(self, reader, writer):
+        """HTTP/1.1 request loop for one connection (keep-alive)."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                parts = request_line.decode('latin-1').split()
+                if len(parts) != 3:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST,
+                                        {'error': 'malformed request line'}, False)
+                    break
+                method, target, version = parts
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' \
+                    else connection == 'keep-alive'
+
+                length = int(headers.get('content-length') or 0)
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                        {'error': 'body too large'}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self.handle(method, target.split('?', 1)[0], body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        data = json.dumps(payload).encode('utf-8')
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + data)
+        await writer.drain()
+
+
+async def serve(service, host='127.0.0.1', port=8088, ready=None):
+    """Serve forever; `ready` (threading.Event) is set once the socket is listening."""
+    server = await asyncio.start_server(service.serve_connection, host, port)
+    if ready is not None:
+        ready.port = server.sockets[0].getsockname()[1]
+        ready.set()
+    async with server:
+        await server.serve_forever()
+
+
+def start_service(service, port=0):
+    """Run the service on a background event-loop thread; returns the bound port."""
+    ready = threading.Event()
+    threading.Thread(target=asyncio.run, args=(serve(service, port=port, ready=ready),),
+                     daemon=True).start()
+    ready.wait()
+    return ready.port
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="HTTP profanity filtering service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8088)
+    parser.add_argument('--words', default='data/profanity_words.txt',
+                        help="Word list, reloaded when it changes (default: data/profanity_words.txt)")
+    parser.add_argument('--dictionary', default=None,
+                        help="Serve from a compiled .pfd dictionary (mmap, instant start, no reload)")
+    parser.add_argument('--locales', nargs='?', const='data/locales', default=None, metavar='DIR',
+                        help="Add per-locale word lists (DIR/<locale>.txt, default: data/locales), "
+                             "routed by detected language and loaded on first use")
+    parser.add_argument('--normalize', action='store_true',
+                        help="Undo leetspeak/separators/repeats before matching")
+    parser.add_argument('--max-batch', type=int, default=64,
+                        help="Micro-batch size limit for /check (default: 64)")
+    parser.add_argument('--max-wait-ms', type=float, default=2.0,
+                        help="Longest a /check waits for its micro-batch (default: 2ms)")
+    parser.add_argument('--llm', action='store_true',
+                        help="Escalate rule-tripping messages to the LLM")
+    parser.add_argument('--base-url', default="https://openrouter.ai/api/v1",
+                        help="OpenAI-compatible API for --llm (default: OpenRouter)")
+    parser.add_argument('--llm-concurrency', type=int, default=5,
+                        help="Maximum LLM calls in flight (default: 5)")
+    args = parser.parse_args()
+    if args.dictionary:
+        # A compiled dictionary matches exactly what was compiled into it
+        conflicts = [option for option, used in [
+            ('--normalize', args.normalize), ('--locales', args.locales)] if used]
+        if conflicts:
+            parser.error(f"--dictionary cannot be combined with {', '.join(conflicts)}")
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.dictionary:
+        from profanity_filter.compiled import CompiledFilter
+
+        word_filter = CompiledFilter(args.dictionary)
+    elif args.locales:
+        from profanity_filter.multilingual import MultilingualFilter
+
+        word_filter = MultilingualFilter.from_directory(args.locales, normalize=args.normalize)
+    else:
+        word_filter = ReloadingFilter(args.words, normalize=args.normalize)
+
+    llm_classify = None
+    if args.llm:
+        from cascade_pipeline import live_llm
+
+        llm_classify = live_llm(args.base_url, raise_errors=True)
+
+    service = FilterService(word_filter, llm_classify, llm_concurrency=args.llm_concurrency,
+                            max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000)
+    print(f"Filter service listening on http://{args.host}:{args.port} "
+          f"({len(word_filter.words)} words, LLM escalation {'on' if args.llm else 'off'})")
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        print(f"\nStats: {service.stats}")
+    finally:
+        if isinstance(word_filter, ReloadingFilter):
+            word_filter.close()
+
+
+if __name__ == '__main__':
+    main()
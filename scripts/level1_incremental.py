@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Incremental Level 1 re-scoring after word-list edits.
+
+Builds a persisted inverted index over GameTox once (token -> rows), then
+answers word-list changes from the index instead of rescanning the corpus:
+only the rows of added/removed words change, and the confusion counts are
+updated in place.
+
+Usage:
+    python scripts/level1_incremental.py build
+    python scripts/level1_incremental.py update      # diff against data/profanity_words.txt
+    python scripts/level1_incremental.py what-if trash noob
+    python scripts/level1_incremental.py what-if ass --substring
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from profanity_filter.columnar import resolve_dataset
+from profanity_filter.index import (DEFAULT_INDEX_FILE, CorpusIndex, IncrementalScorer,
+                                    lazy_texts)
+from profanity_filter.matcher import load_profanity_words
+
+text_column = 'message'
+label_column = 'label'
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Incremental Level 1 re-scoring")
+    parser.add_argument('command', choices=('build', 'update', 'what-if'),
+                        help="build the index, apply word-list changes, or preview terms")
+    parser.add_argument('terms', nargs='*', help="Terms to preview (what-if)")
+    parser.add_argument('--input', default=None,
+                        help="GameTox CSV or Parquet (default: data/gametox.parquet if "
+                             "converted, else data/gametox.csv)")
+    parser.add_argument('--words', default='data/profanity_words.txt',
+                        help="Word list (default: data/profanity_words.txt)")
+    parser.add_argument('--index', default=str(DEFAULT_INDEX_FILE),
+                        help="Index file (default: results/level1_index.npz)")
+    parser.add_argument('--substring', action='store_true',
+                        help="what-if: match terms inside tokens too, not only whole words")
+    args = parser.parse_args()
+    if args.command == 'what-if' and not args.terms:
+        parser.error("what-if needs at least one term")
+    args.input = str(args.input or resolve_dataset('data/gametox.csv'))
+    return args
+
+
+def print_metrics(title, metrics):
+    print(f"{title}:")
+    print(f"  TP {metrics['tp']}, FP {metrics['fp']}, TN {metrics['tn']}, FN {metrics['fn']}")
+    print(f"  Accuracy {metrics['accuracy']:.4f}, Precision {metrics['precision']:.4f}, "
+          f"Recall {metrics['recall']:.4f}, F1 {metrics['f1']:.4f}")
+
+
+def build(args):
+    """Index the corpus and score the current word list from scratch."""
+    print("=" * 70)
+    print("BUILDING INVERTED INDEX")
+    print("=" * 70)
+    start = time.perf_counter()
+    index = CorpusIndex.build(args.input, text_column, label_column)
+    built = time.perf_counter() - start
+    print(f"Indexed {len(index):,} messages: {len(index.vocab):,} distinct tokens, "
+          f"{len(index.postings):,} postings ({built:.2f}s)")
+
+    words = load_profanity_words(args.words)
+    start = time.perf_counter()
+    scorer = IncrementalScorer(index, words, texts=lazy_texts(args.input, text_column))
+    scored = time.perf_counter() - start
+    print(f"Scored {len(words)} words from the index in {scored * 1e3:.1f} ms")
+    print()
+    print_metrics("Metrics", scorer.metrics())
+    index.save(args.index, scorer.state())
+    print()
+    print(f"✓ Saved index to {args.index}")
+
+
+def load(args):
+    """Load the index (rebuilding it if the CSV changed) and its scorer state."""
+    if not Path(args.index).exists():
+        raise SystemExit(f"No index at {args.index}; run "
+                         f"'python scripts/level1_incremental.py build' first")
+    start = time.perf_counter()
+    index, state = CorpusIndex.load(args.index)
+    if not index.is_current(args.input):
+        print(f"{args.input} changed since the index was built; rebuilding...")
+        index, state = CorpusIndex.build(args.input, text_column, label_column), None
+    texts = lazy_texts(args.input, text_column)
+    if state is None:
+        scorer = IncrementalScorer(index, load_profanity_words(args.words), texts=texts)
+    else:
+        scorer = IncrementalScorer(index, state['words'], state['hits'], texts=texts)
+    print(f"Loaded index of {len(index):,} messages in {time.perf_counter() - start:.2f}s")
+    print()
+    return index, scorer
+
+
+def update(args):
+    """Apply the diff between the indexed word list and the word-list file."""
+    index, scorer = load(args)
+    before = scorer.metrics()
+    start = time.perf_counter()
+    diff = scorer.update(load_profanity_words(args.words))
+    elapsed = time.perf_counter() - start
+
+    print("=" * 70)
+    print("WORD-LIST UPDATE")
+    print("=" * 70)
+    print(f"Added:   {', '.join(diff['added']) or '-'}")
+    print(f"Removed: {', '.join(diff['removed']) or '-'}")
+    print(f"Rows newly flagged: {len(diff['flagged']):,}, no longer flagged: "
+          f"{len(diff['unflagged']):,} (updated in {elapsed * 1e3:.1f} ms)")
+    print()
+    print_metrics("Before", before)
+    print_metrics("After", scorer.metrics())
+    index.save(args.index, scorer.state())
+    print()
+    print(f"✓ Saved index to {args.index}")
+
+
+def what_if(args):
+    """Preview the effect of adding each term, without changing the saved state."""
+    index, scorer = load(args)
+    current = scorer.metrics()
+    print("=" * 70)
+    print(f"WHAT-IF ({'substring' if args.substring else 'whole word'} match)")
+    print("=" * 70)
+    print_metrics("Current", current)
+    print()
+    print(f"{'Term':<14} {'Rows':<8} {'New':<8} {'Term prec.':<11} {'Precision':<17} "
+          f"{'Recall':<17} {'ms':<6}")
+    print("-" * 70)
+    for term in args.terms:
+        start = time.perf_counter()
+        result = scorer.what_if(term, substring=args.substring)
+        elapsed = time.perf_counter() - start
+        metrics = result['metrics']
+        print(f"{term:<14} {result['rows']:<8,} {result['new_rows']:<8,} "
+              f"{result['term_precision']:<11.3f} "
+              f"{current['precision']:.3f} -> {metrics['precision']:<8.3f} "
+              f"{current['recall']:.3f} -> {metrics['recall']:<8.3f} {elapsed * 1e3:<6.2f}")
+    print()
+
+
+def main():
+    args = parse_args()
+    {'build': build, 'update': update, 'what-if': what_if}[args.command](args)
+
+
+if __name__ == '__main__':
+    main()
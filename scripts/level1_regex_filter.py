@@ -1,95 +1,252 @@
-import pandas as pd
-import re
+import argparse
 
-# Load profanity words
-print("Loading profanity words...")
-with open('data/profanity_words.txt', 'r') as f:
-    profanity_words = [line.strip().lower() for line in f if line.strip()]
-
-print(f"Loaded {len(profanity_words)} profanity words:")
-print(profanity_words)
-print()
-
-# Create regex pattern with word boundaries
-pattern = r'\b(' + '|'.join(re.escape(word) for word in profanity_words) + r')\b'
-print(f"Regex pattern: {pattern}")
-print()
-
-# Load GameTox dataset (CSV, not TSV!)
-print("Loading GameTox dataset...")
-df = pd.read_csv('data/gametox.csv')
+from profanity_filter import ProfanityFilter, columnar, profiling
+from profanity_filter.dedup import DEDUP_MODES, Deduplicator
+from profanity_filter.fuzzy import FuzzyFilter
+from profanity_filter.multilingual import DEFAULT_LOCALES_DIR, MultilingualFilter
+from profanity_filter.rawscan import scan_raw
+from profanity_filter.redact import Redactor
+from profanity_filter.scoring import SeverityScorer
+from profanity_filter.streaming import scan_csv
 
 # Use correct column names
 text_column = 'message'
 label_column = 'label'
 
-# Convert to lowercase and flag
-df['text_lower'] = df[text_column].str.lower()
-df['flagged'] = df['text_lower'].str.contains(pattern, regex=True, na=False)
-
-# Get flagged messages
-flagged_messages = df[df['flagged']]
-
-# Print examples of flagged messages
-print("=" * 70)
-print("EXAMPLES OF FLAGGED MESSAGES (15 samples):")
-print("=" * 70)
-for idx, row in enumerate(flagged_messages.head(15).itertuples(), 1):
-    message = getattr(row, text_column)
-    label = getattr(row, label_column)
-    label_str = "TOXIC" if label == 1.0 else "CLEAN"
-    print(f"[{idx}] ({label_str}) {message}")
-print()
-
-# Calculate confusion matrix metrics
-# True Positive: flagged AND toxic (label == 1.0)
-# False Positive: flagged AND clean (label == 0.0)
-# True Negative: not flagged AND clean (label == 0.0)
-# False Negative: not flagged AND toxic (label == 1.0)
-
-true_positives = len(df[(df['flagged'] == True) & (df[label_column] == 1.0)])
-false_positives = len(df[(df['flagged'] == True) & (df[label_column] == 0.0)])
-true_negatives = len(df[(df['flagged'] == False) & (df[label_column] == 0.0)])
-false_negatives = len(df[(df['flagged'] == False) & (df[label_column] == 1.0)])
-
-total_messages = len(df)
-total_flagged = len(flagged_messages)
-
-# Calculate metrics
-accuracy = (true_positives + true_negatives) / total_messages if total_messages > 0 else 0
-precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0
-recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0
-
-# Print metrics
-print("=" * 70)
-print("METRICS:")
-print("=" * 70)
-print(f"Total messages in dataset: {total_messages}")
-print(f"Total messages flagged: {total_flagged}")
-print(f"Percentage flagged: {(total_flagged / total_messages * 100):.2f}%")
-print()
-print("Confusion Matrix:")
-print(f"  True Positives (flagged & toxic):     {true_positives}")
-print(f"  False Positives (flagged & clean):    {false_positives}")
-print(f"  True Negatives (not flagged & clean): {true_negatives}")
-print(f"  False Negatives (not flagged & toxic): {false_negatives}")
-print()
-print("Performance Metrics:")
-print(f"  Accuracy:  {accuracy:.4f} ({accuracy * 100:.2f}%)")
-print(f"  Precision: {precision:.4f} ({precision * 100:.2f}%)")
-print(f"  Recall:    {recall:.4f} ({recall * 100:.2f}%)")
-print()
-
-# Print examples of false positives
-false_positive_messages = df[(df['flagged'] == True) & (df[label_column] == 0.0)]
-print("=" * 70)
-print("EXAMPLES OF FALSE POSITIVES (10 samples):")
-print("=" * 70)
-for idx, message in enumerate(false_positive_messages[text_column].head(10), 1):
-    print(f"[{idx}] {message}")
-print()
-
-# Save flagged messages to CSV
-output_file = 'results/level1_flagged_messages.csv'
-flagged_messages[[text_column, label_column, 'flagged']].to_csv(output_file, index=False)
-print(f"✓ Saved {len(flagged_messages)} flagged messages to {output_file}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Level 1 regex filter on GameTox")
+    parser.add_argument('--input', default=None,
+                        help="GameTox CSV or Parquet (default: data/gametox.parquet if "
+                             "converted with convert_to_parquet.py, else data/gametox.csv)")
+    parser.add_argument('--output-format', choices=columnar.OUTPUT_FORMATS, default='csv',
+                        help="Format of the flagged-messages file (default: csv)")
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help="Stream the file in chunks of N rows (bounded memory)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Flag chunks in N worker processes (default: 1)")
+    parser.add_argument('--normalize', action='store_true',
+                        help="Undo leetspeak/separators/repeats before matching (sh1t, f.u.c.k)")
+    parser.add_argument('--dedup', choices=DEDUP_MODES, default=None,
+                        help="Flag each distinct message once ('exact') or also merge "
+                             "near-duplicates with MinHash ('near', only between messages the "
+                             "word filter flags alike), then fan results out")
+    matching = parser.add_mutually_exclusive_group()
+    matching.add_argument('--scores', default=None,
+                          help="Scored word list (e.g. data/profanity_scores.csv): adds severity "
+                               "score and allow/review/block tier to flagged rows")
+    matching.add_argument('--fuzzy', type=int, default=0, metavar='K',
+                          help="Also flag misspellings within edit distance K (fuk, biatch)")
+    matching.add_argument('--locales', nargs='?', const=str(DEFAULT_LOCALES_DIR), default=None,
+                          metavar='DIR',
+                          help="Add per-locale word lists (DIR/<locale>.txt, default: "
+                               f"{DEFAULT_LOCALES_DIR}), each message checked against the "
+                               "locales it is detected in; matchers load on first use")
+    parser.add_argument('--redact', action='store_true',
+                        help="Add a 'redacted' column (matched words masked, e.g. f***) "
+                             "to the flagged messages")
+    parser.add_argument('--raw', action='store_true',
+                        help="Memory-map a 'label<TAB>message' log (see export_raw_log.py) and "
+                             "only decode lines the bytes matcher hits (default input: "
+                             "data/gametox.log)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args()
+    if args.raw:
+        conflicts = [option for option, used in [
+            ('--normalize', args.normalize), ('--fuzzy', args.fuzzy), ('--scores', args.scores),
+            ('--dedup', args.dedup), ('--workers', args.workers > 1),
+            ('--chunksize', args.chunksize), ('--redact', args.redact),
+            ('--locales', args.locales)] if used]
+        if conflicts:
+            parser.error(f"--raw cannot be combined with {', '.join(conflicts)}")
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.raw:
+        input_file = args.input or 'data/gametox.log'
+    else:
+        input_file = args.input or columnar.resolve_dataset('data/gametox.csv')
+    session = profiling.ProfilingSession.from_args(args, 'level1_regex_filter')
+
+    # Load profanity words
+    print("Loading profanity words...")
+    scorer = None
+    if args.scores:
+        scorer = SeverityScorer.from_file(args.scores, normalize=args.normalize)
+        word_filter = scorer.word_filter
+    elif args.locales:
+        word_filter = MultilingualFilter.from_directory(args.locales, normalize=args.normalize)
+    elif args.fuzzy:
+        word_filter = FuzzyFilter.from_file('data/profanity_words.txt', max_distance=args.fuzzy,
+                                            normalize=args.normalize)
+    else:
+        word_filter = ProfanityFilter.from_file('data/profanity_words.txt', normalize=args.normalize)
+    with profiling.stage('build_matcher'):
+        profanity_words = word_filter.words
+
+    print(f"Loaded {len(profanity_words)} profanity words:")
+    print(profanity_words)
+    print()
+
+    # Compiled regex pattern (built once by the filter)
+    if args.locales:
+        print(f"Locales: {', '.join(word_filter.locales)} (always checked: "
+              f"{', '.join(word_filter.default_locales)}; others by detection)")
+    else:
+        pattern = word_filter.pattern
+        print(f"Regex pattern: {pattern}")
+    if args.normalize:
+        print("Normalization: leetspeak, separators, confusables, repeated letters")
+    if args.fuzzy:
+        print(f"Fuzzy matching: edit distance <= {args.fuzzy} "
+              f"({len(word_filter.allow_words)} allow-listed real words)")
+    print()
+
+    # Load GameTox dataset (CSV, not TSV!) and flag it, chunk by chunk if requested
+    if args.workers > 1:
+        print(f"Flagging with {args.workers} worker processes...")
+    if columnar.is_parquet(input_file):
+        print(f"Reading columnar dataset {input_file}")
+    if args.raw:
+        print(f"Memory-mapping raw log {input_file}...")
+    elif args.chunksize:
+        print(f"Streaming GameTox dataset in chunks of {args.chunksize:,} rows...")
+    else:
+        print("Loading GameTox dataset...")
+    # Near-duplicates only share a verdict when the word filter agrees on both
+    deduplicator = Deduplicator.from_mode(args.dedup, word_filter=word_filter)
+    redactor = Redactor(word_filter) if args.redact else None
+    output_file = columnar.with_format('results/level1_flagged_messages.csv', args.output_format)
+    if args.raw:
+        result = scan_raw(input_file, word_filter, output_file=output_file,
+                          text_column=text_column, label_column=label_column)
+    else:
+        result = scan_csv(input_file, word_filter, text_column, label_column,
+                          output_file=output_file, chunksize=args.chunksize,
+                          workers=args.workers, scorer=scorer, deduplicator=deduplicator,
+                          redactor=redactor)
+
+    # Print examples of flagged messages
+    print("=" * 70)
+    print("EXAMPLES OF FLAGGED MESSAGES (15 samples):")
+    print("=" * 70)
+    for idx, row in enumerate(result['flagged_examples'][:15], 1):
+        label_str = "TOXIC" if row[label_column] == 1.0 else "CLEAN"
+        print(f"[{idx}] ({label_str}) {row[text_column]}")
+        if redactor is not None:
+            print(f"      redacted: {row['redacted']}")
+    print()
+
+    # Confusion matrix metrics
+    # True Positive: flagged AND toxic (label == 1.0)
+    # False Positive: flagged AND clean (label == 0.0)
+    # True Negative: not flagged AND clean (label == 0.0)
+    # False Negative: not flagged AND toxic (label == 1.0)
+    true_positives = result['tp']
+    false_positives = result['fp']
+    true_negatives = result['tn']
+    false_negatives = result['fn']
+
+    total_messages = result['total']
+    total_flagged = result['flagged']
+
+    # Calculate metrics (precision/recall/F1 from the vectorized accumulator)
+    confusion = result['confusion']
+    metrics = confusion.metrics()
+    accuracy = (true_positives + true_negatives) / total_messages if total_messages > 0 else 0
+    precision = metrics['precision']
+    recall = metrics['recall']
+    f1 = metrics['f1']
+
+    # Print metrics
+    print("=" * 70)
+    print("METRICS:")
+    print("=" * 70)
+    print(f"Total messages in dataset: {total_messages}")
+    print(f"Total messages flagged: {total_flagged}")
+    print(f"Percentage flagged: {(total_flagged / total_messages * 100):.2f}%")
+    if deduplicator is not None:
+        stats = deduplicator.stats
+        print(f"Dedup ({args.dedup}): flagged {stats['unique']:,} representatives for "
+              f"{stats['rows']:,} rows ({deduplicator.ratio:.1f}x, "
+              f"{stats['exact_unique']:,} exact-distinct; grouping took {stats['seconds']:.3f}s)")
+    if args.raw:
+        print(f"Raw scan ({result['engine']}): {result['bytes'] / 1e6:,.1f} MB in "
+              f"{result['seconds']:.3f}s "
+              f"({result['mb_per_second']:,.1f} MB/s), decoded {result['candidates']:,} "
+              f"candidate lines")
+    if args.locales and word_filter.stats['messages']:
+        routed = ', '.join(f"{locale} {count:,}"
+                           for locale, count in word_filter.stats['routed'].items() if count)
+        print(f"Locale routing (messages per matcher): {routed}; "
+              f"matchers loaded: {', '.join(word_filter.loaded_locales)}")
+    print()
+    print("Confusion Matrix:")
+    print(f"  True Positives (flagged & toxic):     {true_positives}")
+    print(f"  False Positives (flagged & clean):    {false_positives}")
+    print(f"  True Negatives (not flagged & clean): {true_negatives}")
+    print(f"  False Negatives (not flagged & toxic): {false_negatives}")
+    print()
+    print("Performance Metrics:")
+    print(f"  Accuracy:  {accuracy:.4f} ({accuracy * 100:.2f}%)")
+    print(f"  Precision: {precision:.4f} ({precision * 100:.2f}%)")
+    print(f"  Recall:    {recall:.4f} ({recall * 100:.2f}%)")
+    print(f"  F1:        {f1:.4f}")
+    print()
+
+    # Breakdown by message length
+    print("=" * 70)
+    print("BREAKDOWN BY MESSAGE LENGTH (characters):")
+    print("=" * 70)
+    print(f"{'Length':<10} {'Messages':<10} {'TP':<8} {'FP':<8} {'FN':<8} {'Precision':<11} {'Recall':<8}")
+    print("-" * 70)
+    for bucket, bucket_metrics in confusion.group_metrics('length').items():
+        total = sum(bucket_metrics[key] for key in ('tp', 'fp', 'tn', 'fn'))
+        print(f"{bucket:<10} {total:<10} {bucket_metrics['tp']:<8} {bucket_metrics['fp']:<8} "
+              f"{bucket_metrics['fn']:<8} {bucket_metrics['precision']:<11.3f} {bucket_metrics['recall']:<8.3f}")
+    print()
+
+    # Breakdown by matched word (first match per flagged message)
+    print("=" * 70)
+    print("BREAKDOWN BY MATCHED WORD:")
+    print("=" * 70)
+    print(f"{'Word':<12} {'Flagged':<10} {'TP':<8} {'FP':<8} {'Precision':<10}")
+    print("-" * 70)
+    for word, word_metrics in confusion.group_metrics('word').items():
+        flagged = word_metrics['tp'] + word_metrics['fp']
+        if flagged:
+            print(f"{word:<12} {flagged:<10} {word_metrics['tp']:<8} {word_metrics['fp']:<8} "
+                  f"{word_metrics['precision']:<10.3f}")
+    print()
+
+    if scorer is not None:
+        # Breakdown by severity tier (mild hits are candidates for auto-allow)
+        print("=" * 70)
+        print("BREAKDOWN BY SEVERITY TIER:")
+        print("=" * 70)
+        print(f"Thresholds: review >= {scorer.thresholds[0]}, block >= {scorer.thresholds[1]}")
+        print(f"{'Tier':<12} {'Flagged':<10} {'TP':<8} {'FP':<8} {'Precision':<10}")
+        print("-" * 70)
+        for tier_name, tier_metrics in confusion.group_metrics('tier').items():
+            flagged = tier_metrics['tp'] + tier_metrics['fp']
+            print(f"{tier_name:<12} {flagged:<10} {tier_metrics['tp']:<8} {tier_metrics['fp']:<8} "
+                  f"{tier_metrics['precision']:<10.3f}")
+        print()
+
+    # Print examples of false positives
+    print("=" * 70)
+    print("EXAMPLES OF FALSE POSITIVES (10 samples):")
+    print("=" * 70)
+    for idx, row in enumerate(result['false_positive_examples'][:10], 1):
+        print(f"[{idx}] {row[text_column]}")
+    print()
+
+    # Flagged messages were written to CSV as they were found
+    print(f"✓ Saved {total_flagged} flagged messages to {output_file}")
+    session.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,59 +1,105 @@
-import pandas as pd
-import re
+import argparse
 
-# Load profanity words
-print("Loading profanity words...")
-with open('data/profanity_words.txt', 'r') as f:
-    profanity_words = [line.strip().lower() for line in f if line.strip()]
+from profanity_filter import ProfanityFilter, columnar
+from profanity_filter.streaming import scan_csv
+from profanity_filter.substring import DEFAULT_ALLOWLIST_FILE, UsernameScanner
 
-print(f"Loaded {len(profanity_words)} profanity words")
-print()
+# Use the correct column name from explore_usernames.py
+username_column = 'author'
 
-# Create regex pattern (same as before)
-pattern = r'\b(' + '|'.join(re.escape(word) for word in profanity_words) + r')\b'
-print(f"Regex pattern: {pattern}")
-print()
 
-# Load Reddit usernames
-print("Loading Reddit usernames dataset...")
-df = pd.read_csv('data/reddit_usernames.csv')
+def parse_args():
+    parser = argparse.ArgumentParser(description="Level 1 regex filter on Reddit usernames")
+    parser.add_argument('--input', default=None,
+                        help="Usernames CSV or Parquet (default: data/reddit_usernames.parquet "
+                             "if converted, else data/reddit_usernames.csv)")
+    parser.add_argument('--output-format', choices=columnar.OUTPUT_FORMATS, default='csv',
+                        help="Format of the flagged-usernames file (default: csv)")
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help="Stream the file in chunks of N rows (bounded memory)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Flag chunks in N worker processes (default: 1)")
+    parser.add_argument('--engine', choices=['substring', 'word'], default='substring',
+                        help="substring: embedded words with allow-list (default); "
+                             "word: whole-word regex only")
+    parser.add_argument('--allowlist', default=str(DEFAULT_ALLOWLIST_FILE),
+                        help="Allow-list for the substring engine (default: data/username_allowlist.txt)")
+    parser.add_argument('--dictionary', default=None,
+                        help="Compiled dictionary (.pfd) supplying words and allow-list for the "
+                             "substring engine (see scripts/profanity_dict.py)")
+    args = parser.parse_args()
+    if args.dictionary and args.engine != 'substring':
+        parser.error("--dictionary requires --engine substring")
+    return args
+
+
+def main():
+    args = parse_args()
+    input_file = args.input or columnar.resolve_dataset('data/reddit_usernames.csv')
+
+    # Load profanity words
+    print("Loading profanity words...")
+    if args.engine == 'substring' and args.dictionary:
+        word_filter = UsernameScanner.from_dictionary(args.dictionary)
+    elif args.engine == 'substring':
+        word_filter = UsernameScanner.from_files('data/profanity_words.txt', args.allowlist)
+    else:
+        word_filter = ProfanityFilter.from_file('data/profanity_words.txt')
+    profanity_words = word_filter.words
+
+    print(f"Loaded {len(profanity_words)} profanity words")
+    if args.engine == 'substring':
+        allow_source = args.dictionary or args.allowlist
+        print(f"Loaded {len(word_filter.allow_words)} allow-listed words from {allow_source}")
+    print()
+
+    # Compiled regex pattern (built once by the filter)
+    pattern = word_filter.pattern
+    print(f"Regex pattern ({args.engine}): {pattern}")
+    print()
+
+    # Load Reddit usernames and flag them, chunk by chunk if requested
+    if args.workers > 1:
+        print(f"Flagging with {args.workers} worker processes...")
+    if columnar.is_parquet(input_file):
+        print(f"Reading columnar dataset {input_file}")
+    if args.chunksize:
+        print(f"Streaming Reddit usernames in chunks of {args.chunksize:,} rows...")
+    else:
+        print("Loading Reddit usernames dataset...")
+    output_file = columnar.with_format('results/level1_flagged_usernames.csv', args.output_format)
+    result = scan_csv(input_file, word_filter, username_column,
+                      output_file=output_file, chunksize=args.chunksize,
+                      workers=args.workers, explain=True)
+
+    print(f"Dataset scanned: {result['total']} usernames")
+    print()
+
+    # Calculate statistics
+    total_usernames = result['total']
+    total_flagged = result['flagged']
+    percentage_flagged = (total_flagged / total_usernames) * 100 if total_usernames > 0 else 0
+
+    # Print statistics
+    print("=" * 70)
+    print("STATISTICS:")
+    print("=" * 70)
+    print(f"Total usernames: {total_usernames:,}")
+    print(f"Flagged usernames: {total_flagged:,}")
+    print(f"Percentage flagged: {percentage_flagged:.4f}%")
+    print()
+
+    # Print first 30 flagged usernames
+    print("=" * 70)
+    print("FIRST 30 FLAGGED USERNAMES:")
+    print("=" * 70)
+    for idx, row in enumerate(result['flagged_examples'][:30], 1):
+        print(f"[{idx}] {row[username_column]:<30} {row['matches']}")
+    print()
+
+    # Flagged usernames were written to CSV as they were found
+    print(f"✓ Saved {total_flagged:,} flagged usernames to {output_file}")
 
-# Use the correct column name from explore_usernames.py
-username_column = 'author'
 
-print(f"Dataset loaded: {len(df)} usernames")
-print()
-
-# Convert to lowercase and flag
-df['username_lower'] = df[username_column].str.lower()
-df['flagged'] = df['username_lower'].str.contains(pattern, regex=True, na=False)
-
-# Get flagged usernames
-flagged_usernames = df[df['flagged']]
-
-# Calculate statistics
-total_usernames = len(df)
-total_flagged = len(flagged_usernames)
-percentage_flagged = (total_flagged / total_usernames) * 100 if total_usernames > 0 else 0
-
-# Print statistics
-print("=" * 70)
-print("STATISTICS:")
-print("=" * 70)
-print(f"Total usernames: {total_usernames:,}")
-print(f"Flagged usernames: {total_flagged:,}")
-print(f"Percentage flagged: {percentage_flagged:.4f}%")
-print()
-
-# Print first 30 flagged usernames
-print("=" * 70)
-print("FIRST 30 FLAGGED USERNAMES:")
-print("=" * 70)
-for idx, username in enumerate(flagged_usernames[username_column].head(30), 1):
-    print(f"[{idx}] {username}")
-print()
-
-# Save flagged usernames to CSV
-output_file = 'results/level1_flagged_usernames.csv'
-flagged_usernames[[username_column, 'flagged']].to_csv(output_file, index=False)
-print(f"✓ Saved {total_flagged:,} flagged usernames to {output_file}")
+if __name__ == '__main__':
+    main()
@@ -1,21 +1,36 @@
 """
 Level 2 - LLM-based Profanity Classifier
 Uses OpenRouter API to classify 50 messages as toxic or clean.
+Requests run concurrently under a rate limit (see profanity_filter.async_llm).
 Calculates accuracy, precision, recall, and confusion matrix.
 """
 
+import argparse
+import asyncio
 import os
 import time
-import pandas as pd
 from dotenv import load_dotenv
-from openai import OpenAI
-
-def load_prompt_template():
+from openai import AsyncOpenAI
+
+from profanity_filter import get_default_filter, profiling
+from profanity_filter.async_llm import (
+    DEFAULT_MODEL,
+    OPENROUTER_BASE_URL,
+    AsyncLLMClassifier,
+    parse_classification,
+)
+from profanity_filter.cache import VerdictCache
+from profanity_filter.columnar import read_table, write_table
+from profanity_filter.dedup import DEDUP_MODES, Deduplicator
+from profanity_filter.metrics import calculate_metrics as confusion_metrics
+
+def load_prompt_template(path="data/prompt_template.txt"):
     """Load the prompt template from file."""
-    with open("data/prompt_template.txt", "r") as f:
+    with open(path, "r") as f:
         return f.read()
 
-def get_llm_classification(client, prompt_template, message_text):
+def get_llm_classification(client, prompt_template, message_text, cache=None,
+                           raise_errors=False):
     """
     Use LLM via OpenRouter to classify a single message.
 
@@ -23,16 +38,23 @@ def get_llm_classification(client, prompt_template, message_text):
         client: OpenAI client configured for OpenRouter
         prompt_template: The prompt template with {message} placeholder
         message_text: The message to classify
+        cache: Optional VerdictCache; repeated messages skip the API call
+        raise_errors: Re-raise API errors instead of defaulting to TOXIC
 
     Returns:
         int: 1 for TOXIC, 0 for CLEAN
     """
+    if cache is not None:
+        cached = cache.get(message_text, DEFAULT_MODEL, prompt_template)
+        if cached is not None:
+            return cached
+
     # Fill in the prompt template
     prompt = prompt_template.replace("{message}", message_text)
 
     try:
         response = client.chat.completions.create(
-            model="meta-llama/llama-3.3-70b-instruct:free",
+            model=DEFAULT_MODEL,
             messages=[
                 {
                     "role": "user",
@@ -42,19 +64,15 @@ def get_llm_classification(client, prompt_template, message_text):
             max_tokens=10
         )
 
-        # Extract and parse the response
-        llm_response = response.choices[0].message.content.strip().upper()
-
-        # Parse response
-        if "TOXIC" in llm_response:
-            return 1
-        elif "CLEAN" in llm_response:
-            return 0
-        else:
-            # If unclear, default to TOXIC (safer for moderation)
-            return 1
+        # Extract and parse the response (unclear replies default to TOXIC)
+        prediction = parse_classification(response.choices[0].message.content)
+        if cache is not None:
+            cache.put(message_text, DEFAULT_MODEL, prompt_template, prediction)
+        return prediction
 
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"    API Error: {str(e)[:50]}... - Defaulting to TOXIC")
         # On error, default to TOXIC (safer for moderation)
         return 1
@@ -69,38 +87,44 @@ def calculate_metrics(df):
     Returns:
         dict: Dictionary containing all metrics
     """
-    # Convert labels to binary (1.0 -> 1, 0.0 -> 0)
-    actual = (df['label'] == 1.0).astype(int)
-    predicted = df['llm_prediction']
-
-    # Calculate confusion matrix components
-    tp = ((actual == 1) & (predicted == 1)).sum()  # True Positives
-    fp = ((actual == 0) & (predicted == 1)).sum()  # False Positives
-    tn = ((actual == 0) & (predicted == 0)).sum()  # True Negatives
-    fn = ((actual == 1) & (predicted == 0)).sum()  # False Negatives
-
-    # Calculate metrics
-    total = len(df)
-    correct = tp + tn
-    accuracy = correct / total if total > 0 else 0
-
-    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-    recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-
-    return {
-        'total': total,
-        'correct': correct,
-        'tp': tp,
-        'fp': fp,
-        'tn': tn,
-        'fn': fn,
-        'accuracy': accuracy,
-        'precision': precision,
-        'recall': recall
-    }
+    # Confusion matrix in one vectorized pass (shared with the Level 1 scripts)
+    metrics = confusion_metrics(df['label'], df['llm_prediction'])
+    metrics['total'] = len(df)
+    metrics['correct'] = metrics['tp'] + metrics['tn']
+    return metrics
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Level 2 LLM classifier")
+    parser.add_argument('--input', default="data/gametox_sample_50.csv",
+                        help="Messages CSV or Parquet (default: data/gametox_sample_50.csv)")
+    parser.add_argument('--base-url', default=OPENROUTER_BASE_URL,
+                        help="OpenAI-compatible API base URL (default: OpenRouter)")
+    parser.add_argument('--concurrency', type=int, default=5,
+                        help="Maximum requests in flight (default: 5)")
+    parser.add_argument('--rpm', type=float, default=20,
+                        help="Requests per minute rate limit (default: 20, OpenRouter free tier)")
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help="Messages per request using data/prompt_template_batch.txt (default: 1)")
+    parser.add_argument('--cache', default="data/llm_verdict_cache.sqlite",
+                        help="SQLite verdict cache (default: data/llm_verdict_cache.sqlite)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Always call the API, never read or write the cache")
+    parser.add_argument('--cache-ttl', type=float, default=None,
+                        help="Seconds before cached verdicts expire (default: never)")
+    parser.add_argument('--dedup', choices=DEDUP_MODES, default=None,
+                        help="Classify each distinct message once ('exact') or also merge "
+                             "near-duplicates with MinHash ('near', never across word-list "
+                             "hits and clean lines), then fan verdicts out")
+    parser.add_argument('--output', default="results/level2_llm_predictions.csv",
+                        help="Where to save predictions, .csv or .parquet "
+                             "(default: results/level2_llm_predictions.csv)")
+    profiling.add_arguments(parser)
+    return parser.parse_args()
 
 def main():
     """Main function to run the LLM classifier."""
+    args = parse_args()
+    session = profiling.ProfilingSession.from_args(args, 'level2_llm_classifier')
 
     # Load environment variables
     load_dotenv()
@@ -108,35 +132,52 @@ def main():
     api_key = os.getenv("OPENROUTER_API_KEY")
 
     if not api_key:
-        print("❌ ERROR: OPENROUTER_API_KEY not found in .env file")
-        return
+        if args.base_url == OPENROUTER_BASE_URL:
+            print("❌ ERROR: OPENROUTER_API_KEY not found in .env file")
+            return
+        api_key = "local"  # local OpenAI-compatible servers don't check keys
 
-    # Initialize OpenAI client with OpenRouter
-    client = OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key
-    )
-
-    # Load prompt template
+    # Load prompt template(s)
     prompt_template = load_prompt_template()
-
-    # Load the 50-message sample
-    df = pd.read_csv("data/gametox_sample_50.csv")
-
-    print(f"Processing {len(df)} messages...")
-    print("This will take about 2-3 minutes...")
+    batch_prompt_template = None
+    if args.batch_size > 1:
+        batch_prompt_template = load_prompt_template("data/prompt_template_batch.txt")
+
+    # Load the message sample
+    with profiling.stage('csv_load'):
+        df = read_table(args.input)
+    messages = df['message']
+    profiling.count('rows', len(df))
+
+    # Only one representative per duplicate group goes to the LLM
+    # A word-list hit is never merged into a clean line's group (or vice versa)
+    deduplicator = Deduplicator.from_mode(args.dedup, word_filter=get_default_filter())
+    groups = None
+    rows = range(len(df))
+    if deduplicator is not None:
+        with profiling.stage('dedup'):
+            groups = deduplicator(messages)
+        messages = groups.representatives(messages)
+        rows = groups.positions
+    total = len(messages)
+
+    if groups is not None:
+        print(f"Dedup ({args.dedup}): {len(df)} rows -> {total} unique messages")
+    print(f"Processing {total} messages...")
+    print(f"Concurrency: {args.concurrency}, rate limit: {args.rpm:g} requests/minute, "
+          f"batch size: {args.batch_size}")
     print()
 
-    # Process each message
-    predictions = []
+    cache = None if args.no_cache else VerdictCache(args.cache, ttl=args.cache_ttl)
 
-    for idx, row in df.iterrows():
-        message = row['message']
-        actual_label = row['label']
+    done = 0
 
-        # Get LLM prediction
-        prediction = get_llm_classification(client, prompt_template, message)
-        predictions.append(prediction)
+    def report(idx, prediction):
+        nonlocal done
+        done += 1
+        idx = rows[idx]
+        actual_label = df['label'].iloc[idx]
+        message = str(df['message'].iloc[idx])
 
         # Prepare display strings
         actual_str = "TOXIC" if actual_label == 1.0 else "CLEAN"
@@ -146,16 +187,51 @@ def main():
         # Truncate message for display
         message_display = message[:50] if len(message) <= 50 else message[:47] + "..."
 
-        # Print progress
-        print(f"{idx + 1}/50 {correct} Actual: {actual_str} | Predicted: {pred_str} | '{message_display}'")
-
-        # Sleep to respect rate limits (except on last message)
-        if idx < len(df) - 1:
-            time.sleep(3)
-
-    # Add predictions to dataframe
+        # Print progress (messages complete out of order; predictions keep input order)
+        print(f"{done}/{total} {correct} Actual: {actual_str} | Predicted: {pred_str} | '{message_display}'")
+
+    async def classify_all():
+        # Async OpenAI client (retries and backoff handled by the classifier)
+        async with AsyncOpenAI(base_url=args.base_url, api_key=api_key, max_retries=0) as client:
+            classifier = AsyncLLMClassifier(
+                client,
+                prompt_template,
+                concurrency=args.concurrency,
+                requests_per_minute=args.rpm,
+                cache=cache,
+                batch_size=args.batch_size,
+                batch_prompt_template=batch_prompt_template
+            )
+            predictions = await classifier.classify_many(messages.tolist(), on_result=report)
+            return predictions, classifier.stats
+
+    # Classify all messages concurrently; results come back in input order
+    start = time.perf_counter()
+    with profiling.stage('classify'):
+        predictions, stats = asyncio.run(classify_all())
+    elapsed = time.perf_counter() - start
+    if cache is not None:
+        cache.close()
+
+    # Add predictions to dataframe (fanned out to duplicates)
+    if groups is not None:
+        predictions = groups.expand(predictions)
     df['llm_prediction'] = predictions
 
+    print()
+    print(f"API requests: {stats['requests']} "
+          f"(rate limited: {stats['rate_limited']}, "
+          f"server errors: {stats['server_errors']}, "
+          f"failures: {stats['failures']}, batch fallbacks: {stats['batch_fallbacks']})")
+    if cache is not None:
+        print(f"Verdict cache: {stats['cache_hits']} hits, "
+              f"{cache.stats['misses']} misses ({cache.hit_rate * 100:.1f}% hit rate)")
+    if groups is not None:
+        skipped = len(df) - total
+        per_message = elapsed / total if total else 0.0
+        print(f"Dedup: classified {total} of {len(df)} rows ({deduplicator.ratio:.1f}x), "
+              f"skipped {skipped} classifications "
+              f"(~{skipped * per_message:.1f}s saved at {per_message:.2f}s per message)")
     print()
     print("=" * 60)
     print("LEVEL 2 - LLM CLASSIFIER RESULTS")
@@ -178,9 +254,11 @@ def main():
     print()
 
     # Save results
-    output_path = "results/level2_llm_predictions.csv"
-    df.to_csv(output_path, index=False)
+    output_path = args.output
+    with profiling.stage('output_write'):
+        write_table(df, output_path)
     print(f"Detailed results saved to: {output_path}")
+    session.finish()
 
 if __name__ == "__main__":
     main()
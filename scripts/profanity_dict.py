@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Build and inspect compiled binary dictionaries (see profanity_filter.compiled).
+
+Usage:
+    python scripts/profanity_dict.py compile
+    python scripts/profanity_dict.py compile --words data/profanity_words.txt \
+        --allowlist data/username_allowlist.txt --variants data/variants.txt \
+        --output data/profanity_words.pfd
+    python scripts/profanity_dict.py info data/profanity_words.pfd
+"""
+
+import argparse
+import json
+import time
+
+from profanity_filter.compiled import DEFAULT_DICTIONARY_FILE, CompiledFilter, compile_dictionary
+from profanity_filter.substring import DEFAULT_ALLOWLIST_FILE
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compiled profanity dictionaries")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('compile', help="Compile a word list into a binary dictionary")
+    build.add_argument('--words', default='data/profanity_words.txt',
+                       help="Word list (default: data/profanity_words.txt)")
+    build.add_argument('--allowlist', default=str(DEFAULT_ALLOWLIST_FILE),
+                       help="Allow-list (default: data/username_allowlist.txt, if present)")
+    build.add_argument('--variants', default=None,
+                       help="Variants file with `canonical: variant, variant` lines")
+    build.add_argument('--output', default=str(DEFAULT_DICTIONARY_FILE),
+                       help="Output file (default: data/profanity_words.pfd)")
+
+    info = commands.add_parser('info', help="Show a compiled dictionary's metadata")
+    info.add_argument('path', nargs='?', default=str(DEFAULT_DICTIONARY_FILE))
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.command == 'compile':
+        start = time.perf_counter()
+        meta = compile_dictionary(args.words, args.output, args.allowlist, args.variants)
+        seconds = time.perf_counter() - start
+        print(f"✓ Compiled {meta['words']:,} words ({meta['keys']:,} keys with variants, "
+              f"{meta['allow']:,} allow-listed) to {args.output} in {seconds:.3f}s")
+        if meta['skipped']:
+            print(f"  Skipped {len(meta['skipped'])} entries with non-word characters: "
+                  f"{meta['skipped'][:10]}")
+        return
+
+    word_filter = CompiledFilter(args.path)
+    print(json.dumps(word_filter.meta, indent=2))
+
+
+if __name__ == '__main__':
+    main()
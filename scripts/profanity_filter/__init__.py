@@ -0,0 +1,18 @@
+"""
+Reusable profanity filtering components shared by the project scripts.
+
+Importing this package is kept cheap (no pandas) so it can be loaded by
+long-lived services; see scripts/benchmark_import_time.py.
+"""
+
+from profanity_filter.filter import DEFAULT_WORDS_FILE, ProfanityFilter, get_default_filter
+from profanity_filter.matcher import WordMatcher, build_trie_pattern, load_profanity_words
+
+__all__ = [
+    'DEFAULT_WORDS_FILE',
+    'ProfanityFilter',
+    'WordMatcher',
+    'build_trie_pattern',
+    'get_default_filter',
+    'load_profanity_words',
+]
@@ -0,0 +1,359 @@
+"""
+Concurrent asyncio LLM classifier.
+
+Replaces the one-request-then-sleep(3) loop with:
+- a semaphore capping in-flight requests (concurrency)
+- a token bucket capping the request rate (requests per minute)
+- exponential backoff with jitter on 429 and 5xx responses
+
+With batch_size > 1, several messages share one numbered prompt and
+unparseable batch replies fall back to single-message calls.
+Identical messages in flight share a single request, and an optional
+VerdictCache (profanity_filter.cache) answers repeats without any request.
+Results are returned in input order. Point base_url at any
+OpenAI-compatible server (see scripts/fake_openai_server.py for a local one).
+"""
+
+import asyncio
+import random
+import re
+import time
+
+from profanity_filter import profiling
+from profanity_filter.cache import cache_key
+
+DEFAULT_MODEL = "meta-llama/llama-3.3-70b-instruct:free"
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+
+def parse_classification(llm_response):
+    """
+    Map a raw LLM reply to a label.
+
+    Returns:
+        int: 1 for TOXIC, 0 for CLEAN; unclear replies default to TOXIC
+             (safer for moderation)
+    """
+    llm_response = (llm_response or "").strip().upper()
+    if "TOXIC" in llm_response:
+        return 1
+    elif "CLEAN" in llm_response:
+        return 0
+    return 1
+
+
+_BATCH_LINE = re.compile(r'^\W*(\d+)\W+(TOXIC|CLEAN)\b', re.IGNORECASE | re.MULTILINE)
+
+
+def format_batch_prompt(batch_prompt_template, messages):
+    """Fill a batch template's {messages} placeholder with numbered lines."""
+    lines = []
+    for number, message in enumerate(messages, 1):
+        text = ' '.join(str(message).split())  # one message per line
+        lines.append(f'{number}. "{text}"')
+    return batch_prompt_template.replace("{messages}", "\n".join(lines))
+
+
+def parse_batch_classification(llm_response, count):
+    """
+    Parse a numbered "<n>: TOXIC|CLEAN" reply.
+
+    Returns:
+        list: `count` labels in message order, or None if any item is
+              missing or contradictory (callers fall back to single calls)
+    """
+    labels = {}
+    for number, verdict in _BATCH_LINE.findall(llm_response or ""):
+        number = int(number)
+        label = 1 if verdict.upper() == "TOXIC" else 0
+        if labels.setdefault(number, label) != label:
+            return None
+    if sorted(labels) != list(range(1, count + 1)):
+        return None
+    return [labels[number] for number in range(1, count + 1)]
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncLLMClassifier:
+    """
+    Classify many messages concurrently against an OpenAI-compatible API.
+
+    Example:
+        classifier = AsyncLLMClassifier(AsyncOpenAI(base_url=..., api_key=..., max_retries=0),
+                                        prompt_template, concurrency=5, requests_per_minute=20)
+        predictions = asyncio.run(classifier.classify_many(messages))
+    """
+
+    def __init__(self, client, prompt_template, model=DEFAULT_MODEL, concurrency=5,
+                 requests_per_minute=20, burst=1, max_retries=5, base_delay=1.0,
+                 max_delay=30.0, cache=None, batch_size=1, batch_prompt_template=None):
+        """
+        Args:
+            client: openai.AsyncOpenAI client (create it with max_retries=0 so
+                    retries are handled here)
+            prompt_template: Prompt with a {message} placeholder
+            model: Model name sent with every request
+            concurrency: Maximum requests in flight
+            requests_per_minute: Token-bucket rate; None disables rate limiting
+            burst: Token-bucket capacity
+            max_retries: Retries on 429/5xx/connection errors before giving up
+            base_delay: First backoff delay in seconds (doubled per retry)
+            max_delay: Upper bound for a single backoff delay
+            cache: Optional VerdictCache consulted before every request
+            batch_size: Messages per request; > 1 needs batch_prompt_template
+            batch_prompt_template: Prompt with a {messages} placeholder asking
+                                   for numbered "<n>: TOXIC|CLEAN" lines
+        """
+        if batch_size > 1 and not batch_prompt_template:
+            raise ValueError("batch_size > 1 requires a batch_prompt_template")
+        self.client = client
+        self.prompt_template = prompt_template
+        self.model = model
+        self.concurrency = concurrency
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.cache = cache
+        self.batch_size = batch_size
+        self.batch_prompt_template = batch_prompt_template
+        self.stats = {'requests': 0, 'cache_hits': 0, 'coalesced': 0, 'rate_limited': 0,
+                      'server_errors': 0, 'retries': 0, 'failures': 0,
+                      'batches': 0, 'batch_fallbacks': 0}
+
+    async def classify_many(self, messages, on_result=None):
+        """
+        Classify every message concurrently.
+
+        Args:
+            messages: Iterable of message strings
+            on_result: Optional callback(index, prediction) as results arrive
+
+        Returns:
+            list: Predictions (1 = TOXIC, 0 = CLEAN) in input order
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        bucket = None
+        if self.requests_per_minute:
+            bucket = TokenBucket(self.requests_per_minute / 60.0, self.burst)
+
+        if self.batch_size > 1:
+            return await self._classify_many_batched(messages, on_result, semaphore, bucket)
+
+        # Identical (normalized) messages in flight share one request
+        inflight = {}
+
+        async def request(message):
+            async with semaphore:
+                return await self._classify_with_retries(message, bucket)
+
+        async def run(index, message):
+            prediction = self._cached(message)
+            if prediction is None:
+                key = self._key(message)
+                task = inflight.get(key)
+                if task is None:
+                    task = inflight[key] = asyncio.ensure_future(request(message))
+                else:
+                    self.stats['coalesced'] += 1
+                prediction = await task
+            if on_result is not None:
+                on_result(index, prediction)
+            return prediction
+
+        return await asyncio.gather(*(run(i, m) for i, m in enumerate(messages)))
+
+    async def _classify_many_batched(self, messages, on_result, semaphore, bucket):
+        """Send unique uncached messages batch_size at a time."""
+        messages = list(messages)
+        predictions = [None] * len(messages)
+        pending = {}  # key -> (message, [indices]) in first-seen order
+
+        for index, message in enumerate(messages):
+            prediction = self._cached(message, self.batch_prompt_template)
+            if prediction is not None:
+                predictions[index] = prediction
+                if on_result is not None:
+                    on_result(index, prediction)
+                continue
+            key = self._key(message)
+            if key in pending:
+                self.stats['coalesced'] += 1
+                pending[key][1].append(index)
+            else:
+                pending[key] = (message, [index])
+
+        entries = list(pending.values())
+        batches = [entries[i:i + self.batch_size] for i in range(0, len(entries), self.batch_size)]
+
+        async def run(batch):
+            batch_messages = [message for message, _ in batch]
+            async with semaphore:
+                labels = await self._classify_batch(batch_messages, bucket)
+            if labels is None:
+                # Unparseable or failed batch: fall back to one call per message
+                self.stats['batch_fallbacks'] += 1
+
+                async def single(message):
+                    async with semaphore:
+                        return await self._classify_with_retries(
+                            message, bucket, also_cache_under=self.batch_prompt_template)
+
+                labels = await asyncio.gather(*(single(m) for m in batch_messages))
+            for (_, indices), label in zip(batch, labels):
+                for index in indices:
+                    predictions[index] = label
+                    if on_result is not None:
+                        on_result(index, label)
+
+        await asyncio.gather(*(run(batch) for batch in batches))
+        return predictions
+
+    async def classify(self, message):
+        """Classify a single message (no shared rate limiter)."""
+        prediction = self._cached(message)
+        if prediction is None:
+            prediction = await self._classify_with_retries(message, None)
+        return prediction
+
+    def _key(self, message):
+        return cache_key(message, self.model, self.prompt_template) if self.cache else message
+
+    def _cached(self, message, prompt_template=None):
+        """Cached verdict for message under prompt_template (default: the single prompt)."""
+        if self.cache is None:
+            return None
+        with profiling.stage('cache_lookup'):
+            prediction = self.cache.get(message, self.model,
+                                        prompt_template or self.prompt_template)
+        if prediction is not None:
+            self.stats['cache_hits'] += 1
+        return prediction
+
+    async def _classify_with_retries(self, message, bucket, also_cache_under=None):
+        """
+        Classify one message with the single-message prompt.
+
+        Args:
+            message: Message text
+            bucket: Shared TokenBucket, or None
+            also_cache_under: Extra prompt template to cache the verdict under.
+                              Batch fallbacks pass the batch prompt so a rerun
+                              with the same --batch-size finds these verdicts
+                              (a single-prompt verdict may stand in for a batch
+                              one; the reverse is never done)
+        """
+        prompt = self.prompt_template.replace("{message}", str(message))
+        reply = await self._complete(prompt, 10, bucket)
+        if reply is None:
+            # On error, default to TOXIC (safer for moderation)
+            return 1
+        prediction = parse_classification(reply)
+        if self.cache is not None:
+            # Only real verdicts are cached, never error fallbacks
+            self.cache.put(message, self.model, self.prompt_template, prediction)
+            if also_cache_under is not None:
+                self.cache.put(message, self.model, also_cache_under, prediction)
+        return prediction
+
+    async def _classify_batch(self, messages, bucket):
+        """Classify several messages in one request; None if the reply can't be used."""
+        self.stats['batches'] += 1
+        prompt = format_batch_prompt(self.batch_prompt_template, messages)
+        reply = await self._complete(prompt, 8 * len(messages) + 16, bucket,
+                                     fallback="falling back to single prompts")
+        labels = parse_batch_classification(reply, len(messages))
+        if labels is not None and self.cache is not None:
+            # Keyed by the prompt that produced them: a batch verdict is not a
+            # single-prompt verdict, and must not be served as one
+            for message, label in zip(messages, labels):
+                self.cache.put(message, self.model, self.batch_prompt_template, label)
+        return labels
+
+    async def _complete(self, prompt, max_tokens, bucket, fallback="Defaulting to TOXIC"):
+        """
+        Send one chat completion with retries; return the reply text or None.
+
+        fallback is what the caller does with a None, for the error message.
+        """
+        import openai
+
+        for attempt in range(self.max_retries + 1):
+            if bucket is not None:
+                with profiling.stage('rate_limit_wait'):
+                    await bucket.acquire()
+            self.stats['requests'] += 1
+            profiling.count('api_requests')
+            retry_after = None
+            try:
+                with profiling.stage('api_call'):
+                    response = await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=[{"role": "user", "content": prompt}],
+                        max_tokens=max_tokens
+                    )
+                return response.choices[0].message.content or ""
+            except openai.APIStatusError as e:
+                if e.status_code == 429:
+                    self.stats['rate_limited'] += 1
+                    retry_after = _retry_after_seconds(e.response)
+                elif e.status_code >= 500:
+                    self.stats['server_errors'] += 1
+                else:
+                    return self._give_up(e, fallback)
+                error = e
+            except (openai.APIConnectionError, openai.APITimeoutError) as e:
+                error = e
+            except Exception as e:
+                # Malformed response, client bug, ...: not worth retrying, but
+                # one bad request must not abort the whole gather()
+                return self._give_up(e, fallback)
+
+            if attempt == self.max_retries:
+                return self._give_up(error, fallback)
+            self.stats['retries'] += 1
+            with profiling.stage('backoff_sleep'):
+                await asyncio.sleep(self._backoff_delay(attempt, retry_after))
+
+    def _backoff_delay(self, attempt, retry_after=None):
+        """Exponential backoff with full jitter; honours Retry-After if larger."""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def _give_up(self, error, fallback):
+        self.stats['failures'] += 1
+        print(f"    API Error: {str(error)[:50]}... - {fallback}")
+        return None
+
+
+def _retry_after_seconds(response):
+    """Read a numeric Retry-After header, if the server sent one."""
+    try:
+        return float(response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
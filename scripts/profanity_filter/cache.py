@@ -0,0 +1,241 @@
+"""
+Two-tier cache for LLM verdicts.
+
+Game chat repeats itself ("gg", "nice", "push with me"), so most LLM calls
+can be answered from a cache:
+- tier 1: in-process LRU (OrderedDict), microseconds per lookup
+- tier 2: on-disk SQLite, survives restarts and is shared between runs
+
+Keys combine the normalized message, the model name and a hash of the
+prompt template, so changing either one never serves stale verdicts.
+Both tiers support a TTL and a maximum size; hit/miss counters are kept
+in `stats`.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_message(text):
+    """Lowercase, trim and collapse whitespace so trivial variants share a key."""
+    return _WHITESPACE.sub(' ', str(text)).strip().lower()
+
+
+def prompt_hash(prompt_template):
+    """Short, stable hash identifying a prompt template."""
+    return hashlib.sha256(prompt_template.encode('utf-8')).hexdigest()[:16]
+
+
+def cache_key(message, model, prompt_template):
+    """Cache key for (normalized message, model, prompt template)."""
+    raw = '\0'.join([model, prompt_hash(prompt_template), normalize_message(message)])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU with optional TTL (seconds)."""
+
+    def __init__(self, maxsize=100_000, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, created = entry
+            if self.ttl is not None and time.time() - created > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value, created=None):
+        with self._lock:
+            self._data[key] = (value, time.time() if created is None else created)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class SQLiteCache:
+    """
+    On-disk verdict store.
+
+    Expired rows are dropped on read; when the table grows past max_entries
+    the least recently used rows are evicted in one batch.
+
+    A hit refreshes last_used only when the stored value is more than
+    touch_interval seconds old (eviction does not need finer recency), and
+    those refreshes are committed every touch_batch of them, with the next
+    put(), or on close(), never one commit per hit.
+    """
+
+    def __init__(self, path, ttl=None, max_entries=1_000_000, evict_fraction=0.1,
+                 touch_interval=60.0, touch_batch=100):
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.evict_fraction = evict_fraction
+        self.touch_interval = touch_interval
+        self.touch_batch = touch_batch
+        self._pending_touches = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS verdicts ('
+            ' key TEXT PRIMARY KEY,'
+            ' verdict INTEGER NOT NULL,'
+            ' created REAL NOT NULL,'
+            ' last_used REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS verdicts_last_used ON verdicts (last_used)')
+        self._conn.commit()
+        self._count = self._conn.execute('SELECT COUNT(*) FROM verdicts').fetchone()[0]
+
+    def __len__(self):
+        return self._count
+
+    def get(self, key):
+        """Return (verdict, created) or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT verdict, created, last_used FROM verdicts WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            verdict, created, last_used = row
+            now = time.time()
+            if self.ttl is not None and now - created > self.ttl:
+                self._conn.execute('DELETE FROM verdicts WHERE key = ?', (key,))
+                self._commit()
+                self._count -= 1
+                return None
+            if now - last_used > self.touch_interval:
+                self._conn.execute('UPDATE verdicts SET last_used = ? WHERE key = ?', (now, key))
+                self._pending_touches += 1
+                if self._pending_touches >= self.touch_batch:
+                    self._commit()
+            return verdict, created
+
+    def put(self, key, verdict):
+        with self._lock:
+            now = time.time()
+            inserted = self._conn.execute(
+                'INSERT OR IGNORE INTO verdicts (key, verdict, created, last_used)'
+                ' VALUES (?, ?, ?, ?)', (key, verdict, now, now)
+            ).rowcount
+            if not inserted:
+                self._conn.execute(
+                    'UPDATE verdicts SET verdict = ?, created = ?, last_used = ? WHERE key = ?',
+                    (verdict, now, now, key)
+                )
+            self._count += inserted
+            if self._count > self.max_entries:
+                self._evict()
+            self._commit()
+
+    def purge_expired(self):
+        """Delete every row older than the TTL; returns the number removed."""
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            removed = self._conn.execute(
+                'DELETE FROM verdicts WHERE created < ?', (time.time() - self.ttl,)
+            ).rowcount
+            self._commit()
+            self._count -= removed
+            return removed
+
+    def close(self):
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+    def _commit(self):
+        self._conn.commit()
+        self._pending_touches = 0
+
+    def _evict(self):
+        """Drop the least recently used rows down to (1 - evict_fraction) * max_entries."""
+        target = int(self.max_entries * (1 - self.evict_fraction))
+        excess = self._count - target
+        removed = self._conn.execute(
+            'DELETE FROM verdicts WHERE key IN '
+            '(SELECT key FROM verdicts ORDER BY last_used LIMIT ?)', (excess,)
+        ).rowcount
+        self._count -= removed
+
+
+class VerdictCache:
+    """
+    LRU in front of SQLite, keyed by normalized message + model + prompt.
+
+    Example:
+        cache = VerdictCache('data/llm_verdict_cache.sqlite', ttl=7 * 24 * 3600)
+        verdict = cache.get(message, model, prompt_template)
+        if verdict is None:
+            verdict = call_llm(message)
+            cache.put(message, model, prompt_template, verdict)
+    """
+
+    def __init__(self, path=None, memory_size=100_000, ttl=None, max_disk_entries=1_000_000):
+        """
+        Args:
+            path: SQLite file for the disk tier; None keeps the cache in memory only
+            memory_size: Maximum entries in the in-process LRU
+            ttl: Seconds before a verdict expires (None = never)
+            max_disk_entries: Maximum rows kept in SQLite
+        """
+        self.memory = LRUCache(memory_size, ttl)
+        self.disk = SQLiteCache(path, ttl, max_disk_entries) if path else None
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    def get(self, message, model, prompt_template):
+        """Return the cached verdict (0/1) or None on a miss."""
+        key = cache_key(message, model, prompt_template)
+        verdict = self.memory.get(key)
+        if verdict is not None:
+            self.stats['memory_hits'] += 1
+            return verdict
+
+        if self.disk is not None:
+            row = self.disk.get(key)
+            if row is not None:
+                verdict, created = row
+                self.memory.put(key, verdict, created)
+                self.stats['disk_hits'] += 1
+                return verdict
+
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, message, model, prompt_template, verdict):
+        key = cache_key(message, model, prompt_template)
+        self.memory.put(key, verdict)
+        if self.disk is not None:
+            self.disk.put(key, verdict)
+
+    @property
+    def hit_rate(self):
+        hits = self.stats['memory_hits'] + self.stats['disk_hits']
+        total = hits + self.stats['misses']
+        return hits / total if total > 0 else 0
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
@@ -0,0 +1,246 @@
+"""
+Tiered regex-then-LLM cascade (the hybrid from results/FINAL_COMPARISON.md).
+
+Tier 1: the compiled word-list matcher. A hit is TOXIC immediately (regex
+        precision is high), so the LLM is never paid for obvious profanity.
+Tier 2: messages with no hit are run through pluggable escalation rules; if
+        any rule fires the message goes to the LLM, otherwise it is CLEAN.
+
+Escalation rules are callables `rule(text) -> reason or None` with a `name`
+attribute, so new policies can be added without touching the pipeline.
+"""
+
+import re
+import time
+from pathlib import Path
+
+from profanity_filter.fuzzy import DEFAULT_FUZZY_ALLOWLIST_FILE
+from profanity_filter.matcher import load_profanity_words
+from profanity_filter.metrics import percentile
+
+_TOKEN = re.compile(r"[^\s]+")
+# Symbols/digits inside a word ("sh1t", "f*ck") or trailing symbol runs ("a$$")
+_OBFUSCATED = re.compile(r"[a-z][0-9@$*!|#%]+[a-z]|[a-z][@$*]{2,}")
+_REPEATS = re.compile(r"([a-z])\1{2,}")
+
+
+class ShortMessageRule:
+    """Escalate very short messages (acronyms like "kys", "stfu" hide here)."""
+
+    name = 'short'
+
+    def __init__(self, max_chars=5):
+        self.max_chars = max_chars
+
+    def __call__(self, text):
+        stripped = text.strip()
+        if 0 < len(stripped) <= self.max_chars:
+            return f"short message ({len(stripped)} chars)"
+        return None
+
+
+def load_allow_words(allowlist_file=DEFAULT_FUZZY_ALLOWLIST_FILE):
+    """Real words that are never near misses ("dame", "darn"); empty if the file is missing."""
+    if allowlist_file is not None and Path(allowlist_file).exists():
+        return load_profanity_words(allowlist_file)
+    return []
+
+
+class NearMissRule:
+    """Escalate tokens within edit distance `max_distance` of a listed word."""
+
+    name = 'near_miss'
+
+    def __init__(self, words, max_distance=1, min_word_length=4, allow_words=()):
+        """
+        Args:
+            words: Listed words
+            max_distance: Largest edit distance that counts as a near miss
+            min_word_length: Shorter listed words are ignored
+            allow_words: Real words never escalated (see load_allow_words)
+        """
+        self.max_distance = max_distance
+        self.words = [w for w in words if len(w) >= min_word_length]
+        self.allow_words = frozenset(word.lower() for word in allow_words)
+
+    def __call__(self, text):
+        for token in _TOKEN.findall(text.lower()):
+            token = token.strip(".,!?\"'()")
+            if token in self.allow_words:
+                continue
+            for word in self.words:
+                if token != word and abs(len(token) - len(word)) <= self.max_distance \
+                        and bounded_edit_distance(token, word, self.max_distance) <= self.max_distance:
+                    return f"near miss '{token}' ~ '{word}'"
+        return None
+
+
+class SuspiciousTokenRule:
+    """Escalate tokens mixing letters with digits/symbols ("sh1t", "f*ck") or long letter runs."""
+
+    name = 'suspicious'
+
+    def __call__(self, text):
+        for token in _TOKEN.findall(text.lower()):
+            if _OBFUSCATED.search(token):
+                return f"obfuscated token '{token}'"
+            if _REPEATS.search(token):
+                return f"repeated letters '{token}'"
+        return None
+
+
+def bounded_edit_distance(a, b, limit):
+    """Levenshtein distance, giving up (returning limit + 1) once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def default_rules(words, allow_words=None):
+    """
+    The standard escalation policy: short, near-miss and suspicious tokens.
+
+    allow_words defaults to data/fuzzy_allowlist.txt, the FuzzyFilter allow-list.
+    """
+    if allow_words is None:
+        allow_words = load_allow_words()
+    return [ShortMessageRule(), NearMissRule(words, allow_words=allow_words),
+            SuspiciousTokenRule()]
+
+
+class CascadeFilter:
+    """
+    Regex first, LLM only for escalated messages.
+
+    Example:
+        cascade = CascadeFilter(word_filter,
+                                lambda m: get_llm_classification(client, template, m),
+                                default_rules(word_filter.words))
+        result = cascade.classify("u r a fuk noob")
+        # {'prediction': 1, 'tier': 'llm', 'rule': 'near_miss', 'reason': "near miss 'fuk' ~ 'fuck'",
+        #  'matches': []}
+    """
+
+    def __init__(self, word_filter, llm_classify, rules):
+        """
+        Args:
+            word_filter: Filter for tier 1 (anything with explain(): ProfanityFilter,
+                         ReloadingFilter, CompiledFilter, MultilingualFilter, ...)
+            llm_classify: Callable(text) -> 0/1 for tier 2
+            rules: Escalation rules, each rule(text) -> reason or None
+        """
+        self.word_filter = word_filter
+        self.llm_classify = llm_classify
+        self.rules = list(rules)
+        self.latencies = {'regex': [], 'rules': [], 'llm': []}
+        self.counts = {'regex_toxic': 0, 'clean': 0, 'escalated': 0}
+        self.rule_counts = {rule.name: 0 for rule in self.rules}
+
+    def _regex_tier(self, text):
+        """Tier 1 result, or None if the word list has no match."""
+        # explain() runs the filter's own prepare() (lowercase, normalization)
+        matches = self.word_filter.explain(text)
+        if not matches:
+            return None
+        return {'prediction': 1, 'tier': 'regex', 'rule': None,
+                'reason': f"matched '{matches[0]['word']}'", 'matches': matches}
+
+    def _rule_tier(self, text):
+        """(rule, reason) of the first escalation rule that fires, or (None, None)."""
+        for rule in self.rules:
+            reason = rule(text)
+            if reason:
+                return rule, reason
+        return None, None
+
+    def screen(self, text):
+        """
+        Tiers 1 and 2 without the LLM call (no latency or count bookkeeping).
+
+        Returns:
+            dict: Same keys as classify(); an escalated message has tier 'llm'
+                  and prediction None until its LLM verdict is filled in
+        """
+        text = text if isinstance(text, str) else ''
+        return self._regex_tier(text) or self._screen_unmatched(text)
+
+    def screen_many(self, texts):
+        """screen() over a list: one check_many() call, explain() only for the hits."""
+        texts = [text if isinstance(text, str) else '' for text in texts]
+        return [(flagged and self._regex_tier(text)) or self._screen_unmatched(text)
+                for text, flagged in zip(texts, self.word_filter.check_many(texts))]
+
+    def _screen_unmatched(self, text):
+        rule, reason = self._rule_tier(text)
+        if rule is None:
+            return {'prediction': 0, 'tier': 'rules', 'rule': None, 'reason': None,
+                    'matches': []}
+        return {'prediction': None, 'tier': 'llm', 'rule': rule.name, 'reason': reason,
+                'matches': []}
+
+    def classify(self, text):
+        """
+        Classify one message.
+
+        Returns:
+            dict: 'prediction' (0/1), 'tier' ('regex', 'rules' or 'llm'),
+                  'rule' (name of the escalating rule, if any), 'reason' and
+                  'matches' (word-list matches, as explain() reports them)
+        """
+        text = text if isinstance(text, str) else ''
+
+        start = time.perf_counter()
+        result = self._regex_tier(text)
+        self.latencies['regex'].append(time.perf_counter() - start)
+        if result is not None:
+            self.counts['regex_toxic'] += 1
+            return result
+
+        start = time.perf_counter()
+        fired, reason = self._rule_tier(text)
+        self.latencies['rules'].append(time.perf_counter() - start)
+        if fired is None:
+            self.counts['clean'] += 1
+            return {'prediction': 0, 'tier': 'rules', 'rule': None, 'reason': None,
+                    'matches': []}
+
+        start = time.perf_counter()
+        prediction = self.llm_classify(text)
+        self.latencies['llm'].append(time.perf_counter() - start)
+        self.counts['escalated'] += 1
+        self.rule_counts[fired.name] += 1
+        return {'prediction': prediction, 'tier': 'llm', 'rule': fired.name, 'reason': reason,
+                'matches': []}
+
+    def classify_many(self, texts):
+        """Classify every message; returns a list of classify() results."""
+        return [self.classify(text) for text in texts]
+
+    @property
+    def escalation_rate(self):
+        total = sum(self.counts.values())
+        return self.counts['escalated'] / total if total > 0 else 0
+
+    def latency_report(self):
+        """Per-tier call count and p50/p90/p99 latency in milliseconds."""
+        report = {}
+        for tier, values in self.latencies.items():
+            report[tier] = {
+                'calls': len(values),
+                'p50_ms': percentile(values, 50) * 1000,
+                'p90_ms': percentile(values, 90) * 1000,
+                'p99_ms': percentile(values, 99) * 1000,
+            }
+        return report
@@ -0,0 +1,233 @@
+"""
+Columnar (Parquet) datasets and results.
+
+Every run used to re-parse data/gametox.csv as text. Parquet stores each
+column typed and compressed, so a loader reads only the columns it asks
+for, with no parsing, straight into Arrow-backed string columns (the
+filters' str.contains then runs on RE2, see matcher.series_contains).
+
+    python scripts/convert_to_parquet.py          # one-time conversion
+    df = read_table(resolve_dataset('data/gametox.csv'), ['message', 'label'])
+
+Loaders take either format (by file suffix), and resolve_dataset() picks an
+up-to-date .parquet copy of a CSV when one exists. pyarrow is optional:
+without it everything stays on CSV.
+"""
+
+from pathlib import Path
+
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+OUTPUT_FORMATS = ('csv', 'parquet')
+DEFAULT_COMPRESSION = 'zstd'
+CONVERT_CHUNKSIZE = 200_000
+# Free-text columns of the datasets (GameTox messages, Reddit usernames)
+TEXT_COLUMNS = ('message', 'author')
+
+
+def is_parquet(filepath):
+    return Path(filepath).suffix.lower() in PARQUET_SUFFIXES
+
+
+def has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError("Parquet files need pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+
+def parquet_path(filepath):
+    """data/gametox.csv -> data/gametox.parquet"""
+    return Path(filepath).with_suffix('.parquet')
+
+
+def with_format(filepath, output_format):
+    """Swap a result file's suffix for an --output-format ('csv' or 'parquet')."""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"output format must be one of {OUTPUT_FORMATS}, got {output_format!r}")
+    return Path(filepath).with_suffix('.' + output_format)
+
+
+def resolve_dataset(csv_file):
+    """
+    The Parquet copy of csv_file if it is usable and not older than the CSV.
+
+    Returns:
+        Path: data/x.parquet when converted (and pyarrow is installed), else csv_file
+    """
+    csv_file = Path(csv_file)
+    converted = parquet_path(csv_file)
+    if not converted.exists() or not has_pyarrow():
+        return csv_file
+    if csv_file.exists() and csv_file.stat().st_mtime > converted.stat().st_mtime:
+        return csv_file
+    return converted
+
+
+def _string_dtype():
+    """Arrow-backed strings with NaN for missing values (pandas' own str dtype)."""
+    import numpy as np
+    import pandas as pd
+
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError:  # pandas < 2.3 has no na_value
+        return pd.StringDtype('pyarrow')
+
+
+def _to_pandas(table, start=0):
+    """Arrow table -> DataFrame with Arrow-backed strings and a RangeIndex from start."""
+    import pandas as pd
+
+    pa = _pyarrow()
+    strings = _string_dtype()
+    df = table.to_pandas(types_mapper={pa.string(): strings, pa.large_string(): strings}.get)
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
+
+
+def read_table(filepath, columns=None):
+    """
+    Load a CSV or Parquet file, only the requested columns.
+
+    Args:
+        filepath: .csv or .parquet file
+        columns: Columns to load (None = all)
+
+    Returns:
+        DataFrame
+    """
+    if is_parquet(filepath):
+        pa = _pyarrow()
+        return _to_pandas(pa.parquet.read_table(filepath, columns=columns))
+
+    import pandas as pd
+
+    return pd.read_csv(filepath, usecols=columns)
+
+
+def iter_parquet_chunks(filepath, columns, chunksize):
+    """Yield DataFrames of up to chunksize rows (row index continues across chunks)."""
+    pa = _pyarrow()
+    start = 0
+    parquet_file = pa.parquet.ParquetFile(filepath)
+    for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+        chunk = _to_pandas(pa.Table.from_batches([batch]), start)
+        start += len(chunk)
+        yield chunk
+
+
+class ChunkWriter:
+    """
+    Appends DataFrame chunks to one CSV or Parquet file (chosen by suffix).
+
+    Parquet takes its schema from the first non-empty chunk and casts later
+    chunks to it, so every chunk must have the same columns.
+
+    Example:
+        with ChunkWriter('results/level1_flagged_messages.parquet') as writer:
+            for chunk in chunks:
+                writer.write(chunk[columns])
+    """
+
+    def __init__(self, filepath):
+        self.filepath = Path(filepath)
+        self.parquet = is_parquet(filepath)
+        self._out = None
+        self._writer = None
+        self._empty = None
+        if self.parquet:
+            _pyarrow()
+        else:
+            self._out = open(filepath, 'w', encoding='utf-8', newline='')
+        self._header = True
+
+    def write(self, df):
+        if not self.parquet:
+            df.to_csv(self._out, header=self._header, index=False)
+            self._header = False
+            return
+        if not len(df):
+            # Empty object columns have no type yet; only used if nothing else comes
+            self._empty = df if self._empty is None else self._empty
+            return
+        pa = _pyarrow()
+        if self._writer is None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            self._writer = pa.parquet.ParquetWriter(self.filepath, table.schema,
+                                                    compression=DEFAULT_COMPRESSION)
+        else:
+            table = pa.Table.from_pandas(df, schema=self._writer.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+        if self.parquet:
+            if self._writer is None and self._empty is not None:
+                write_table(self._empty, self.filepath)
+            elif self._writer is not None:
+                self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_table(df, filepath):
+    """Write a whole DataFrame as CSV or Parquet (by suffix), without the index."""
+    if is_parquet(filepath):
+        _pyarrow()
+        df.to_parquet(filepath, index=False, compression=DEFAULT_COMPRESSION)
+    else:
+        df.to_csv(filepath, index=False)
+
+
+def convert_csv(csv_file, output_file=None, chunksize=CONVERT_CHUNKSIZE,
+                text_columns=TEXT_COLUMNS):
+    """
+    One-time conversion of a CSV file to Parquet, chunk by chunk.
+
+    Text columns are read as strings: pandas infers dtypes per chunk, and a
+    chunk of all-numeric usernames (or all-missing messages) would otherwise
+    come out as int/float and not fit the first chunk's schema.
+
+    Args:
+        csv_file: CSV to convert
+        output_file: Parquet path (default: next to the CSV)
+        chunksize: Rows per chunk
+        text_columns: Columns always read as strings (those present in the file)
+
+    Returns:
+        dict: 'output', 'rows', 'csv_bytes', 'parquet_bytes'
+    """
+    import pandas as pd
+
+    output_file = Path(output_file) if output_file else parquet_path(csv_file)
+    header = pd.read_csv(csv_file, nrows=0).columns
+    dtype = {column: str for column in text_columns if column in header}
+    rows = 0
+    with ChunkWriter(output_file) as writer, \
+            pd.read_csv(csv_file, chunksize=chunksize, dtype=dtype) as reader:
+        for chunk in reader:
+            writer.write(chunk)
+            rows += len(chunk)
+    return {
+        'output': output_file,
+        'rows': rows,
+        'csv_bytes': Path(csv_file).stat().st_size,
+        'parquet_bytes': output_file.stat().st_size,
+    }
@@ -0,0 +1,325 @@
+"""
+Compiled binary dictionary, loaded with mmap.
+
+Building the regex matcher costs time that grows with the list (re.compile
+of a 100k-word alternation takes seconds), and every worker process pays it
+again. `compile_dictionary` writes the word list, its variants and the
+allow-list once into a versioned binary file; CompiledFilter maps that file
+read-only and matches straight out of the mapped pages, so startup does no
+parsing or compiling and every process on the host shares the same pages.
+
+Matching is whole-word, like ProfanityFilter: the message is split into
+\\w+ tokens (the same boundaries as \\b) and each token - or run of tokens,
+for multi-word entries - is looked up in an open-addressing hash table
+(zlib.crc32, linear probing).
+
+File layout (little-endian):
+    header   magic b'PFDC', u16 version, u16 section count
+    sections count x (8-byte name, u64 offset, u64 length)
+    'meta'     JSON: source hashes, counts, longest entry in tokens
+    'words'    canonical words      (u32 count, u32 offsets[count + 1], UTF-8 blob)
+    'keys'     lookup keys          (words and variants, same encoding)
+    'keyword'  u32 canonical word id per key
+    'index'    u32 slots (key id + 1, 0 = empty), power-of-two size
+    'allow'    allow-listed words   (string table)
+"""
+
+import hashlib
+import json
+import mmap
+import re
+import struct
+import sys
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+from profanity_filter.filter import is_missing
+from profanity_filter.matcher import load_profanity_words
+
+MAGIC = b'PFDC'
+FORMAT_VERSION = 1
+DEFAULT_DICTIONARY_FILE = Path('data/profanity_words.pfd')
+
+_HEADER = struct.Struct('<4sHH')
+_SECTION = struct.Struct('<8sQQ')
+_WORD = re.compile(r'\w+')
+
+
+def _tokens_key(text):
+    """Lookup key for an entry: its lowercased \\w+ tokens joined by single spaces."""
+    return ' '.join(_WORD.findall(text.lower()))
+
+
+def _string_table(strings):
+    """u32 count, u32 offsets[count + 1], then the UTF-8 blob."""
+    blobs = [s.encode('utf-8') for s in strings]
+    offsets, position = [0], 0
+    for blob in blobs:
+        position += len(blob)
+        offsets.append(position)
+    return struct.pack(f'<I{len(offsets)}I', len(blobs), *offsets) + b''.join(blobs)
+
+
+def _hash_index(keys):
+    capacity = 8
+    while capacity < 2 * len(keys):
+        capacity *= 2
+    mask = capacity - 1
+    slots = [0] * capacity
+    for key_id, key in enumerate(keys):
+        slot = zlib.crc32(key.encode('utf-8')) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = key_id + 1
+    return struct.pack(f'<{capacity}I', *slots)
+
+
+def load_variants(filepath):
+    """
+    Read a variants file: one `canonical: variant, variant` line per word.
+
+    Returns:
+        dict: variant -> canonical word
+    """
+    variants = {}
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            canonical, _, rest = line.partition(':')
+            canonical = canonical.strip().lower()
+            for variant in rest.split(','):
+                if variant.strip() and canonical:
+                    variants[variant.strip().lower()] = canonical
+    return variants
+
+
+def _file_hash(filepath):
+    if filepath is None or not Path(filepath).exists():
+        return None
+    return hashlib.sha256(Path(filepath).read_bytes()).hexdigest()
+
+
+def compile_dictionary(words_file, output_file=DEFAULT_DICTIONARY_FILE,
+                       allowlist_file=None, variants_file=None):
+    """
+    Compile word list, variants and allow-list into one binary dictionary.
+
+    Args:
+        words_file: Word list (one word or phrase per line)
+        output_file: Destination .pfd file (written atomically)
+        allowlist_file: Optional allow-list (e.g. data/username_allowlist.txt)
+        variants_file: Optional `canonical: variant, ...` file
+
+    Returns:
+        dict: The metadata stored in the file
+    """
+    # Entries with characters outside \w (e.g. "a$$") cannot be token keys
+    words, skipped = [], []
+    for entry in dict.fromkeys(' '.join(w.split()) for w in load_profanity_words(words_file)):
+        (words if _tokens_key(entry) == entry else skipped).append(entry)
+    word_ids = {word: index for index, word in enumerate(words)}
+
+    keys = list(words)
+    key_words = list(range(len(words)))
+    if variants_file is not None:
+        for variant, canonical in load_variants(variants_file).items():
+            variant, canonical = _tokens_key(variant), _tokens_key(canonical)
+            if variant and variant not in word_ids and canonical in word_ids \
+                    and _tokens_key(variant) == variant:
+                word_ids[variant] = word_ids[canonical]
+                keys.append(variant)
+                key_words.append(word_ids[canonical])
+
+    allow = []
+    if allowlist_file is not None and Path(allowlist_file).exists():
+        allow = list(dict.fromkeys(load_profanity_words(allowlist_file)))
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'words': len(words),
+        'keys': len(keys),
+        'allow': len(allow),
+        'skipped': skipped,
+        'max_tokens': max((key.count(' ') + 1 for key in keys), default=1),
+        'source_sha256': {
+            'words': _file_hash(words_file),
+            'allowlist': _file_hash(allowlist_file),
+            'variants': _file_hash(variants_file),
+        },
+    }
+    sections = [
+        (b'meta', json.dumps(meta).encode('utf-8')),
+        (b'words', _string_table(words)),
+        (b'keys', _string_table(keys)),
+        (b'keyword', struct.pack(f'<{len(key_words)}I', *key_words)),
+        (b'index', _hash_index(keys)),
+        (b'allow', _string_table(allow)),
+    ]
+
+    position = _HEADER.size + _SECTION.size * len(sections)
+    directory, body = [], []
+    for name, data in sections:
+        position += -position % 8  # keep u32 arrays aligned for memoryview.cast
+        directory.append(_SECTION.pack(name, position, len(data)))
+        body.append(data)
+        position += len(data)
+
+    output_file = Path(output_file)
+    staging = output_file.with_suffix(output_file.suffix + '.tmp')
+    with open(staging, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+        f.write(b''.join(directory))
+        for data in body:
+            f.write(b'\0' * (-f.tell() % 8))
+            f.write(data)
+    staging.replace(output_file)  # workers never map a half-written file
+    return meta
+
+
+class _StringTable:
+    """Zero-copy view of a string-table section."""
+
+    def __init__(self, buffer):
+        self._count = struct.unpack_from('<I', buffer)[0]
+        self._offsets = buffer[4:4 * (self._count + 2)].cast('I')
+        self._blob = buffer[4 * (self._count + 2):]
+
+    def __len__(self):
+        return self._count
+
+    def raw(self, index):
+        return self._blob[self._offsets[index]:self._offsets[index + 1]]
+
+    def __getitem__(self, index):
+        return bytes(self.raw(index)).decode('utf-8')
+
+    def __iter__(self):
+        return (self[index] for index in range(self._count))
+
+
+class CompiledFilter:
+    """
+    Whole-word filter served from an mmap'd compiled dictionary.
+
+    Offers the ProfanityFilter API used by the scripts (check, check_many,
+    explain, describe, flag_series, first_words, words) and pickles as just
+    its path, so pool workers re-map the shared file instead of rebuilding.
+
+    Example:
+        compile_dictionary('data/profanity_words.txt')   # once, at deploy
+        word_filter = CompiledFilter('data/profanity_words.pfd')
+        word_filter.check("you idiot")   # True
+    """
+
+    def __init__(self, path=DEFAULT_DICTIONARY_FILE):
+        """
+        Args:
+            path: File written by compile_dictionary
+
+        Raises:
+            ValueError: If the file is not a compiled dictionary of this version
+        """
+        if sys.byteorder != 'little':
+            raise ValueError("compiled dictionaries are only supported on little-endian hosts")
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+
+        magic, version, count = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a compiled dictionary")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} has format version {version}, expected "
+                             f"{FORMAT_VERSION}; re-run: python scripts/profanity_dict.py compile")
+        sections = {}
+        for index in range(count):
+            name, offset, length = _SECTION.unpack_from(view, _HEADER.size + index * _SECTION.size)
+            sections[name.rstrip(b'\0').decode('ascii')] = view[offset:offset + length]
+
+        self.meta = json.loads(bytes(sections['meta']))
+        self._words = _StringTable(sections['words'])
+        self._keys = _StringTable(sections['keys'])
+        self._key_words = sections['keyword'].cast('I')
+        self._index = sections['index'].cast('I')
+        self._mask = len(self._index) - 1
+        self._allow = _StringTable(sections['allow'])
+        self._max_tokens = self.meta['max_tokens']
+
+    def __getstate__(self):
+        return {'path': str(self.path)}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    @property
+    def words(self):
+        return list(self._words)
+
+    @property
+    def allow_words(self):
+        return list(self._allow)
+
+    def _key_id(self, key):
+        """Index of a lookup key in the 'keys' table, or -1."""
+        data = key.encode('utf-8')
+        index, keys, mask = self._index, self._keys, self._mask
+        slot = zlib.crc32(data) & mask
+        while True:
+            entry = index[slot]
+            if entry == 0:
+                return -1
+            if keys.raw(entry - 1) == data:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def lookup(self, key):
+        """Canonical word for a lookup key (tokens joined by spaces), or None."""
+        key_id = self._key_id(key)
+        return None if key_id < 0 else self._words[self._key_words[key_id]]
+
+    def _matches(self, text):
+        """Yield (word, start, end) for every listed word or phrase in text."""
+        spans = [(m.group(), m.start(), m.end()) for m in _WORD.finditer(text.lower())]
+        for first in range(len(spans)):
+            for last in range(first, min(first + self._max_tokens, len(spans))):
+                key = spans[first][0] if last == first else \
+                    ' '.join(token for token, _, _ in spans[first:last + 1])
+                word = self.lookup(key)
+                if word is not None:
+                    yield word, spans[first][1], spans[last][2]
+
+    def check(self, text):
+        """Return True if text contains a listed word."""
+        if is_missing(text):
+            return False
+        if self._max_tokens == 1:
+            key_id = self._key_id
+            return any(key_id(token) >= 0 for token in _WORD.findall(text.lower()))
+        return next(self._matches(text), None) is not None
+
+    def check_many(self, texts):
+        return [self.check(text) for text in texts]
+
+    def explain(self, text):
+        """Matches as dicts with 'word', 'start' and 'end' (offsets into the lowercased text)."""
+        if is_missing(text):
+            return []
+        return [{'word': word, 'start': start, 'end': end}
+                for word, start, end in self._matches(text)]
+
+    def explain_prepared(self, prepared):
+        """explain() for already lowercased text (offsets are the same)."""
+        return self.explain(prepared)
+
+    def describe(self, text):
+        return '; '.join(f"'{m['word']}' at {m['start']}-{m['end']}" for m in self.explain(text))
+
+    def flag_series(self, series):
+        return series.map(self.check).astype(bool)
+
+    def first_words(self, series):
+        """First matched word per row (None where clean)."""
+        return series.map(lambda text: next((w for w, _, _ in self._matches(text)), None)
+                          if not is_missing(text) else None)
@@ -0,0 +1,208 @@
+"""
+Duplicate collapsing before classification.
+
+Chat logs repeat themselves ("gg", "ez", copy-pasted spam), so most rows do
+not need their own verdict. A Deduplicator groups the rows of a Series,
+the filter or LLM classifies one representative per group (its first row),
+and DuplicateGroups.expand fans the verdicts back out to every row.
+
+- exact: messages are normalized the way the verdict cache keys them
+  (lowercase, collapsed whitespace) and grouped with a hash table
+  (pandas.factorize; raw strings are hashed first so only distinct ones
+  are normalized)
+- near: the exact groups are further merged with MinHash + LSH banding over
+  character shingles, so "you are trash lol" and "you are trash lol!!"
+  share a verdict. Each unique message joins the first earlier
+  representative whose estimated Jaccard similarity reaches the threshold,
+  otherwise it becomes a representative itself (no transitive chaining).
+
+Near-duplicate merging is approximate: a representative's verdict is reused
+for messages that differ slightly, so keep the threshold high. A short
+toxic line is usually a near-duplicate of its clean prefix ("gg wp you noob
+team" / "... team fuck"), so pass the word filter as `word_filter`: messages
+then only merge with representatives the filter gives the same verdict.
+"""
+
+import time
+import zlib
+
+from profanity_filter.matcher import PYTHON_RE, as_text
+
+DEDUP_MODES = ('exact', 'near')
+
+
+def normalize_series(series):
+    """Vectorized cache.normalize_message: lowercase, trim, collapse whitespace."""
+    return as_text(series).str.lower().str.replace(r'\s+', ' ', regex=True, flags=PYTHON_RE).str.strip()
+
+
+def _shingles(text, size):
+    """crc32 hashes of the character `size`-grams of ' text '."""
+    padded = f' {text} '
+    if len(padded) <= size:
+        return [zlib.crc32(padded.encode('utf-8'))]
+    return list({zlib.crc32(padded[i:i + size].encode('utf-8'))
+                 for i in range(len(padded) - size + 1)})
+
+
+def _band_layout(num_perm, threshold):
+    """(bands, rows) with bands * rows == num_perm and an LSH threshold closest to `threshold`."""
+    layouts = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+    return min(layouts, key=lambda layout: abs((1 / layout[0]) ** (1 / layout[1]) - threshold))
+
+
+class DuplicateGroups:
+    """
+    Row -> group mapping produced by a Deduplicator.
+
+    Attributes:
+        codes: ndarray, group number of every row
+        positions: ndarray, row position of each group's representative
+    """
+
+    def __init__(self, codes, positions):
+        self.codes = codes
+        self.positions = positions
+
+    def __len__(self):
+        return len(self.positions)
+
+    def representatives(self, series):
+        """One row per group (the first occurrence), original text untouched."""
+        return series.iloc[self.positions]
+
+    def expand(self, values):
+        """Fan one value per group (in representative order) back out to every row."""
+        import numpy as np
+
+        return np.asarray(values)[self.codes]
+
+
+class Deduplicator:
+    """
+    Group duplicate and (optionally) near-duplicate messages.
+
+    Example:
+        dedup = Deduplicator(near_duplicates=True)
+        groups = dedup(df['message'])
+        verdicts = classify(groups.representatives(df['message']))
+        df['prediction'] = groups.expand(verdicts)
+        dedup.stats   # {'rows': ..., 'unique': ..., ...}
+    """
+
+    def __init__(self, near_duplicates=False, threshold=0.7, num_perm=64, shingle_size=4,
+                 seed=42, word_filter=None):
+        """
+        Args:
+            near_duplicates: Also merge near-duplicates with MinHash/LSH
+            threshold: Estimated Jaccard similarity needed to share a verdict
+            num_perm: MinHash signature length
+            shingle_size: Character n-gram size for shingles
+            seed: Seed for the MinHash hash functions
+            word_filter: Optional filter (flag_series); near-duplicates only merge
+                         when it flags both messages or neither
+        """
+        import numpy as np
+
+        self.near_duplicates = near_duplicates
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.word_filter = word_filter
+        # Band for a lower threshold: LSH only proposes candidates, signatures verify them
+        self.bands, self.band_rows = _band_layout(num_perm, threshold - 0.1)
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing: ((a * x + b) mod 2^64) >> 32, a odd
+        self._a = rng.integers(1, 1 << 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+        self.stats = {'rows': 0, 'exact_unique': 0, 'unique': 0, 'seconds': 0.0}
+
+    @classmethod
+    def from_mode(cls, mode, **options):
+        """Deduplicator for a --dedup mode ('exact' or 'near'); None passes through."""
+        if mode is None:
+            return None
+        if mode not in DEDUP_MODES:
+            raise ValueError(f"dedup mode must be one of {DEDUP_MODES}, got {mode!r}")
+        return cls(near_duplicates=mode == 'near', **options)
+
+    @property
+    def ratio(self):
+        """Rows per classified representative (1.0 = nothing saved)."""
+        return self.stats['rows'] / self.stats['unique'] if self.stats['unique'] else 1.0
+
+    def signature(self, text):
+        """MinHash signature (uint64 array of num_perm values) of a normalized message."""
+        import numpy as np
+
+        shingles = np.array(_shingles(text, self.shingle_size), dtype=np.uint64)
+        hashed = (self._a[:, None] * shingles[None, :] + self._b[:, None]) >> np.uint64(32)
+        return hashed.min(axis=1)
+
+    def _merge_near(self, uniques, verdicts=None):
+        """
+        Leader clustering of unique messages; returns leader number per unique.
+
+        With verdicts (one bool per unique), LSH buckets are split by
+        verdict, so a message never joins a leader with the other verdict.
+        """
+        import numpy as np
+
+        buckets = {}
+        leaders = []
+        signatures = []
+        assignment = np.empty(len(uniques), dtype=np.int64)
+        rows = self.band_rows
+        for index, text in enumerate(uniques):
+            signature = self.signature(text if isinstance(text, str) else '')
+            verdict = None if verdicts is None else bool(verdicts[index])
+            keys = [(verdict, band, signature[band * rows:(band + 1) * rows].tobytes())
+                    for band in range(self.bands)]
+            best = None
+            for candidate in sorted({leader for key in keys for leader in buckets.get(key, ())}):
+                if np.mean(signatures[candidate] == signature) >= self.threshold:
+                    best = candidate
+                    break
+            if best is None:
+                best = len(leaders)
+                leaders.append(index)
+                signatures.append(signature)
+                for key in keys:
+                    buckets.setdefault(key, []).append(best)
+            assignment[index] = best
+        return assignment, np.array(leaders, dtype=np.int64)
+
+    def __call__(self, series):
+        """
+        Group the rows of a Series of messages.
+
+        Returns:
+            DuplicateGroups: codes per row and representative positions
+        """
+        import numpy as np
+        import pandas as pd
+
+        start = time.perf_counter()
+        # Hash the raw texts first, so only distinct strings get normalized
+        raw_codes, raw_uniques = pd.factorize(series, use_na_sentinel=False)
+        normalized_codes, uniques = pd.factorize(normalize_series(pd.Series(raw_uniques)),
+                                                 use_na_sentinel=False)
+        codes = normalized_codes[raw_codes]
+        # First row position of every exact group
+        positions = np.full(len(uniques), len(codes), dtype=np.int64)
+        np.minimum.at(positions, codes, np.arange(len(codes)))
+        exact_unique = len(uniques)
+
+        if self.near_duplicates and len(uniques) > 1:
+            verdicts = None
+            if self.word_filter is not None:
+                verdicts = self.word_filter.flag_series(pd.Series(uniques)).to_numpy(dtype=bool)
+            assignment, leaders = self._merge_near(uniques, verdicts)
+            codes = assignment[codes]
+            positions = positions[leaders]
+
+        self.stats['rows'] += len(codes)
+        self.stats['exact_unique'] += exact_unique
+        self.stats['unique'] += len(positions)
+        self.stats['seconds'] += time.perf_counter() - start
+        return DuplicateGroups(codes, positions)
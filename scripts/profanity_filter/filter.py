@@ -0,0 +1,172 @@
+"""
+ProfanityFilter: build once, reuse everywhere.
+
+The filter compiles its word list lazily on first use and then only reads
+immutable state, so one instance can be shared between threads in a
+long-lived service. pandas is never imported here; DataFrame helpers take
+the Series they are given.
+"""
+
+import threading
+from pathlib import Path
+
+from profanity_filter import profiling
+from profanity_filter.matcher import (
+    PYTHON_RE,
+    WordMatcher,
+    as_text,
+    load_profanity_words,
+    series_contains,
+)
+from profanity_filter.normalize import normalize_text
+
+DEFAULT_WORDS_FILE = Path('data/profanity_words.txt')
+
+
+def is_missing(text):
+    """Return True for None/NaN/non-string values (treated as clean)."""
+    return not isinstance(text, str)
+
+
+class ProfanityFilter:
+    """
+    Thread-safe word-list profanity filter.
+
+    Example:
+        word_filter = ProfanityFilter.from_file('data/profanity_words.txt')
+        word_filter.check("you idiot")        # True
+        word_filter.explain("you idiot")      # [{'word': 'idiot', ...}]
+    """
+
+    def __init__(self, words, word_boundaries=True, normalize=False):
+        """
+        Args:
+            words: Iterable of profanity words
+            word_boundaries: Only match whole words (\\b...\\b)
+            normalize: Undo leetspeak/separators/confusables before matching
+                       and tolerate repeated letters (see normalize.py)
+        """
+        self._words = list(words)
+        self._word_boundaries = word_boundaries
+        self._normalize = normalize
+        self._matcher = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks and compiled state stay behind; workers rebuild lazily
+        return {'words': self._words, 'word_boundaries': self._word_boundaries,
+                'normalize': self._normalize}
+
+    def __setstate__(self, state):
+        self.__init__(state['words'], word_boundaries=state['word_boundaries'],
+                      normalize=state.get('normalize', False))
+
+    @classmethod
+    def from_file(cls, filepath=DEFAULT_WORDS_FILE, word_boundaries=True, normalize=False):
+        """Build a filter from a word-list file (one word per line)."""
+        return cls(load_profanity_words(filepath), word_boundaries=word_boundaries,
+                   normalize=normalize)
+
+    @property
+    def matcher(self):
+        """The compiled WordMatcher, built exactly once on first access."""
+        matcher = self._matcher
+        if matcher is None:
+            with self._lock:
+                if self._matcher is None:
+                    self._matcher = WordMatcher(self._words, self._word_boundaries,
+                                                repeats=self._normalize)
+                matcher = self._matcher
+        return matcher
+
+    @property
+    def words(self):
+        """De-duplicated word list used by the matcher (file order)."""
+        return self.matcher.words
+
+    @property
+    def pattern(self):
+        """Regex source of the compiled matcher (usable with pandas .str)."""
+        return self.matcher.pattern
+
+    @property
+    def normalize(self):
+        return self._normalize
+
+    def prepare(self, text):
+        """The string the matcher sees: lowercased, and normalized if enabled."""
+        return normalize_text(text) if self._normalize else text.lower()
+
+    def check(self, text):
+        """Return True if text contains a profanity word."""
+        if is_missing(text):
+            return False
+        return self.matcher.regex.search(self.prepare(text)) is not None
+
+    def check_many(self, texts):
+        """Return a list of check() results for every text in an iterable."""
+        search = self.matcher.regex.search
+        prepare = self.prepare
+        return [
+            False if is_missing(text) else search(prepare(text)) is not None
+            for text in texts
+        ]
+
+    def explain(self, text):
+        """
+        Explain why text was flagged.
+
+        Returns:
+            list: One dict per match with 'word', 'start' and 'end' keys
+                  (offsets into the lowercased, or normalized, text); empty if clean
+        """
+        if is_missing(text):
+            return []
+        return self.explain_prepared(self.prepare(text))
+
+    def explain_prepared(self, prepared):
+        """explain() for text that has already been through prepare()."""
+        matcher = self.matcher
+        return [
+            {'word': matcher.canonical(match.group()), 'start': match.start(), 'end': match.end()}
+            for match in matcher.regex.finditer(prepared)
+        ]
+
+    def describe(self, text):
+        """One-line explanation, e.g. "'idiot' at 4-9" (empty if clean)."""
+        return '; '.join(f"'{m['word']}' at {m['start']}-{m['end']}" for m in self.explain(text))
+
+    def prepare_series(self, series):
+        """prepare() over a pandas Series (non-strings become NaN)."""
+        if not self._normalize:
+            return as_text(series).str.lower()
+        return series.map(lambda text: None if is_missing(text) else normalize_text(text))
+
+    def flag_series(self, series):
+        """Vectorized check() over a pandas Series of strings."""
+        with profiling.stage('lowercase'):
+            prepared = self.prepare_series(series)
+        with profiling.stage('regex_scan'):
+            return series_contains(prepared, self.pattern)
+
+    def first_words(self, series):
+        """First matched list word per row of a Series (NaN where clean)."""
+        pattern = '(' + self.pattern + ')'
+        matched = self.prepare_series(series).str.extract(pattern, flags=PYTHON_RE)[0]
+        if self._normalize:
+            matched = matched.map(self.matcher.canonical, na_action='ignore')
+        return matched
+
+
+_default_filter = None
+_default_lock = threading.Lock()
+
+
+def get_default_filter():
+    """Return a process-wide filter built from data/profanity_words.txt."""
+    global _default_filter
+    if _default_filter is None:
+        with _default_lock:
+            if _default_filter is None:
+                _default_filter = ProfanityFilter.from_file(DEFAULT_WORDS_FILE)
+    return _default_filter
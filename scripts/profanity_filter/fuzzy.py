@@ -0,0 +1,293 @@
+"""
+Fuzzy (edit-distance) matching with a SymSpell deletion index.
+
+Misspellings such as "fuk", "shiit" or "biatch" are one edit away from a
+listed word, but comparing every token with every word is O(tokens x words).
+SymSpell precomputes every string reachable from each listed word by up to
+k deletions; at lookup time a token's own deletions (a few dozen strings for
+k=1) are looked up in that dict, and only the handful of candidates found
+are verified with a bounded Damerau-Levenshtein distance. Lookup cost
+depends on the token length, not on the size of the word list.
+
+Short words have many innocent neighbours ("shirt", "help", "funk"), so:
+- tokens shorter than 3 characters are never fuzzy-matched, and the allowed
+  distance grows with token length (len // 3, capped at max_distance)
+- a fuzzy match must keep the word's first letter
+- tokens in an allow-list of real words (data/fuzzy_allowlist.txt) are skipped
+
+Per-message cost is capped: at most max_tokens tokens per message are
+looked up, tokens longer than max_token_length are skipped, and results
+are memoized per token.
+"""
+
+import re
+import threading
+from pathlib import Path
+
+from profanity_filter.filter import DEFAULT_WORDS_FILE, ProfanityFilter, is_missing
+from profanity_filter.matcher import load_profanity_words
+
+DEFAULT_FUZZY_ALLOWLIST_FILE = Path('data/fuzzy_allowlist.txt')
+MIN_TOKEN_LENGTH = 3
+_TOKEN = re.compile(r'[^\W\d_]+')
+
+
+def _deletes(word, max_distance):
+    """Every string obtained from word by deleting up to max_distance characters."""
+    found = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {item[:i] + item[i + 1:] for item in frontier if len(item) > 1
+                    for i in range(len(item))}
+        found |= frontier
+    return found
+
+
+def edit_distance(a, b, max_distance):
+    """
+    Damerau-Levenshtein (optimal string alignment) distance, bounded.
+
+    Returns:
+        int: The distance, or max_distance + 1 as soon as it is known to exceed it
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous_row = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous_row, row = previous_row, row, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            row[j] = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], before[j - 2] + 1)
+        if min(row) > max_distance:
+            return max_distance + 1
+    return row[-1]
+
+
+class SymSpellIndex:
+    """
+    Deletion dictionary over single-token words.
+
+    Example:
+        index = SymSpellIndex(['fuck', 'bitch'], max_distance=1)
+        index.lookup('fuk')   # [('fuck', 1)]
+    """
+
+    def __init__(self, words, max_distance=1):
+        """
+        Args:
+            words: Iterable of lowercase words (entries with non-letters are ignored)
+            max_distance: Largest edit distance the index can answer
+        """
+        self.max_distance = max_distance
+        self.words = [word for word in dict.fromkeys(words) if _TOKEN.fullmatch(word)]
+        self._deletes = {}
+        for index, word in enumerate(self.words):
+            for deleted in _deletes(word, max_distance):
+                self._deletes.setdefault(deleted, []).append(index)
+
+    def __len__(self):
+        return len(self.words)
+
+    def lookup(self, token, max_distance=None):
+        """
+        Listed words within max_distance of token.
+
+        Returns:
+            list: (word, distance) pairs, closest first
+        """
+        max_distance = self.max_distance if max_distance is None else \
+            min(max_distance, self.max_distance)
+        seen = set()
+        results = []
+        for deleted in _deletes(token, max_distance):
+            for index in self._deletes.get(deleted, ()):
+                if index in seen:
+                    continue
+                seen.add(index)
+                distance = edit_distance(token, self.words[index], max_distance)
+                if distance <= max_distance:
+                    results.append((distance, index))
+        return [(self.words[index], distance) for distance, index in sorted(results)]
+
+
+class FuzzyFilter:
+    """
+    Exact whole-word filter plus fuzzy matching of misspelled tokens.
+
+    Exact matches come from a ProfanityFilter (same results as the regex);
+    the remaining tokens are looked up in a SymSpellIndex. Offers the
+    ProfanityFilter API used by the scripts; explain() adds 'distance' and
+    'token' keys.
+
+    Example:
+        word_filter = FuzzyFilter.from_file('data/profanity_words.txt')
+        word_filter.check("shut up biatch")   # True
+        word_filter.explain("fuk off")        # [{'word': 'fuck', 'token': 'fuk', 'distance': 1, ...}]
+    """
+
+    def __init__(self, words, max_distance=1, allow_words=(), normalize=False,
+                 max_tokens=64, max_token_length=20, cache_size=100_000):
+        """
+        Args:
+            words: Iterable of profanity words
+            max_distance: Edit distance for tokens of 3*k characters or more
+            allow_words: Real words never treated as misspellings ("shirt", "help")
+            normalize: Run the leetspeak normalization stage first
+            max_tokens: Fuzzy lookups per message (the per-message cost cap)
+            max_token_length: Longer tokens are not fuzzy-matched
+            cache_size: Memoized token results before the memo is reset
+        """
+        self.exact = ProfanityFilter(words, normalize=normalize)
+        self.max_distance = max_distance
+        self.allow_words = frozenset(word.lower() for word in allow_words)
+        self.max_tokens = max_tokens
+        self.max_token_length = max_token_length
+        self.cache_size = cache_size
+        self._index = None
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'words': self.exact.words, 'max_distance': self.max_distance,
+                'allow_words': sorted(self.allow_words), 'normalize': self.exact.normalize,
+                'max_tokens': self.max_tokens, 'max_token_length': self.max_token_length,
+                'cache_size': self.cache_size}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @classmethod
+    def from_file(cls, filepath=DEFAULT_WORDS_FILE, allowlist_file=DEFAULT_FUZZY_ALLOWLIST_FILE,
+                  **options):
+        """Build from a word list and an optional allow-list file (skipped if missing)."""
+        allow_words = ()
+        if allowlist_file is not None and Path(allowlist_file).exists():
+            allow_words = load_profanity_words(allowlist_file)
+        return cls(load_profanity_words(filepath), allow_words=allow_words, **options)
+
+    @property
+    def index(self):
+        """The SymSpellIndex, built exactly once on first access."""
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = SymSpellIndex(self.exact.words, self.max_distance)
+                index = self._index
+        return index
+
+    @property
+    def matcher(self):
+        return self.exact.matcher
+
+    @property
+    def words(self):
+        return self.exact.words
+
+    @property
+    def pattern(self):
+        return self.exact.pattern
+
+    @property
+    def normalize(self):
+        return self.exact.normalize
+
+    def prepare(self, text):
+        return self.exact.prepare(text)
+
+    def fuzzy_lookup(self, token):
+        """Closest listed word for a lowercased token as (word, distance), or None."""
+        memo = self._memo
+        if token in memo:
+            return memo[token]
+        result = None
+        allowed = min(self.max_distance, len(token) // MIN_TOKEN_LENGTH)
+        if allowed and len(token) <= self.max_token_length and token not in self.allow_words:
+            for word, distance in self.index.lookup(token, allowed):
+                if word[0] == token[0]:
+                    result = (word, distance)
+                    break
+        if len(memo) >= self.cache_size:
+            memo.clear()
+        memo[token] = result
+        return result
+
+    def _fuzzy_matches(self, prepared):
+        """Yield (word, token, distance, start, end) for misspelled tokens."""
+        lookups = 0
+        for match in _TOKEN.finditer(prepared):
+            token = match.group()
+            if len(token) < MIN_TOKEN_LENGTH:
+                continue
+            lookups += 1
+            if lookups > self.max_tokens:
+                return
+            found = self.fuzzy_lookup(token)
+            if found is not None and found[1] > 0:
+                yield found[0], token, found[1], match.start(), match.end()
+
+    def check(self, text):
+        """Return True if text contains a listed word or a close misspelling of one."""
+        if is_missing(text):
+            return False
+        prepared = self.prepare(text)
+        if self.exact.matcher.regex.search(prepared) is not None:
+            return True
+        return next(self._fuzzy_matches(prepared), None) is not None
+
+    def check_many(self, texts):
+        return [self.check(text) for text in texts]
+
+    def explain(self, text):
+        """
+        Exact and fuzzy matches, ordered by position.
+
+        Returns:
+            list: Dicts with 'word', 'token', 'distance', 'start' and 'end'
+                  (offsets into the lowercased, or normalized, text)
+        """
+        if is_missing(text):
+            return []
+        return self.explain_prepared(self.prepare(text))
+
+    def explain_prepared(self, prepared):
+        """explain() for text that has already been through prepare()."""
+        matcher = self.exact.matcher
+        matches = [
+            {'word': matcher.canonical(match.group()), 'token': match.group(), 'distance': 0,
+             'start': match.start(), 'end': match.end()}
+            for match in matcher.regex.finditer(prepared)
+        ]
+        exact_spans = [(match['start'], match['end']) for match in matches]
+        matches += [
+            {'word': word, 'token': token, 'distance': distance, 'start': start, 'end': end}
+            for word, token, distance, start, end in self._fuzzy_matches(prepared)
+            if not any(low <= start < high for low, high in exact_spans)
+        ]
+        return sorted(matches, key=lambda match: match['start'])
+
+    def describe(self, text):
+        """One-line explanation; fuzzy hits show the token, e.g. "'fuck' (fuk~1) at 0-3"."""
+        return '; '.join(
+            f"'{m['word']}' at {m['start']}-{m['end']}" if m['distance'] == 0 else
+            f"'{m['word']}' ({m['token']}~{m['distance']}) at {m['start']}-{m['end']}"
+            for m in self.explain(text)
+        )
+
+    def flag_series(self, series):
+        """Vectorized exact pass, then fuzzy lookups only on rows it left clean."""
+        flagged = self.exact.flag_series(series)
+        clean = ~flagged
+        if clean.any():
+            flagged[clean] = series[clean].map(self.check).astype(bool).to_numpy()
+        return flagged
+
+    def first_words(self, series):
+        """First matched word per row (exact or fuzzy; None where clean)."""
+        def first(text):
+            matches = self.explain(text)
+            return matches[0]['word'] if matches else None
+        return series.map(first)
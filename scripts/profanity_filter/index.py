@@ -0,0 +1,338 @@
+"""
+Inverted token index over a labelled corpus, for incremental re-scoring.
+
+Re-running the Level 1 scan after every word-list edit rescans the whole
+corpus. CorpusIndex tokenizes the corpus once into \\w+ tokens (the same
+boundaries the whole-word regex uses) and stores, for every token, the
+sorted row ids containing it (CSR postings). A listed word then matches
+exactly the rows in its token's postings list; multi-word entries
+intersect their tokens' postings and verify the few candidates with the
+regex, and substring queries scan the vocabulary instead of the rows.
+
+IncrementalScorer keeps a per-row count of matching listed words plus the
+running confusion counts, so a word-list diff only touches the rows of the
+added/removed terms, and what_if() previews a term without committing it.
+
+The index is persisted as .npz (vocabulary blob, postings, labels, source
+file size/mtime) together with the last applied word list and hit counts.
+"""
+
+import re
+from pathlib import Path
+
+import numpy as np
+
+from profanity_filter.matcher import PYTHON_RE, WordMatcher
+from profanity_filter.metrics import metrics_from_counts
+
+DEFAULT_INDEX_FILE = Path('results/level1_index.npz')
+_TOKEN = re.compile(r'\w+')
+
+
+def _source_stamp(filepath):
+    stat = Path(filepath).stat()
+    return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+
+def lazy_texts(filepath, text_column='message'):
+    """
+    Callable(row_ids) -> lowercased messages, reading the CSV only on first use.
+
+    Only entries that are not a single plain token ("son of a", "a$$") need
+    the text for verification, so most updates never touch the CSV.
+    """
+    column = []
+
+    def texts(rows):
+        if not column:
+            from profanity_filter.columnar import read_table
+
+            column.append(read_table(filepath, [text_column])[text_column]
+                          .str.lower().fillna('').to_numpy())
+        return column[0][rows]
+    return texts
+
+
+class CorpusIndex:
+    """
+    Token -> row-ids index over one CSV column.
+
+    Example:
+        index = CorpusIndex.build('data/gametox.csv')
+        index.rows_for('idiot')          # sorted row ids (whole-word match)
+        index.rows_containing('ass')     # rows with 'ass' inside any token
+        index.save('results/level1_index.npz')
+    """
+
+    def __init__(self, vocab, offsets, postings, labels, source=None, stamp=None):
+        """
+        Args:
+            vocab: List of tokens (token id = position)
+            offsets: int64 array, postings of token i are postings[offsets[i]:offsets[i + 1]]
+            postings: uint32 array of row ids, sorted within each token
+            labels: int8 array per row (1 toxic, 0 clean, -1 unlabelled)
+            source: Path of the indexed CSV
+            stamp: [size, mtime_ns] of the source when it was indexed
+        """
+        self.vocab = list(vocab)
+        self.token_ids = {token: index for index, token in enumerate(self.vocab)}
+        self.offsets = offsets
+        self.postings = postings
+        self.labels = labels
+        self.source = source
+        self.stamp = stamp
+
+    def __len__(self):
+        return len(self.labels)
+
+    @classmethod
+    def build(cls, filepath, text_column='message', label_column='label'):
+        """Tokenize every row of a CSV (or Parquet) file and build the postings lists."""
+        import pandas as pd
+
+        from profanity_filter.columnar import read_table
+
+        df = read_table(filepath, [text_column, label_column])
+        labels = df[label_column].to_numpy(dtype=float)
+        labels = np.where(labels == 1, 1, np.where(labels == 0, 0, -1)).astype(np.int8)
+
+        tokens = df[text_column].str.lower().str.findall(_TOKEN.pattern, flags=PYTHON_RE).explode().dropna()
+        codes, vocab = pd.factorize(tokens)
+        rows = tokens.index.to_numpy(dtype=np.int64)
+        # One (token, row) pair per occurrence -> sorted, de-duplicated postings
+        pairs = np.unique(codes.astype(np.int64) * len(df) + rows)
+        token_of_pair = pairs // len(df) if len(df) else pairs
+        postings = (pairs - token_of_pair * len(df)).astype(np.uint32)
+        offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(token_of_pair, minlength=len(vocab)), out=offsets[1:])
+        return cls(list(vocab), offsets, postings, labels, str(filepath), _source_stamp(filepath))
+
+    def is_current(self, filepath):
+        """True if the index was built from filepath as it is now (size and mtime)."""
+        return self.source is not None and Path(filepath).exists() and \
+            str(Path(filepath)) == str(Path(self.source)) and \
+            np.array_equal(self.stamp, _source_stamp(filepath))
+
+    def token_rows(self, token):
+        """Rows containing token (already lowercased) as a whole \\w+ token."""
+        token_id = self.token_ids.get(token)
+        if token_id is None:
+            return np.zeros(0, dtype=np.uint32)
+        return self.postings[self.offsets[token_id]:self.offsets[token_id + 1]]
+
+    def rows_for(self, term, texts=None):
+        """
+        Rows where term matches as a whole word (same semantics as ProfanityFilter).
+
+        Args:
+            term: Listed word or phrase
+            texts: Optional callable(row_ids) -> lowercased texts, used to verify
+                   entries that are not a single plain token ("son of a", "a$$")
+
+        Returns:
+            np.ndarray: Sorted row ids
+
+        Raises:
+            ValueError: If the term needs verification and texts is None
+        """
+        term = term.strip().lower()
+        tokens = _TOKEN.findall(term)
+        if len(tokens) == 1 and tokens[0] == term:
+            return self.token_rows(term)
+        if not tokens:
+            raise ValueError(f"'{term}' has no word characters to look up in the index")
+
+        candidates = self.token_rows(tokens[0])
+        for token in tokens[1:]:
+            candidates = np.intersect1d(candidates, self.token_rows(token), assume_unique=True)
+        if not len(candidates):
+            return candidates
+        if texts is None:
+            # Candidates only share the tokens; returning them would over-count
+            raise ValueError(f"'{term}' is not a single token: pass texts to verify "
+                             f"its {len(candidates)} candidate rows")
+        regex = WordMatcher([term]).regex
+        keep = [regex.search(text) is not None for text in texts(candidates)]
+        return candidates[np.array(keep, dtype=bool)]
+
+    def rows_containing(self, substring):
+        """Rows with substring anywhere inside a token (vocabulary scan, no row scan)."""
+        substring = substring.lower()
+        matches = [self.token_rows(token) for token in self.vocab if substring in token]
+        if not matches:
+            return np.zeros(0, dtype=np.uint32)
+        return np.unique(np.concatenate(matches))
+
+    def save(self, path=DEFAULT_INDEX_FILE, state=None):
+        """Write the index (and optionally an IncrementalScorer state) to .npz."""
+        blob = '\n'.join(self.vocab).encode('utf-8')
+        arrays = {
+            'vocab': np.frombuffer(blob, dtype=np.uint8),
+            'offsets': self.offsets,
+            'postings': self.postings,
+            'labels': self.labels,
+            'source': np.array(str(self.source or '')),
+            'stamp': self.stamp if self.stamp is not None else np.zeros(2, dtype=np.int64),
+        }
+        if state is not None:
+            arrays['state_words'] = np.array('\n'.join(state['words']))
+            arrays['state_hits'] = state['hits']
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX_FILE):
+        """
+        Load an index written by save().
+
+        Returns:
+            tuple: (CorpusIndex, state dict or None)
+        """
+        with np.load(path) as data:
+            blob = data['vocab'].tobytes().decode('utf-8')
+            index = cls(blob.split('\n') if blob else [], data['offsets'], data['postings'],
+                        data['labels'], str(data['source']) or None, data['stamp'])
+            state = None
+            if 'state_words' in data:
+                words = str(data['state_words'])
+                state = {'words': words.split('\n') if words else [],
+                         'hits': data['state_hits']}
+        return index, state
+
+
+class IncrementalScorer:
+    """
+    Flagged set and confusion counts for a word list, updated by diffs.
+
+    Example:
+        scorer = IncrementalScorer(index, load_profanity_words('data/profanity_words.txt'))
+        scorer.metrics()                    # same as a full Level 1 scan
+        scorer.what_if('trash')             # metrics if 'trash' were added
+        scorer.update(new_words)            # only touches rows of changed terms
+    """
+
+    def __init__(self, index, words=(), hits=None, texts=None):
+        """
+        Args:
+            index: CorpusIndex
+            words: Initial word list
+            hits: Saved per-row match counts for `words` (skips the initial pass)
+            texts: Optional callable(row_ids) -> lowercased texts (see CorpusIndex.rows_for)
+        """
+        self.index = index
+        self.texts = texts
+        self.words = []
+        self.hits = np.zeros(len(index), dtype=np.uint16)
+        # [tn, fp, fn, tp] with nothing flagged: every labelled row is a TN or FN
+        labels = index.labels
+        self.counts = np.array([np.sum(labels == 0), 0, np.sum(labels == 1), 0], dtype=np.int64)
+        if hits is not None:
+            self.words = list(dict.fromkeys(word.strip().lower() for word in words))
+            self.hits = np.asarray(hits, dtype=np.uint16).copy()
+            self._recount()
+        else:
+            self.update(words)
+
+    def _recount(self):
+        labels = self.index.labels
+        flagged = self.hits > 0
+        self.counts = np.array([
+            np.sum(~flagged & (labels == 0)), np.sum(flagged & (labels == 0)),
+            np.sum(~flagged & (labels == 1)), np.sum(flagged & (labels == 1)),
+        ], dtype=np.int64)
+
+    @property
+    def flagged(self):
+        """Boolean mask of flagged rows."""
+        return self.hits > 0
+
+    def state(self):
+        """Word list and hit counts, for CorpusIndex.save(state=...)."""
+        return {'words': self.words, 'hits': self.hits}
+
+    def metrics(self):
+        return metrics_from_counts(self.counts)
+
+    def _shift(self, rows, direction):
+        """Move rows between (TN, FN) and (FP, TP); direction +1 flags, -1 unflags."""
+        labels = self.index.labels[rows]
+        clean, toxic = int(np.sum(labels == 0)), int(np.sum(labels == 1))
+        self.counts += direction * np.array([-clean, clean, -toxic, toxic], dtype=np.int64)
+
+    def add(self, term):
+        """Add one term; returns the row ids that became flagged."""
+        term = term.strip().lower()
+        if term in self.words:
+            return np.zeros(0, dtype=np.uint32)
+        rows = self.index.rows_for(term, self.texts)
+        newly = rows[self.hits[rows] == 0]
+        self.hits[rows] += 1
+        self._shift(newly, +1)
+        self.words.append(term)
+        return newly
+
+    def remove(self, term):
+        """Remove one term; returns the row ids that are no longer flagged."""
+        term = term.strip().lower()
+        if term not in self.words:
+            return np.zeros(0, dtype=np.uint32)
+        rows = self.index.rows_for(term, self.texts)
+        self.hits[rows] -= 1
+        cleared = rows[self.hits[rows] == 0]
+        self._shift(cleared, -1)
+        self.words.remove(term)
+        return cleared
+
+    def update(self, words):
+        """
+        Apply the diff between the current and a new word list.
+
+        Returns:
+            dict: 'added', 'removed' (terms), 'flagged' and 'unflagged' (row ids)
+        """
+        words = list(dict.fromkeys(word.strip().lower() for word in words if word.strip()))
+        wanted, current = set(words), set(self.words)
+        removed = [word for word in self.words if word not in wanted]
+        added = [word for word in words if word not in current]
+        unflagged = [self.remove(word) for word in removed]
+        flagged = [self.add(word) for word in added]
+        self.words = words
+        flagged = np.unique(np.concatenate(flagged)) if flagged else np.zeros(0, np.uint32)
+        unflagged = np.unique(np.concatenate(unflagged)) if unflagged else np.zeros(0, np.uint32)
+        # A row can be unflagged by a removal and flagged again by an addition
+        changed_back = np.intersect1d(flagged, unflagged)
+        return {
+            'added': added,
+            'removed': removed,
+            'flagged': np.setdiff1d(flagged, changed_back),
+            'unflagged': np.setdiff1d(unflagged, changed_back),
+        }
+
+    def what_if(self, term, substring=False):
+        """
+        Preview adding a term without changing the scorer.
+
+        Args:
+            term: Word or phrase
+            substring: Match inside tokens too (username-style) instead of whole words
+
+        Returns:
+            dict: 'rows' (rows the term matches), 'new_rows' (not flagged yet),
+                  'term_precision' (labelled precision of the term alone) and
+                  'metrics' (overall metrics after adding it)
+        """
+        term = term.strip().lower()
+        if substring:
+            rows = self.index.rows_containing(term)
+        else:
+            rows = self.index.rows_for(term, self.texts)
+        newly = rows[self.hits[rows] == 0]
+        labels = self.index.labels
+        term_tp, term_fp = int(np.sum(labels[rows] == 1)), int(np.sum(labels[rows] == 0))
+        clean, toxic = int(np.sum(labels[newly] == 0)), int(np.sum(labels[newly] == 1))
+        counts = self.counts + np.array([-clean, clean, -toxic, toxic], dtype=np.int64)
+        return {
+            'rows': len(rows),
+            'new_rows': len(newly),
+            'term_precision': term_tp / (term_tp + term_fp) if term_tp + term_fp else 0.0,
+            'metrics': metrics_from_counts(counts),
+        }
@@ -0,0 +1,171 @@
+"""
+Precompiled single-pass word matcher.
+
+The word list is folded into a character trie and emitted as one regular
+expression, so shared prefixes ("ass", "asshole", "assclown") are only
+tried once per position. Every message is then scanned in a single pass
+instead of once per word.
+"""
+
+import re
+
+# Passing any flag makes pandas run Python's re even on Arrow-backed string
+# columns, whose default engine (RE2) treats \b and \w as ASCII-only
+PYTHON_RE = re.UNICODE
+_NON_ASCII = r'[^\x00-\x7f]'
+
+
+def as_text(series):
+    """
+    series with a dtype that has .str.
+
+    A column (or CSV chunk) without a single string - every value missing,
+    or every message a number - is parsed as float/int; it is cast to the
+    nullable string dtype, missing values stay missing.
+    """
+    if series.dtype.kind in 'biuf':
+        return series.astype('string')
+    return series
+
+
+def series_contains(series, pattern):
+    """
+    Vectorized "pattern occurs in row" over a Series of strings, with re semantics.
+
+    On Arrow-backed strings RE2 scans every row (several times faster than
+    re), then rows containing non-ASCII characters, the only ones where its
+    word boundaries can disagree with re, are checked again with re.
+
+    Returns:
+        Boolean Series (missing values are False)
+    """
+    flagged = series.str.contains(pattern, regex=True, na=False)
+    if getattr(series.dtype, 'storage', None) == 'pyarrow':
+        unicode_rows = series.str.contains(_NON_ASCII, regex=True, na=False).to_numpy(dtype=bool)
+        if unicode_rows.any():
+            flagged[unicode_rows] = series[unicode_rows].str.contains(
+                pattern, regex=True, na=False, flags=PYTHON_RE).to_numpy(dtype=bool)
+    return flagged
+
+
+def load_profanity_words(filepath):
+    """Load profanity words from file (one word per line, lowercased)."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        words = [line.strip().lower() for line in f if line.strip()]
+    return words
+
+
+def build_trie_pattern(words, repeats=False):
+    """
+    Build a trie-optimized regex alternation for a list of words.
+
+    Args:
+        words: Iterable of literal words (already lowercased)
+        repeats: Let every character repeat ("fuuuck", "shiiit"); each
+                 character becomes `c+`
+
+    Returns:
+        str: Regex source matching any of the words, without boundaries
+    """
+    trie = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True  # end-of-word marker
+
+    return _trie_to_pattern(trie, repeats) if trie else r'(?!)'
+
+
+def _trie_to_pattern(node, repeats=False):
+    """Recursively convert a trie node into a regex fragment."""
+    is_end = '' in node
+    branches = []
+    single_chars = []
+    suffix = '+' if repeats else ''
+
+    for char in sorted(key for key in node if key):
+        child = node[char]
+        if len(child) == 1 and '' in child:
+            single_chars.append(re.escape(char) + suffix)
+        else:
+            branches.append(re.escape(char) + suffix + _trie_to_pattern(child, repeats))
+
+    # Collapse leaf characters into a character class: (?:a|b|c) -> [abc]
+    # ([ab]+ would also match "ab", so repeatable leaves stay an alternation)
+    if repeats:
+        branches.extend(single_chars)
+    elif single_chars:
+        if len(single_chars) == 1:
+            branches.append(single_chars[0])
+        else:
+            branches.append('[' + ''.join(single_chars) + ']')
+
+    if len(branches) == 1 and not is_end:
+        return branches[0]
+
+    pattern = '(?:' + '|'.join(branches) + ')'
+    if is_end:
+        pattern += '?'
+    return pattern
+
+
+class WordMatcher:
+    """
+    Compiled matcher for a fixed word list.
+
+    Build it once and reuse it for every message; the compiled pattern is
+    immutable, so a single instance can be shared between threads.
+    """
+
+    def __init__(self, words, word_boundaries=True, repeats=False):
+        """
+        Args:
+            words: Iterable of profanity words
+            word_boundaries: Wrap the alternation in \\b...\\b (whole words only)
+            repeats: Also match words with repeated letters ("fuuuck")
+        """
+        self.words = list(dict.fromkeys(word.strip().lower() for word in words if word.strip()))
+        self.word_boundaries = word_boundaries
+        self.repeats = repeats
+        self._canonical = {_squeeze(word): word for word in reversed(self.words)}
+
+        body = build_trie_pattern(self.words, repeats)
+        if word_boundaries:
+            self.pattern = r'\b(?:' + body + r')\b'
+        else:
+            self.pattern = '(?:' + body + ')'
+        self.regex = re.compile(self.pattern)
+
+    @classmethod
+    def from_file(cls, filepath, word_boundaries=True):
+        """Build a matcher from a word-list file."""
+        return cls(load_profanity_words(filepath), word_boundaries=word_boundaries)
+
+    def __len__(self):
+        return len(self.words)
+
+    def search(self, text):
+        """Return the first match object in text, or None."""
+        return self.regex.search(text.lower())
+
+    def contains(self, text):
+        """Return True if text contains any word from the list."""
+        return self.regex.search(text.lower()) is not None
+
+    def findall(self, text):
+        """Return every (non-overlapping) matched word in text."""
+        return self.regex.findall(text.lower())
+
+    def canonical(self, matched):
+        """Map matched text back to its list word ("fuuuck" -> "fuck" with repeats)."""
+        if not self.repeats:
+            return matched
+        return self._canonical.get(_squeeze(matched), matched)
+
+
+def _squeeze(word):
+    """Collapse every run of a repeated character to one ("assss" -> "as")."""
+    return ''.join(char for index, char in enumerate(word) if index == 0 or word[index - 1] != char)
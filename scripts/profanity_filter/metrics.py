@@ -0,0 +1,172 @@
+"""
+Vectorized classification metrics.
+
+The confusion matrix is computed in one NumPy pass: each row is encoded as
+2 * label + prediction (0=TN, 1=FP, 2=FN, 3=TP) and counted with bincount.
+Large inputs are processed in fixed-size blocks so the temporary code array
+never grows with the data. Grouped breakdowns (per word, per message-length
+bucket, ...) use the same trick with group_id * 4 + code.
+"""
+
+import numpy as np
+
+BLOCK_ROWS = 1 << 22
+LENGTH_BUCKETS = [0, 10, 25, 50, 100]
+
+
+def _codes(y_true, y_pred):
+    """Encode rows as 0=TN, 1=FP, 2=FN, 3=TP; rows whose label is not 0/1 (e.g. NaN) become -1."""
+    true = np.asarray(y_true)
+    pred = np.asarray(y_pred)
+    if true.dtype.kind == 'O':
+        true = true.astype(float)
+    toxic = true == 1
+    known = toxic | (true == 0)
+    codes = (toxic.astype(np.int8) << 1) | (pred != 0)
+    codes[~known] = -1
+    return codes
+
+
+def confusion_counts(y_true, y_pred):
+    """
+    Count TN/FP/FN/TP in a single pass.
+
+    Args:
+        y_true: Array-like of 0/1 labels (NaN labels are ignored)
+        y_pred: Array-like of 0/1 (or boolean) predictions
+
+    Returns:
+        np.ndarray: int64 counts [tn, fp, fn, tp]
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    counts = np.zeros(4, dtype=np.int64)
+    for start in range(0, len(y_true), BLOCK_ROWS):
+        codes = _codes(y_true[start:start + BLOCK_ROWS], y_pred[start:start + BLOCK_ROWS])
+        counts += np.bincount(codes[codes >= 0], minlength=4)
+    return counts
+
+
+def grouped_confusion_counts(y_true, y_pred, groups, n_groups):
+    """
+    Confusion counts per group in a single pass.
+
+    Args:
+        groups: Integer group id per row in [0, n_groups); negative ids are skipped
+
+    Returns:
+        np.ndarray: shape (n_groups, 4) int64 counts [tn, fp, fn, tp]
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    groups = np.asarray(groups)
+    counts = np.zeros(n_groups * 4, dtype=np.int64)
+    for start in range(0, len(y_true), BLOCK_ROWS):
+        stop = start + BLOCK_ROWS
+        codes = _codes(y_true[start:stop], y_pred[start:stop]).astype(np.int64)
+        block_groups = groups[start:stop].astype(np.int64)
+        keep = (codes >= 0) & (block_groups >= 0)
+        counts += np.bincount(block_groups[keep] * 4 + codes[keep], minlength=n_groups * 4)
+    return counts.reshape(n_groups, 4)
+
+
+def metrics_from_counts(counts):
+    """
+    Derive accuracy, precision, recall and F1 from [tn, fp, fn, tp].
+
+    Returns:
+        dict: accuracy, precision, recall, f1, tp, fp, tn, fn
+    """
+    tn, fp, fn, tp = (int(c) for c in counts)
+    total = tp + tn + fp + fn
+    accuracy = (tp + tn) / total if total > 0 else 0
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 0
+    f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
+
+    return {
+        'accuracy': accuracy,
+        'precision': precision,
+        'recall': recall,
+        'f1': f1,
+        'tp': tp,
+        'fp': fp,
+        'tn': tn,
+        'fn': fn
+    }
+
+
+def calculate_metrics(y_true, y_pred):
+    """Calculate classification metrics (vectorized)."""
+    return metrics_from_counts(confusion_counts(y_true, y_pred))
+
+
+def length_bucket_ids(lengths, edges=LENGTH_BUCKETS):
+    """Map message lengths to bucket ids (0 .. len(edges) - 1)."""
+    return np.digitize(np.asarray(lengths), edges[1:], right=False)
+
+
+def length_bucket_labels(edges=LENGTH_BUCKETS):
+    """Human-readable names for length_bucket_ids, e.g. '10-24', '100+'."""
+    labels = [f"{low}-{high - 1}" for low, high in zip(edges, edges[1:])]
+    labels.append(f"{edges[-1]}+")
+    return labels
+
+
+class ConfusionAccumulator:
+    """
+    Streaming confusion matrix, optionally broken down by named groups.
+
+    Example:
+        acc = ConfusionAccumulator()
+        for chunk in chunks:
+            acc.update(chunk['label'], chunk['flagged'])
+        acc.metrics()
+    """
+
+    def __init__(self):
+        self.counts = np.zeros(4, dtype=np.int64)
+        self.groups = {}
+
+    def update(self, y_true, y_pred):
+        self.counts += confusion_counts(y_true, y_pred)
+
+    def update_grouped(self, name, y_true, y_pred, group_ids, group_labels):
+        """
+        Add per-group counts under `name` (e.g. 'length' or 'word').
+
+        Args:
+            group_ids: Integer id per row indexing into group_labels (-1 = skip)
+            group_labels: List of group names
+        """
+        counts = grouped_confusion_counts(y_true, y_pred, group_ids, len(group_labels))
+        table = self.groups.setdefault(name, {})
+        for label, row in zip(group_labels, counts):
+            if label in table:
+                table[label] += row
+            else:
+                table[label] = row.copy()
+
+    def merge(self, other):
+        """Add another accumulator's counts (e.g. from a worker)."""
+        self.counts += other.counts
+        for name, table in other.groups.items():
+            for label, row in table.items():
+                mine = self.groups.setdefault(name, {})
+                mine[label] = mine[label] + row if label in mine else row.copy()
+
+    def metrics(self):
+        return metrics_from_counts(self.counts)
+
+    def group_metrics(self, name):
+        """Metrics dict per group label for a breakdown added with update_grouped."""
+        return {label: metrics_from_counts(row) for label, row in self.groups.get(name, {}).items()}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
@@ -0,0 +1,391 @@
+"""
+Per-locale word lists, routed by a cheap language detector.
+
+One word list per locale lives in data/locales/<locale>.txt (English stays
+in data/profanity_words.txt). Each message is routed to the matchers of
+the locales it could be written in, and a locale's matcher is only read
+and compiled the first time a message is routed to it, so startup and
+memory follow the languages actually seen, not the number supported:
+
+    word_filter = MultilingualFilter.from_directory('data/locales')
+    word_filter.check("eres un pendejo")     # True (routed to en + es)
+    word_filter.loaded_locales               # ('en', 'es')
+
+LocaleDetector does no statistics. It looks at what chat messages actually
+give away:
+1. Script: any Cyrillic letter routes to the Cyrillic-script locales
+2. Letters only some Latin-script languages use (ñ, ß, ç, ã, ...)
+3. Short function words distinctive to a language ("eres", "nicht", "você")
+
+Chat lines are short and code-mixed, so detection only adds locales: the
+default locales (English) are always checked, and a message that looks
+both Spanish and Portuguese goes to both matchers. A line with no hint at
+all ("gg ez idiota") is only checked against the default locales; list
+such locales in default_locales when their players mostly chat that way.
+"""
+
+import re
+import threading
+from pathlib import Path
+
+from profanity_filter.filter import DEFAULT_WORDS_FILE, ProfanityFilter, is_missing
+from profanity_filter.matcher import (
+    as_text,
+    build_trie_pattern,
+    load_profanity_words,
+    series_contains,
+)
+from profanity_filter.normalize import normalize_text
+
+DEFAULT_LOCALES_DIR = Path('data/locales')
+DEFAULT_LOCALES = ('en',)
+
+# Locales not listed here are written in Latin script
+LOCALE_SCRIPTS = {
+    'ru': 'cyrillic', 'uk': 'cyrillic', 'bg': 'cyrillic', 'sr': 'cyrillic',
+    'el': 'greek', 'ar': 'arabic', 'he': 'hebrew', 'ja': 'cjk', 'zh': 'cjk', 'ko': 'hangul',
+}
+SCRIPT_RANGES = {
+    'cyrillic': [(0x0400, 0x052F)],
+    'greek': [(0x0370, 0x03FF)],
+    'arabic': [(0x0600, 0x06FF)],
+    'hebrew': [(0x0590, 0x05FF)],
+    'cjk': [(0x3040, 0x30FF), (0x4E00, 0x9FFF)],
+    'hangul': [(0xAC00, 0xD7AF)],
+}
+
+# Letters that only some Latin-script languages use
+HINT_CHARS = {
+    'es': 'ñ¿¡áéíóú',
+    'de': 'ßäöü',
+    'fr': 'çàâèéêëîïôûœ',
+    'pt': 'ãõçáâéêíóôú',
+}
+
+# Frequent short words of each language that are not English words, English
+# names or chat abbreviations ("con", "est", "das", "los" and "mal" are left
+# out: English chat would otherwise be routed to es/fr/de/pt)
+HINT_WORDS = {
+    'es': ('que', 'por', 'para', 'eres', 'muy', 'pero', 'esto', 'eso', 'estoy', 'tengo',
+           'jugar', 'juego', 'equipo', 'gracias', 'hola', 'vamos', 'ahora', 'porque',
+           'como', 'cuando', 'donde', 'todos', 'siempre', 'una', 'tu', 'aqui', 'esta'),
+    'de': ('ich', 'und', 'nicht', 'ist', 'bist', 'ein', 'eine', 'auf', 'aber', 'wie',
+           'noch', 'schon', 'spielen', 'danke', 'hallo', 'doch', 'jetzt', 'warum', 'sehr',
+           'kein', 'keine'),
+    'fr': ('je', 'tu', 'une', 'mais', 'avec', 'qui', 'quoi', 'merci', 'bonjour', 'salut',
+           'joue', 'jouer', 'vous', 'nous', 'toi', 'sont', 'tres'),
+    'pt': ('voce', 'nao', 'que', 'por', 'para', 'muito', 'obrigado', 'jogo', 'jogar', 'isso',
+           'aqui', 'uma', 'vai', 'pra', 'esta', 'tu'),
+}
+
+_NONE = frozenset()
+
+
+def _hint_pattern(words, chars, ranges):
+    """Regex source matching any hint word (whole word) or any single hint letter."""
+    parts = []
+    if words:
+        parts.append(r'\b(?:' + build_trie_pattern(sorted(words)) + r')\b')
+    if chars or ranges:
+        parts.append('[' + ''.join(re.escape(char) for char in sorted(chars)) +
+                     ''.join(f'{chr(low)}-{chr(high)}' for low, high in ranges) + ']')
+    return '|'.join(parts) or r'(?!)'
+
+
+class LocaleDetector:
+    """
+    Which of the given locales a message could be written in.
+
+    All hint words are folded into one compiled regex (hint letters into a
+    second one, only run on non-ASCII text), so a plain English message
+    costs a single scan, like a word-list check; only the hits are looked
+    up. `pattern` (every hint) and pattern_for(locale) are the regex
+    sources for vectorized routing of whole columns.
+    """
+
+    def __init__(self, locales, hint_words=None, hint_chars=None):
+        """
+        Args:
+            locales: Locales that have a word list (others are never returned)
+            hint_words: locale -> distinctive words (default: HINT_WORDS)
+            hint_chars: locale -> distinctive letters (default: HINT_CHARS)
+        """
+        hint_words = HINT_WORDS if hint_words is None else hint_words
+        hint_chars = HINT_CHARS if hint_chars is None else hint_chars
+        self.locales = tuple(locales)
+        self._patterns = {}
+        locales_of = {}
+        all_words, all_chars, all_ranges = set(), set(), []
+        for locale in self.locales:
+            words = set(hint_words.get(locale, ()))
+            chars = set(hint_chars.get(locale, ''))
+            ranges = SCRIPT_RANGES.get(LOCALE_SCRIPTS.get(locale), [])
+            for hint in words | chars:
+                locales_of.setdefault(hint, set()).add(locale)
+            for low, high in ranges:
+                for code in range(low, high + 1):
+                    locales_of.setdefault(chr(code), set()).add(locale)
+            self._patterns[locale] = _hint_pattern(words, chars, ranges)
+            all_words |= words
+            all_chars |= chars
+            all_ranges += [span for span in ranges if span not in all_ranges]
+        self._locales_of = {hint: frozenset(found) for hint, found in locales_of.items()}
+        self.pattern = _hint_pattern(all_words, all_chars, all_ranges)
+        # Letter hints only matter for non-ASCII text, so they get their own scan
+        self._word_regex = re.compile(_hint_pattern(all_words, (), ()))
+        self._char_regex = re.compile(_hint_pattern((), all_chars, all_ranges))
+
+    def pattern_for(self, locale):
+        """Regex source of one locale's hints (for pandas .str on lowercased text)."""
+        return self._patterns.get(locale, r'(?!)')
+
+    def detect_lowered(self, lowered):
+        """detect() for text that is already lowercased."""
+        hits = self._word_regex.findall(lowered)
+        if not lowered.isascii():
+            hits += self._char_regex.findall(lowered)
+        if not hits:
+            return _NONE
+        locales_of = self._locales_of
+        found = set()
+        for hit in set(hits):
+            found |= locales_of[hit]
+        return frozenset(found)
+
+    def detect(self, text):
+        """
+        Returns:
+            frozenset: Locales with evidence in text (empty for plain English)
+        """
+        return _NONE if is_missing(text) else self.detect_lowered(text.lower())
+
+
+class MultilingualFilter:
+    """
+    ProfanityFilter API over per-locale word lists with lazy matchers.
+
+    explain() adds a 'locale' key. Matchers are built on first use behind
+    a lock, like ProfanityFilter.matcher, so one instance can be shared
+    between threads; pickling (worker processes) sends only the file list.
+    """
+
+    def __init__(self, locale_files, default_locales=DEFAULT_LOCALES, normalize=False,
+                 detector=None):
+        """
+        Args:
+            locale_files: Mapping of locale -> word-list file
+            default_locales: Locales every message is checked against
+            normalize: Normalize messages and word lists (see normalize.py)
+            detector: LocaleDetector (default: built for locale_files on first use)
+        """
+        self.locale_files = {locale: Path(path) for locale, path in locale_files.items()}
+        unknown = [locale for locale in default_locales if locale not in self.locale_files]
+        if unknown:
+            raise ValueError(f"default locales without a word list: {', '.join(unknown)}")
+        self.default_locales = tuple(default_locales)
+        self._normalize = normalize
+        self._detector = detector
+        self._filters = {}
+        self._words = {}
+        self._routes = {}
+        self._searches = {}
+        self._lock = threading.Lock()
+        self.stats = {'messages': 0, 'routed': dict.fromkeys(self.locale_files, 0)}
+
+    def __getstate__(self):
+        return {'locale_files': self.locale_files, 'default_locales': self.default_locales,
+                'normalize': self._normalize}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @classmethod
+    def from_directory(cls, directory=DEFAULT_LOCALES_DIR, default_file=DEFAULT_WORDS_FILE,
+                       default_locales=DEFAULT_LOCALES, normalize=False):
+        """
+        One locale per <locale>.txt in directory; 'en' falls back to default_file.
+
+        Only the directory listing is read here; word lists are read when
+        their locale is first needed.
+        """
+        locale_files = {path.stem: path for path in sorted(Path(directory).glob('*.txt'))}
+        if 'en' not in locale_files and Path(default_file).exists():
+            locale_files = {'en': Path(default_file), **locale_files}
+        return cls(locale_files, default_locales=default_locales, normalize=normalize)
+
+    @property
+    def detector(self):
+        """The LocaleDetector, built on first use like the matchers."""
+        detector = self._detector
+        if detector is None:
+            with self._lock:
+                if self._detector is None:
+                    self._detector = LocaleDetector(self.locale_files)
+                detector = self._detector
+        return detector
+
+    @property
+    def locales(self):
+        """Every locale with a word list."""
+        return tuple(self.locale_files)
+
+    @property
+    def loaded_locales(self):
+        """Locales whose matcher has been built so far."""
+        return tuple(locale for locale in self.locale_files if locale in self._filters)
+
+    @property
+    def normalize(self):
+        return self._normalize
+
+    def words_for(self, locale):
+        """A locale's word list (normalized when normalize=True), read once."""
+        words = self._words.get(locale)
+        if words is None:
+            words = load_profanity_words(self.locale_files[locale])
+            if self._normalize:
+                # Lists are written with accents; normalized messages lose them
+                words = list(dict.fromkeys(normalize_text(word) for word in words))
+            self._words[locale] = words
+        return words
+
+    def filter_for(self, locale):
+        """The locale's ProfanityFilter, built exactly once on first access."""
+        word_filter = self._filters.get(locale)
+        if word_filter is None:
+            with self._lock:
+                if locale not in self._filters:
+                    word_filter = ProfanityFilter(self.words_for(locale), normalize=self._normalize)
+                    word_filter.matcher  # compile while holding the lock, exactly once
+                    self._filters[locale] = word_filter
+                word_filter = self._filters[locale]
+        return word_filter
+
+    @property
+    def words(self):
+        """All words of every locale (reads the lists but compiles nothing)."""
+        return list(dict.fromkeys(word for locale in self.locale_files
+                                  for word in self.words_for(locale)))
+
+    def _route_lowered(self, lowered):
+        detected = (self._detector or self.detector).detect_lowered(lowered)
+        route = self._routes.get(detected)
+        if route is None:
+            route = tuple(locale for locale in self.locale_files
+                          if locale in self.default_locales or locale in detected)
+            self._routes[detected] = route
+        return route
+
+    def route(self, text):
+        """Locales text is checked against, in word-list order."""
+        if is_missing(text):
+            return self.default_locales
+        return self._route_lowered(text.lower())
+
+    def prepare(self, text):
+        """The string the matchers see: lowercased, and normalized if enabled."""
+        return normalize_text(text) if self._normalize else text.lower()
+
+    def _prepared(self, text):
+        lowered = text.lower()
+        prepared = normalize_text(text) if self._normalize else lowered
+        return self._route_lowered(lowered), prepared
+
+    def check(self, text):
+        """Return True if text contains a word from any locale it is routed to."""
+        if is_missing(text):
+            return False
+        route, prepared = self._prepared(text)
+        searches = self._searches.get(route)
+        if searches is None:
+            searches = tuple(self.filter_for(locale).matcher.regex.search for locale in route)
+            self._searches[route] = searches
+        for search in searches:
+            if search(prepared) is not None:
+                return True
+        return False
+
+    def check_many(self, texts):
+        return [self.check(text) for text in texts]
+
+    def explain(self, text):
+        """
+        Matches from every routed locale, ordered by position.
+
+        Returns:
+            list: Dicts with 'word', 'locale', 'start' and 'end' (offsets into
+                  the lowercased, or normalized, text)
+        """
+        if is_missing(text):
+            return []
+        route, prepared = self._prepared(text)
+        return self.explain_prepared(prepared, route)
+
+    def explain_prepared(self, prepared, route=None):
+        """
+        explain() for text that has already been through prepare().
+
+        Args:
+            prepared: Output of prepare()
+            route: route() of the raw text. Without it routing sees the
+                   prepared text, where normalize=True has already removed
+                   accents and folded Cyrillic lookalikes to Latin
+        """
+        if route is None:
+            route = self._route_lowered(prepared)
+        return sorted((dict(match, locale=locale)
+                       for locale in route
+                       for match in self.filter_for(locale).explain_prepared(prepared)),
+                      key=lambda match: match['start'])
+
+    def describe(self, text):
+        """One-line explanation, e.g. "'pendejo' (es) at 8-15"."""
+        return '; '.join(f"'{m['word']}' ({m['locale']}) at {m['start']}-{m['end']}"
+                         for m in self.explain(text))
+
+    def prepare_series(self, series):
+        """prepare() over a pandas Series (non-strings become NaN)."""
+        if not self._normalize:
+            return as_text(series).str.lower()
+        return series.map(lambda text: None if is_missing(text) else normalize_text(text))
+
+    def flag_series(self, series):
+        """
+        Vectorized check(): one column scan finds the rows with any locale
+        hint, each locale's hints then select its rows among those, and
+        its matcher scans only its rows.
+        """
+        import numpy as np
+        import pandas as pd
+
+        lowered = as_text(series).str.lower()
+        prepared = self.prepare_series(series) if self._normalize else lowered
+        flagged = np.zeros(len(series), dtype=bool)
+        self.stats['messages'] += len(series)
+        # Rows with any hint at all; only these are scanned once per locale
+        hinted = series_contains(lowered, self.detector.pattern).to_numpy(dtype=bool)
+        candidates = lowered[hinted]
+        for locale in self.locale_files:
+            if locale in self.default_locales:
+                rows = np.ones(len(series), dtype=bool)
+            else:
+                if not len(candidates):
+                    continue
+                rows = np.zeros(len(series), dtype=bool)
+                rows[hinted] = series_contains(candidates, self.detector.pattern_for(locale)
+                                               ).to_numpy(dtype=bool)
+                if not rows.any():
+                    continue
+            self.stats['routed'][locale] += int(rows.sum())
+            rows = rows & ~flagged
+            if rows.any():
+                flagged[rows] = series_contains(prepared[rows],
+                                                self.filter_for(locale).pattern).to_numpy(dtype=bool)
+        return pd.Series(flagged, index=series.index)
+
+    def first_words(self, series):
+        """First matched word per row, across locales (None where clean)."""
+        def first(text):
+            matches = self.explain(text)
+            return matches[0]['word'] if matches else None
+        return series.map(first)
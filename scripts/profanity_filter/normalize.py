@@ -0,0 +1,214 @@
+"""
+Leetspeak / obfuscation normalization, run before matching.
+
+Everything is precomputed at import time so a message costs a few
+microseconds:
+1. One translate pass maps leetspeak digits/symbols to letters
+   ("sh1t" -> "shit", "a$$" -> "ass"). Numbers - tokens of digits and
+   symbols only, such as "455", "$100" or "1+1" - are left alone, so digits
+   only change next to letters. ASCII messages (almost all chat) use a
+   bytes table; others first get NFKD ("ｆｕｃｋ" -> "fuck", "ü" -> "u" + mark)
+   and a str table that also folds Cyrillic/Greek lookalikes and drops
+   combining marks
+2. "!" between letters becomes "i" ("sh!t"), but not trailing "hell!"
+3. Runs of single characters split by separators are joined
+   ("f.u.c.k", "s h i t" -> "fuck", "shit"). A run is joined into one word,
+   so "f u c k u" becomes "fucku" and is not matched as "fuck"
+
+Repeated letters ("fuuuuck", "shiiit") are collapsed by the matcher itself:
+build_trie_pattern(repeats=True) lets every character repeat, which is
+cheaper than a substitution pass over every message.
+
+Offsets reported on normalized text refer to the normalized string;
+normalize_with_offsets() also maps each normalized character back to the
+raw message (used for redaction, see redact.py).
+"""
+
+import re
+import unicodedata
+
+LEET = {
+    '0': 'o', '1': 'i', '3': 'e', '4': 'a', '5': 's', '7': 't', '8': 'b', '9': 'g',
+    '@': 'a', '$': 's', '+': 't',
+}
+
+# Lowercase lookalikes from Cyrillic and Greek (uppercase is lowered first)
+CONFUSABLES = {
+    'а': 'a', 'в': 'b', 'е': 'e', 'ё': 'e', 'к': 'k', 'м': 'm', 'н': 'h', 'о': 'o',
+    'р': 'p', 'с': 'c', 'т': 't', 'у': 'y', 'х': 'x', 'ѕ': 's', 'і': 'i', 'ј': 'j',
+    'ԁ': 'd', 'ɡ': 'g', 'α': 'a', 'β': 'b', 'ε': 'e', 'ι': 'i', 'κ': 'k', 'ν': 'v',
+    'ο': 'o', 'ρ': 'p', 'τ': 't', 'υ': 'u', 'χ': 'x', '€': 'e',
+}
+
+ASCII_TABLE = bytes.maketrans(''.join(LEET).encode('ascii'),
+                              ''.join(LEET.values()).encode('ascii'))
+UNICODE_TABLE = str.maketrans({
+    **LEET,
+    **CONFUSABLES,
+    # Combining diacritical marks left behind by NFKD
+    **{chr(code): None for code in range(0x0300, 0x0370)},
+})
+
+# A token of digits and leet symbols only ("455", "$100", "1+1"): not leetspeak
+_NUMBER = re.compile(r"(?<![^\W_])(?<![@$+])[\d@$+]*\d[\d@$+]*(?![^\W_])(?![@$+])")
+_DIGITS = b'0123456789'
+
+_CHAR = r"[^\W_]"
+_SEPARATOR = r"[\s._\-*~,/\\]+"
+# Three or more single characters split by the same separator: "f.u.c.k", "s h i t".
+# The backreference keeps a word with a different separator out ("f.u.c.k u" ->
+# "fuck u"); same-separator singles are all joined ("f u c k u" -> "fucku").
+_SPACED = re.compile(rf"(?<!{_CHAR}){_CHAR}({_SEPARATOR}){_CHAR}(?!{_CHAR})(?:\1{_CHAR}(?!{_CHAR}))+")
+_SEPARATORS = re.compile(_SEPARATOR)
+_INNER_BANG = re.compile(r"(?<=[a-z])!+(?=[a-z])")
+
+
+def _join_spaced(match):
+    return _SEPARATORS.sub('', match.group())
+
+
+def _numbers(text):
+    """Spans of the number tokens the leet translation skips."""
+    return [match.span() for match in _NUMBER.finditer(text)]
+
+
+def _translate_ascii(text):
+    """ASCII_TABLE over lowercased ASCII text, keeping number tokens."""
+    data = text.encode('ascii')
+    translated = data.translate(ASCII_TABLE).decode('ascii')
+    if len(data.translate(None, _DIGITS)) == len(data):
+        return translated  # no digits, so no numbers (the common case)
+    pieces = []
+    position = 0
+    for start, end in _numbers(text):
+        # The table maps one character to one, so offsets line up
+        pieces.append(translated[position:start])
+        pieces.append(text[start:end])
+        position = end
+    pieces.append(translated[position:])
+    return ''.join(pieces)
+
+
+def _translate_unicode(text):
+    """UNICODE_TABLE over decomposed, lowercased text, keeping number tokens."""
+    pieces = []
+    position = 0
+    for start, end in _numbers(text):
+        pieces.append(text[position:start].translate(UNICODE_TABLE))
+        pieces.append(text[start:end])
+        position = end
+    pieces.append(text[position:].translate(UNICODE_TABLE))
+    return ''.join(pieces)
+
+
+def normalize_text(text):
+    """
+    Undo common obfuscations so the word list can match.
+
+    Args:
+        text: Raw message (any case)
+
+    Returns:
+        str: Lowercased, de-obfuscated text
+    """
+    if text.isascii():
+        text = _translate_ascii(text.lower())
+    else:
+        text = _translate_unicode(unicodedata.normalize('NFKD', text).lower())
+    if '!' in text:
+        text = _INNER_BANG.sub('i', text)
+    return _SPACED.sub(_join_spaced, text)
+
+
+def _rewrite(text, starts, ends, pattern, replace):
+    """
+    pattern.sub over text, carrying each character's source span along.
+
+    Args:
+        text: Partly normalized text
+        starts, ends: Source span of every character of text (None = identity)
+        pattern: Compiled regex to substitute
+        replace: callable(match) -> list of (string, low, high); the string
+                 stands for text[low:high]
+
+    Returns:
+        tuple: (text, starts, ends), unchanged when nothing matched
+    """
+    matches = list(pattern.finditer(text))
+    if not matches:
+        return text, starts, ends
+    if starts is None:
+        starts = range(len(text))
+        ends = range(1, len(text) + 1)
+    pieces, new_starts, new_ends = [], [], []
+    position = 0
+    for match in matches:
+        pieces.append(text[position:match.start()])
+        new_starts.extend(starts[position:match.start()])
+        new_ends.extend(ends[position:match.start()])
+        for piece, low, high in replace(match):
+            pieces.append(piece)
+            new_starts.extend([starts[low]] * len(piece))
+            new_ends.extend([ends[high - 1]] * len(piece))
+        position = match.end()
+    pieces.append(text[position:])
+    new_starts.extend(starts[position:])
+    new_ends.extend(ends[position:])
+    return ''.join(pieces), new_starts, new_ends
+
+
+def _spaced_pieces(match):
+    """The characters _join_spaced keeps, as (char, low, high) pieces."""
+    text = match.string
+    pieces = []
+    position = match.start()
+    for separator in _SEPARATORS.finditer(text, match.start(), match.end()):
+        pieces.append((text[position:separator.start()], position, separator.start()))
+        position = separator.end()
+    pieces.append((text[position:match.end()], position, match.end()))
+    return pieces
+
+
+def normalize_with_offsets(text):
+    """
+    normalize_text() plus where each normalized character came from.
+
+    Non-ASCII messages are decomposed one character at a time, which differs
+    from normalize_text() only in rare contextual cases (a word-final Greek
+    sigma, combining marks that NFKD would reorder across characters).
+
+    Args:
+        text: Raw message (any case)
+
+    Returns:
+        tuple: (normalized, starts, ends) where normalized[i] came from
+               text[starts[i]:ends[i]]; starts and ends are None when the
+               normalized text lines up one-to-one with text
+    """
+    starts = ends = None
+    if text.isascii():
+        normalized = _translate_ascii(text.lower())
+    else:
+        # Decompose per character, then translate outside number tokens;
+        # dropped combining marks take their offsets with them
+        decomposed, sources = [], []
+        for position, char in enumerate(text):
+            piece = unicodedata.normalize('NFKD', char).lower()
+            decomposed.append(piece)
+            sources.extend([position] * len(piece))
+        decomposed = ''.join(decomposed)
+        keep = bytearray(len(decomposed))
+        for start, end in _numbers(decomposed):
+            keep[start:end] = b'\x01' * (end - start)
+        pieces, starts, ends = [], [], []
+        for index, char in enumerate(decomposed):
+            piece = char if keep[index] else char.translate(UNICODE_TABLE)
+            pieces.append(piece)
+            starts.extend([sources[index]] * len(piece))
+            ends.extend([sources[index] + 1] * len(piece))
+        normalized = ''.join(pieces)
+    if '!' in normalized:
+        normalized, starts, ends = _rewrite(
+            normalized, starts, ends, _INNER_BANG,
+            lambda match: [('i', match.start(), match.end())])
+    return _rewrite(normalized, starts, ends, _SPACED, _spaced_pieces)
@@ -0,0 +1,63 @@
+"""
+Multi-core flagging with a process pool.
+
+The main process keeps reading chunks and accumulating results; only the
+regex scan runs in worker processes. Each worker builds its compiled
+matcher once (pool initializer) and returns just a boolean mask per chunk.
+Masks come back in submission order, so merged counts and flagged rows are
+identical whatever the worker count.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from profanity_filter import profiling
+
+_worker_filter = None
+
+
+def _init_worker(word_filter):
+    """Pool initializer: keep one filter per worker process."""
+    global _worker_filter
+    _worker_filter = word_filter
+    # Compile once, before the first chunk arrives (compiled dictionaries have nothing to build)
+    getattr(_worker_filter, 'matcher', None)
+
+
+def _flag_texts(texts):
+    """Worker task: return the flagged mask for a Series of texts."""
+    return _worker_filter.flag_series(texts).to_numpy()
+
+
+def flag_chunks_parallel(chunks, word_filter, text_column, workers):
+    """
+    Parallel version of streaming.flag_chunks.
+
+    At most 2 * workers chunks are in flight, so memory stays bounded by the
+    chunk size even for very large files.
+
+    Args:
+        chunks: Iterable of DataFrame chunks
+        word_filter: ProfanityFilter (pickled once into each worker)
+        text_column: Column to scan
+        workers: Number of worker processes
+
+    Yields:
+        Each chunk, in input order, with a boolean 'flagged' column added
+    """
+    max_in_flight = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(word_filter,)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((chunk, pool.submit(_flag_texts, chunk[text_column])))
+            if len(pending) >= max_in_flight:
+                yield _collect(*pending.popleft())
+        while pending:
+            yield _collect(*pending.popleft())
+
+
+def _collect(chunk, future):
+    with profiling.stage('parallel_wait'):
+        chunk['flagged'] = future.result()
+    return chunk
@@ -0,0 +1,267 @@
+"""
+Lightweight per-stage timing for the pipelines.
+
+Library code wraps its stages in `stage(name)` and bumps `count(name)`;
+both go to the active Profiler, which is a no-op until a script enables
+one, so instrumented code costs next to nothing by default.
+
+    profiler = enable('level1')
+    with stage('csv_load'):
+        df = pd.read_csv(...)
+    count('rows', len(df))
+    profiler.report()                        # per-stage breakdown
+    profiler.save('results/level1.json')     # or .prom for Prometheus text
+
+Stages are timed with perf_counter and accumulate calls/total/min/max.
+Concurrent stages (the async LLM calls) overlap, so their totals can add
+up to more than the wall time. For deep dives, ProfilingSession can also
+run cProfile or pyinstrument (optional dependency) around a whole script.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+DEEP_PROFILERS = ('cprofile', 'pyinstrument')
+_NULL_CONTEXT = nullcontext()
+
+
+class Profiler:
+    """Accumulates stage timings and counters for one pipeline run."""
+
+    def __init__(self, name='pipeline'):
+        self.name = name
+        self.started = time.perf_counter()
+        self.stages = {}     # name -> [calls, total, min, max], in first-seen order
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, seconds):
+        """Record one timed call of a stage."""
+        with self._lock:
+            entry = self.stages.get(name)
+            if entry is None:
+                self.stages[name] = [1, seconds, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = min(entry[2], seconds)
+                entry[3] = max(entry[3], seconds)
+
+    @contextmanager
+    def stage(self, name):
+        """Time the body of a with-block as one call of `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def timed_iter(self, name, iterable):
+        """Yield from iterable, timing each next() as a call of `name` (e.g. chunk reads)."""
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add(name, time.perf_counter() - start)
+            yield item
+
+    def to_dict(self):
+        """Plain dict: wall time, stages (calls/total/mean/min/max seconds) and counters."""
+        return {
+            'pipeline': self.name,
+            'wall_seconds': time.perf_counter() - self.started,
+            'stages': {
+                name: {'calls': calls, 'total_seconds': total, 'mean_seconds': total / calls,
+                       'min_seconds': low, 'max_seconds': high}
+                for name, (calls, total, low, high) in self.stages.items()
+            },
+            'counters': dict(self.counters),
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self, prefix='profanity_filter'):
+        """Prometheus text exposition format."""
+        data = self.to_dict()
+        label = f'pipeline="{self.name}"'
+        lines = [
+            f"# HELP {prefix}_wall_seconds Wall time of the pipeline run.",
+            f"# TYPE {prefix}_wall_seconds gauge",
+            f"{prefix}_wall_seconds{{{label}}} {data['wall_seconds']:.6f}",
+            f"# HELP {prefix}_stage_seconds_total Time spent in each pipeline stage.",
+            f"# TYPE {prefix}_stage_seconds_total counter",
+        ]
+        lines += [f'{prefix}_stage_seconds_total{{{label},stage="{name}"}} '
+                  f"{stage['total_seconds']:.6f}" for name, stage in data['stages'].items()]
+        lines += [f"# HELP {prefix}_stage_calls_total Timed calls of each pipeline stage.",
+                  f"# TYPE {prefix}_stage_calls_total counter"]
+        lines += [f'{prefix}_stage_calls_total{{{label},stage="{name}"}} {stage["calls"]}'
+                  for name, stage in data['stages'].items()]
+        lines += [f"# HELP {prefix}_events_total Pipeline counters (rows, requests, ...).",
+                  f"# TYPE {prefix}_events_total counter"]
+        lines += [f'{prefix}_events_total{{{label},event="{name}"}} {value}'
+                  for name, value in data['counters'].items()]
+        return '\n'.join(lines) + '\n'
+
+    def save(self, path):
+        """Write JSON (.json) or Prometheus text (any other suffix, e.g. .prom)."""
+        path = Path(path)
+        path.write_text(self.to_json() if path.suffix == '.json' else self.to_prometheus(),
+                        encoding='utf-8')
+
+    def report(self):
+        """Print the per-stage breakdown, slowest stage first."""
+        data = self.to_dict()
+        wall = data['wall_seconds']
+        print("=" * 70)
+        print(f"STAGE BREAKDOWN ({self.name}, wall time {wall:.3f}s):")
+        print("=" * 70)
+        print(f"{'Stage':<22} {'Calls':<8} {'Total (s)':<11} {'Mean (ms)':<11} {'% wall':<8}")
+        print("-" * 70)
+        stages = sorted(data['stages'].items(), key=lambda item: -item[1]['total_seconds'])
+        for name, stage in stages:
+            share = stage['total_seconds'] / wall * 100
+            print(f"{name:<22} {stage['calls']:<8,} {stage['total_seconds']:<11.3f} "
+                  f"{stage['mean_seconds'] * 1e3:<11.3f} {share:<8.1f}")
+        if any(stage['total_seconds'] > wall for _, stage in stages):
+            print("(concurrent stages overlap, so their totals can exceed the wall time)")
+        if data['counters']:
+            print()
+            print("Counters: " + ", ".join(f"{name}={value:,}"
+                                           for name, value in data['counters'].items()))
+        print()
+
+
+class _NullProfiler:
+    """Stand-in used while profiling is off: every call is a no-op."""
+
+    name = None
+
+    def add(self, name, seconds):
+        pass
+
+    def stage(self, name):
+        return _NULL_CONTEXT
+
+    def count(self, name, amount=1):
+        pass
+
+    def timed_iter(self, name, iterable):
+        return iterable
+
+
+NULL_PROFILER = _NullProfiler()
+_active = NULL_PROFILER
+
+
+def enable(name='pipeline'):
+    """Start collecting into a fresh Profiler and return it."""
+    global _active
+    _active = Profiler(name)
+    return _active
+
+
+def disable():
+    global _active
+    _active = NULL_PROFILER
+
+
+def get_profiler():
+    """The active Profiler (NULL_PROFILER when profiling is off)."""
+    return _active
+
+
+def stage(name):
+    """Time a with-block on the active profiler."""
+    return _active.stage(name)
+
+
+def count(name, amount=1):
+    """Bump a counter on the active profiler."""
+    _active.count(name, amount)
+
+
+def add_arguments(parser):
+    """Add the shared --profile / --profile-output / --deep-profile options."""
+    parser.add_argument('--profile', action='store_true',
+                        help="Print a per-stage timing breakdown at the end")
+    parser.add_argument('--profile-output', default=None,
+                        help="Write stage timings to FILE (.json, or Prometheus text otherwise)")
+    parser.add_argument('--deep-profile', choices=DEEP_PROFILERS, default=None,
+                        help="Run the whole script under cProfile or pyinstrument "
+                             "(results/<script>_profile.prof / .html)")
+
+
+class ProfilingSession:
+    """
+    Wires the add_arguments options into a script.
+
+    Example:
+        session = ProfilingSession.from_args(args, 'level1_regex_filter')
+        ...                 # pipeline
+        session.finish()    # prints / writes whatever was requested
+    """
+
+    def __init__(self, name, report=False, output=None, deep=None):
+        self.name = name
+        self.report = report
+        self.output = output
+        self.deep = deep
+        self.profiler = enable(name) if report or output else None
+        self._deep_profiler = None
+        if deep == 'cprofile':
+            import cProfile
+
+            self._deep_profiler = cProfile.Profile()
+            self._deep_profiler.enable()
+        elif deep == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler as Pyinstrument
+            except ImportError:
+                raise SystemExit("pyinstrument is not installed (pip install pyinstrument); "
+                                 "use --deep-profile cprofile instead")
+            self._deep_profiler = Pyinstrument()
+            self._deep_profiler.start()
+
+    @classmethod
+    def from_args(cls, args, name):
+        return cls(name, report=args.profile, output=args.profile_output,
+                   deep=args.deep_profile)
+
+    def finish(self):
+        """Stop deep profiling and print/save the stage breakdown."""
+        if self.deep or self.report or self.output:
+            print()
+        if self.deep == 'cprofile':
+            import pstats
+
+            self._deep_profiler.disable()
+            path = Path('results') / f'{self.name}_profile.prof'
+            self._deep_profiler.dump_stats(path)
+            print(f"cProfile stats saved to: {path} (top 15 by cumulative time below)")
+            pstats.Stats(self._deep_profiler).sort_stats('cumulative').print_stats(15)
+        elif self.deep == 'pyinstrument':
+            self._deep_profiler.stop()
+            path = Path('results') / f'{self.name}_profile.html'
+            path.write_text(self._deep_profiler.output_html(), encoding='utf-8')
+            print(f"pyinstrument report saved to: {path}")
+
+        if self.profiler is not None:
+            if self.report:
+                self.profiler.report()
+            if self.output:
+                self.profiler.save(self.output)
+                print(f"Stage timings saved to: {self.output}")
+            disable()
@@ -0,0 +1,313 @@
+"""
+Memory-mapped scanning of raw newline-delimited chat logs.
+
+Even chunked pandas parsing builds a Python string for every message,
+although most of them turn out clean. scan_raw() memory-maps a log file
+(one message per line, optionally "label<TAB>message") and works on the
+bytes directly:
+
+- a compiled matcher runs over the mapped bytes (RE2 over a zero-copy
+  Arrow view when pyarrow is installed, else a bytes regex, see
+  BytesMatcher); only the lines it reports are decoded and confirmed
+  with the filter's own check()
+- line boundaries, labels and message lengths (in characters: bytes minus
+  UTF-8 continuation bytes) come from numpy views of the same buffer, so
+  the confusion matrix and length breakdown cover every line without
+  decoding it
+- the buffer is processed in blocks that end on a newline, so temporary
+  arrays stay bounded for files larger than memory
+
+The bytes matcher reports a superset of the lines the filter flags, so
+results are identical to a CSV scan. Only plain word lists are supported
+(no normalization or fuzzy matching, which rewrite the text before
+matching). With the re engine, characters whose lowercase form is ASCII
+although they are not (the Kelvin sign) are not folded.
+
+export_log() writes a CSV dataset in this format (tabs/newlines inside
+messages become spaces, which does not change any match).
+"""
+
+import mmap
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+
+from profanity_filter import profiling
+from profanity_filter.filter import ProfanityFilter
+from profanity_filter.matcher import build_trie_pattern
+
+BLOCK_BYTES = 64 * 1024 * 1024
+RAW_ENGINES = ('auto', 'arrow', 're')
+LABEL_BYTES = {ord('1'): 1.0, ord('0'): 0.0}
+_NEWLINE = 10
+_TAB = 9
+
+
+class BytesMatcher:
+    """
+    Finds candidate lines in a block of raw bytes; a superset of what word_filter flags.
+
+    Engines:
+        arrow: the block becomes a zero-copy Arrow string array (one value
+               per line, offsets from the newline table) and RE2 scans it with
+               Unicode case folding (pyarrow)
+        re: the block is lowercased once (bytes.lower, one copy per block,
+            ASCII only) and a bytes regex scans it, resuming at the next line
+            after each hit
+
+    Both use \b only when every word is ASCII: on bytes, and in RE2, word
+    characters are ASCII-only, so a boundary next to a non-ASCII letter is
+    reported too (check() rejects it) but one before a non-ASCII first
+    letter would be missed.
+    """
+
+    def __init__(self, word_filter, engine='auto'):
+        """
+        Args:
+            word_filter: Plain ProfanityFilter
+            engine: 'arrow', 're' or 'auto' (arrow when pyarrow is installed)
+
+        Raises:
+            ValueError: For filters that rewrite text before matching
+        """
+        from profanity_filter.columnar import has_pyarrow
+
+        if not isinstance(word_filter, ProfanityFilter) or word_filter.normalize:
+            raise ValueError("raw scanning needs a plain ProfanityFilter (no normalization, "
+                             "fuzzy or substring matching)")
+        if engine not in RAW_ENGINES:
+            raise ValueError(f"engine must be one of {RAW_ENGINES}, got {engine!r}")
+        self.engine = ('arrow' if has_pyarrow() else 're') if engine == 'auto' else engine
+        words = word_filter.words
+        boundaries = word_filter.matcher.word_boundaries and all(word.isascii() for word in words)
+        if self.engine == 'arrow':
+            body = build_trie_pattern(words)
+            self.pattern = r'\b(?:' + body + r')\b' if boundaries else '(?:' + body + ')'
+        else:
+            # Uppercase/titlecase spellings cover non-ASCII letters bytes.lower() keeps
+            variants = dict.fromkeys(
+                variant.encode('utf-8').lower()
+                for word in words for variant in (word, word.upper(), word.title())
+            )
+            body = build_trie_pattern([variant.decode('utf-8') for variant in variants])
+            pattern = r'\b(?:' + body + r')\b' if boundaries else '(?:' + body + ')'
+            self.pattern = pattern.encode('utf-8')
+            self.regex = re.compile(self.pattern)
+
+    def candidate_lines(self, mapped, position, end, starts, ends):
+        """Indices (into starts/ends) of the lines in mapped[position:end] that may match."""
+        if self.engine == 'arrow':
+            import pyarrow as pa
+            import pyarrow.compute as pc
+
+            offsets = np.append(starts, end) - position
+            with memoryview(mapped) as memory, memory[position:end] as block:
+                lines = pa.Array.from_buffers(pa.large_string(), len(starts),
+                                              [None, pa.py_buffer(offsets), pa.py_buffer(block)])
+                hits = pc.match_substring_regex(lines, self.pattern, ignore_case=True)
+                del lines
+            return np.flatnonzero(hits.to_numpy(zero_copy_only=False))
+
+        lowered = mapped[position:end].lower()
+        relative_ends = ends - position
+        hits = []
+        search = self.regex.search
+        match = search(lowered)
+        while match is not None:
+            line = int(np.searchsorted(relative_ends, match.start()))
+            hits.append(line)
+            match = search(lowered, int(relative_ends[line]) + 1)
+        return np.array(hits, dtype=np.int64)
+
+
+def _line_table(view, start, newlines, labelled):
+    """Per-line (starts, ends, text starts) for a block; ends exclude the newline."""
+    ends = newlines
+    starts = np.empty_like(ends)
+    starts[0] = start
+    starts[1:] = ends[:-1] + 1
+    if not labelled:
+        return starts, ends, starts
+    # "L\tmessage": the message starts after the tab ("\tmessage" = unlabelled)
+    second = view[np.minimum(starts + 1, len(view) - 1)]
+    first = view[np.minimum(starts, len(view) - 1)]
+    text_starts = np.where(first == _TAB, starts + 1,
+                           np.where((second == _TAB) & (ends - starts >= 2), starts + 2, starts))
+    return starts, ends, np.minimum(text_starts, ends)
+
+
+def _labels(view, starts, text_starts):
+    """float labels (1.0, 0.0, NaN) from the byte before each tab."""
+    labels = np.full(len(starts), np.nan)
+    has_label = text_starts == starts + 2
+    label_bytes = view[starts[has_label]]
+    values = np.full(len(label_bytes), np.nan)
+    for byte, value in LABEL_BYTES.items():
+        values[label_bytes == byte] = value
+    labels[has_label] = values
+    return labels
+
+
+def _char_lengths(view, block_start, block_end, text_starts, ends):
+    """Characters per line: bytes minus UTF-8 continuation bytes (no decoding)."""
+    lengths = ends - text_starts
+    block = view[block_start:block_end]
+    continuation = np.flatnonzero((block & 0xC0) == 0x80) + block_start
+    if len(continuation):
+        line_of = np.searchsorted(ends, continuation)
+        inside = continuation >= text_starts[line_of]
+        lengths = lengths - np.bincount(line_of[inside], minlength=len(ends))
+    return lengths
+
+
+def scan_raw(filepath, word_filter, labelled=True, output_file=None, max_examples=30,
+             block_bytes=BLOCK_BYTES, engine='auto', text_column='message',
+             label_column='label'):
+    """
+    Flag every line of a raw log, decoding only lines the bytes pattern hits.
+
+    Args:
+        filepath: Newline-delimited UTF-8 log ("label<TAB>message" if labelled)
+        word_filter: Plain ProfanityFilter
+        labelled: Lines start with a 1/0 label and a tab (enables metrics)
+        output_file: If set, flagged lines are written here (CSV, or Parquet by suffix)
+        max_examples: How many flagged / false-positive rows to keep for display
+        block_bytes: Bytes processed per block (bounds the temporary arrays)
+        engine: BytesMatcher engine ('auto', 'arrow' or 're')
+        text_column, label_column: Column names used for output rows
+
+    Returns:
+        dict: Same keys as streaming.scan_csv, plus 'bytes', 'seconds',
+              'candidates' (lines decoded), 'mb_per_second' and 'engine'
+    """
+    import pandas as pd
+
+    from profanity_filter.columnar import ChunkWriter
+    from profanity_filter.metrics import (
+        ConfusionAccumulator,
+        length_bucket_ids,
+        length_bucket_labels,
+    )
+    from profanity_filter.streaming import _keep_examples
+
+    matcher = BytesMatcher(word_filter, engine)
+    check = word_filter.check
+    columns = [text_column, label_column] if labelled else [text_column]
+    result = {'total': 0, 'flagged': 0, 'candidates': 0,
+              'flagged_examples': [], 'false_positive_examples': []}
+    if labelled:
+        confusion = ConfusionAccumulator()
+        length_labels = length_bucket_labels()
+        words = word_filter.words
+        word_ids = {word: index for index, word in enumerate(words)}
+
+    size = Path(filepath).stat().st_size
+    start_time = time.perf_counter()
+    out = ChunkWriter(output_file) if output_file else None
+    try:
+        with open(filepath, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+            view = np.frombuffer(mapped, dtype=np.uint8)
+            position = 0
+            while position < size:
+                # Blocks end right after a newline (or at EOF)
+                end = min(position + block_bytes, size)
+                if end < size:
+                    cut = mapped.rfind(b'\n', position, end)
+                    end = cut + 1 if cut >= 0 else (mapped.find(b'\n', end) + 1 or size)
+                with profiling.stage('raw_lines'):
+                    newlines = np.flatnonzero(view[position:end] == _NEWLINE) + position
+                    if end == size and (not len(newlines) or newlines[-1] != size - 1):
+                        newlines = np.append(newlines, size)
+                    starts, ends, text_starts = _line_table(view, position, newlines, labelled)
+
+                with profiling.stage('raw_match'):
+                    candidates = matcher.candidate_lines(mapped, position, end, starts, ends)
+                with profiling.stage('raw_verify'):
+                    hit_lines, texts = [], []
+                    for line in candidates.tolist():
+                        text = mapped[text_starts[line]:ends[line]].decode('utf-8', 'replace')
+                        if check(text):
+                            hit_lines.append(line)
+                            texts.append(text)
+                    result['candidates'] += len(candidates)
+
+                flagged = np.zeros(len(ends), dtype=bool)
+                flagged[hit_lines] = True
+                rows = pd.DataFrame({text_column: pd.Series(texts, dtype='str')})
+                rows.index = pd.Index(np.asarray(hit_lines, dtype=np.int64) + result['total'])
+                if labelled:
+                    labels = _labels(view, starts, text_starts)
+                    rows[label_column] = labels[hit_lines]
+                rows['flagged'] = True
+
+                result['total'] += len(ends)
+                result['flagged'] += len(rows)
+                _keep_examples(result['flagged_examples'], rows, max_examples)
+                profiling.count('rows', len(ends))
+                profiling.count('flagged', len(rows))
+
+                if labelled:
+                    with profiling.stage('metrics'):
+                        confusion.update(labels, flagged)
+                        lengths = _char_lengths(view, position, end, text_starts, ends)
+                        confusion.update_grouped('length', labels, flagged,
+                                                 length_bucket_ids(lengths), length_labels)
+                        matched = word_filter.first_words(rows[text_column])
+                        confusion.update_grouped('word', rows[label_column].to_numpy(),
+                                                 rows['flagged'].to_numpy(),
+                                                 matched.map(word_ids).fillna(-1).to_numpy(),
+                                                 words)
+                        _keep_examples(result['false_positive_examples'],
+                                       rows[rows[label_column] == 0.0], max_examples)
+
+                if out is not None:
+                    with profiling.stage('output_write'):
+                        out.write(rows[columns + ['flagged']])
+                position = end
+            del view
+            if size:
+                mapped.close()
+    finally:
+        if out is not None:
+            out.close()
+
+    seconds = time.perf_counter() - start_time
+    result['engine'] = matcher.engine
+    result['bytes'] = size
+    result['seconds'] = seconds
+    result['mb_per_second'] = size / 1e6 / seconds if seconds else 0.0
+    if labelled:
+        metrics = confusion.metrics()
+        result.update({key: metrics[key] for key in ('tp', 'fp', 'tn', 'fn')})
+        result['confusion'] = confusion
+    return result
+
+
+def export_log(csv_file, output_file, text_column='message', label_column='label',
+               chunksize=200_000):
+    """
+    Write a CSV (or Parquet) dataset as a "label<TAB>message" raw log.
+
+    Tabs, carriage returns and newlines inside messages become spaces;
+    missing labels are written as an empty label field.
+
+    Returns:
+        int: Lines written
+    """
+    from profanity_filter.streaming import iter_csv_chunks
+
+    columns = [text_column] if label_column is None else [text_column, label_column]
+    lines = 0
+    with open(output_file, 'w', encoding='utf-8', newline='\n') as out:
+        for chunk in iter_csv_chunks(csv_file, columns, chunksize):
+            texts = chunk[text_column].fillna('').astype(str).str.replace(
+                r'[\t\r\n]', ' ', regex=True)
+            if label_column is not None:
+                labels = chunk[label_column].map({1.0: '1', 0.0: '0'}).fillna('')
+                texts = labels.astype(str) + '\t' + texts
+            out.write('\n'.join(texts.tolist()) + '\n' if len(texts) else '')
+            lines += len(texts)
+    return lines
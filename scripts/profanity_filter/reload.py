@@ -0,0 +1,168 @@
+"""
+Hot-reloadable word list for long-running processes.
+
+ReloadingFilter watches the word-list file from a daemon thread (stat
+polling, no extra dependencies). When the file changes and has stopped
+changing for one poll interval, a complete new ProfanityFilter is built and
+compiled on the watcher thread, then published with a single reference
+assignment. Each check reads that reference once, so it sees either the
+old matcher or the new one - never a half-built one - and never waits on a
+lock while a rebuild is running.
+
+A list that fails to load (unreadable, not UTF-8, a pattern that does not
+compile) or comes out empty is rejected and the current matcher stays in
+place; the watcher keeps running.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+from profanity_filter.filter import DEFAULT_WORDS_FILE, ProfanityFilter
+from profanity_filter.matcher import load_profanity_words
+
+DEFAULT_POLL_INTERVAL = 1.0
+REBUILD_HISTORY = 100
+
+
+def _signature(path):
+    """(mtime_ns, size) of the file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ReloadingFilter:
+    """
+    ProfanityFilter that follows edits to its word-list file.
+
+    Example:
+        with ReloadingFilter('data/profanity_words.txt') as word_filter:
+            word_filter.check("you idiot")
+            word_filter.stats['last_rebuild_seconds']
+    """
+
+    def __init__(self, filepath=DEFAULT_WORDS_FILE, poll_interval=DEFAULT_POLL_INTERVAL,
+                 watch=True, **filter_options):
+        """
+        Args:
+            filepath: Word-list file to follow
+            poll_interval: Seconds between stat() calls
+            watch: Start the watcher thread (False = only reload() swaps)
+            **filter_options: Passed to ProfanityFilter (word_boundaries, normalize)
+        """
+        self.filepath = filepath
+        self.poll_interval = poll_interval
+        self._filter_options = filter_options
+        self._stop = threading.Event()
+        self._reload_lock = threading.Lock()
+        self._thread = None
+        self.stats = {'reloads': 0, 'rejected': 0, 'last_rebuild_seconds': 0.0,
+                      'rebuild_seconds': deque(maxlen=REBUILD_HISTORY), 'words': 0}
+
+        self._signature = _signature(filepath)
+        self._filter = self._build(load_profanity_words(filepath))
+        if watch:
+            self.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def current(self):
+        """The ProfanityFilter in use right now (read once per operation)."""
+        return self._filter
+
+    def _build(self, words):
+        """Build and fully compile a filter, recording the rebuild time."""
+        start = time.perf_counter()
+        word_filter = ProfanityFilter(words, **self._filter_options)
+        word_filter.matcher  # compile now, not on the first check after the swap
+        seconds = time.perf_counter() - start
+        self.stats['last_rebuild_seconds'] = seconds
+        self.stats['rebuild_seconds'].append(seconds)
+        self.stats['words'] = len(word_filter.words)
+        return word_filter
+
+    def reload(self):
+        """
+        Rebuild from the file now and swap the new matcher in.
+
+        Returns:
+            bool: True if the new list was published
+        """
+        with self._reload_lock:
+            self._signature = _signature(self.filepath)
+            try:
+                words = load_profanity_words(self.filepath)
+                word_filter = self._build(words) if words else None
+            except Exception:
+                word_filter = None  # UnicodeDecodeError, re.error, ...
+            if word_filter is None:
+                self.stats['rejected'] += 1
+                return False
+            self._filter = word_filter  # single reference assignment
+            self.stats['reloads'] += 1
+            return True
+
+    def start(self):
+        """Start the watcher thread (idempotent)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name='word-list-watcher',
+                                            daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """Stop the watcher thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self):
+        pending = None
+        while not self._stop.wait(self.poll_interval):
+            signature = _signature(self.filepath)
+            if signature is None or signature == self._signature:
+                pending = None
+                continue
+            # Only rebuild once the file has stopped changing (no half-written lists)
+            if signature == pending:
+                try:
+                    self.reload()
+                except Exception:
+                    self.stats['rejected'] += 1  # never let one bad edit stop the watcher
+                pending = None
+            else:
+                pending = signature
+
+    # Filter API, each call bound to one matcher generation
+
+    @property
+    def words(self):
+        return self._filter.words
+
+    @property
+    def pattern(self):
+        return self._filter.pattern
+
+    def check(self, text):
+        return self._filter.check(text)
+
+    def check_many(self, texts):
+        return self._filter.check_many(texts)
+
+    def explain(self, text):
+        return self._filter.explain(text)
+
+    def describe(self, text):
+        return self._filter.describe(text)
+
+    def flag_series(self, series):
+        return self._filter.flag_series(series)
@@ -0,0 +1,203 @@
+"""
+Severity-weighted scoring.
+
+A scored word list (data/profanity_scores.csv) gives every term a severity
+in [0, 1] and a category:
+
+    word,severity,category
+    damn,0.2,mild
+    fuck,0.8,profanity
+
+A message's toxicity score combines the severities of all its matches
+with a noisy-OR, 1 - prod(1 - severity): one mild word stays mild, several
+hits push the score towards 1. aggregate='max' uses the single worst term
+instead. Scores map to tiers (allow / review / block) so mild hits can be
+auto-allowed and only severe ones escalated.
+
+score_series is vectorized: str.contains finds the flagged rows (the same
+pass as flag_series), and findall/explode/groupby run only on those rows.
+"""
+
+import csv
+from pathlib import Path
+
+from profanity_filter.filter import ProfanityFilter, is_missing
+from profanity_filter.matcher import PYTHON_RE, load_profanity_words, series_contains
+
+DEFAULT_SCORES_FILE = Path('data/profanity_scores.csv')
+DEFAULT_SEVERITY = 1.0
+DEFAULT_CATEGORY = 'unrated'
+# Scores below the first threshold are allowed, at/above the second blocked
+DEFAULT_THRESHOLDS = (0.4, 0.7)
+TIERS = ['allow', 'review', 'block']
+
+
+def load_scored_words(filepath):
+    """
+    Load a scored word list.
+
+    CSV files need word,severity,category columns (category optional). A
+    plain one-word-per-line list is accepted too, with every term at
+    DEFAULT_SEVERITY.
+
+    Returns:
+        dict: word -> {'severity': float, 'category': str}, in file order
+    """
+    filepath = Path(filepath)
+    if filepath.suffix.lower() != '.csv':
+        return {word: {'severity': DEFAULT_SEVERITY, 'category': DEFAULT_CATEGORY}
+                for word in load_profanity_words(filepath)}
+
+    terms = {}
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            word = (row.get('word') or '').strip().lower()
+            if not word:
+                continue
+            severity = float(row.get('severity') or DEFAULT_SEVERITY)
+            if not 0.0 <= severity <= 1.0:
+                raise ValueError(f"{filepath}: severity for '{word}' must be in [0, 1], got {severity}")
+            terms[word] = {'severity': severity,
+                           'category': (row.get('category') or DEFAULT_CATEGORY).strip()}
+    return terms
+
+
+def combine(severities, aggregate='noisy_or'):
+    """Combine match severities into one score in [0, 1]."""
+    if not severities:
+        return 0.0
+    if aggregate == 'max':
+        return max(severities)
+    remaining = 1.0
+    for severity in severities:
+        remaining *= 1.0 - severity
+    return 1.0 - remaining
+
+
+def tier(score, thresholds=DEFAULT_THRESHOLDS):
+    """'allow', 'review' or 'block' for a score."""
+    if score >= thresholds[1]:
+        return 'block'
+    if score >= thresholds[0]:
+        return 'review'
+    return 'allow'
+
+
+class SeverityScorer:
+    """
+    Numeric toxicity score from a scored word list.
+
+    Example:
+        scorer = SeverityScorer.from_file('data/profanity_scores.csv')
+        scorer.score("damn it")           # {'score': 0.2, 'tier': 'allow', ...}
+        scorer.score_series(df['message'])  # DataFrame: score, max_severity, top_term, ...
+    """
+
+    def __init__(self, terms, aggregate='noisy_or', thresholds=DEFAULT_THRESHOLDS,
+                 normalize=False):
+        """
+        Args:
+            terms: dict word -> {'severity', 'category'} (see load_scored_words)
+            aggregate: 'noisy_or' (default) or 'max'
+            thresholds: (review, block) score thresholds for tiers
+            normalize: Match through the leetspeak normalization stage
+        """
+        if aggregate not in ('noisy_or', 'max'):
+            raise ValueError(f"aggregate must be 'noisy_or' or 'max', got {aggregate!r}")
+        self.terms = dict(terms)
+        self.aggregate = aggregate
+        self.thresholds = thresholds
+        self.word_filter = ProfanityFilter(list(self.terms), normalize=normalize)
+        self._severities = {word: term['severity'] for word, term in self.terms.items()}
+        self._categories = {word: term['category'] for word, term in self.terms.items()}
+
+    @classmethod
+    def from_file(cls, filepath=DEFAULT_SCORES_FILE, **options):
+        return cls(load_scored_words(filepath), **options)
+
+    def severity(self, word):
+        return self._severities.get(word, DEFAULT_SEVERITY)
+
+    def category(self, word):
+        return self._categories.get(word, DEFAULT_CATEGORY)
+
+    def score(self, text):
+        """
+        Score one message.
+
+        Returns:
+            dict: 'score', 'tier', 'max_severity', 'categories' (sorted) and
+                  'matches' (explain() dicts plus 'severity' and 'category')
+        """
+        matches = [] if is_missing(text) else self.word_filter.explain(text)
+        for match in matches:
+            match['severity'] = self.severity(match['word'])
+            match['category'] = self.category(match['word'])
+        severities = [match['severity'] for match in matches]
+        score = combine(severities, self.aggregate)
+        return {
+            'score': score,
+            'tier': tier(score, self.thresholds),
+            'max_severity': max(severities, default=0.0),
+            'categories': sorted({match['category'] for match in matches}),
+            'matches': matches,
+        }
+
+    def score_series(self, series):
+        """
+        Vectorized score() over a pandas Series.
+
+        Returns:
+            DataFrame (same index): 'score', 'max_severity', 'matches' (count),
+            'top_term', 'top_category' and 'tier'
+        """
+        import numpy as np
+        import pandas as pd
+
+        prepared = self.word_filter.prepare_series(series)
+        flagged = series_contains(prepared, self.word_filter.pattern).to_numpy(dtype=bool)
+        count = len(series)
+        score = np.zeros(count)
+        max_severity = np.zeros(count)
+        matches = np.zeros(count, dtype=np.int64)
+        top_term = np.full(count, None, dtype=object)
+
+        if flagged.any():
+            # Positions among flagged rows, so duplicate index labels are harmless
+            hits = prepared[flagged].reset_index(drop=True)
+            hits = hits.str.findall(self.word_filter.pattern, flags=PYTHON_RE).explode().dropna()
+            if self.word_filter.normalize:
+                hits = hits.map(self.word_filter.matcher.canonical)
+            severities = hits.map(self._severities).fillna(DEFAULT_SEVERITY).astype(float)
+            rows = severities.groupby(level=0)
+
+            positions = np.flatnonzero(flagged)
+            if self.aggregate == 'max':
+                combined = rows.max()
+            else:
+                # noisy-OR in log space: 1 - exp(sum(log(1 - s)))
+                log_clean = np.log1p(-severities.clip(upper=1 - 1e-12))
+                combined = -np.expm1(log_clean.groupby(level=0).sum())
+            score[positions[combined.index]] = combined.to_numpy()
+            max_severity[positions[combined.index]] = rows.max().to_numpy()
+            matches[positions[combined.index]] = rows.size().to_numpy()
+
+            worst = pd.DataFrame({'row': severities.index, 'term': hits.to_numpy(),
+                                  'severity': severities.to_numpy()})
+            worst = worst.sort_values('severity', ascending=False, kind='stable') \
+                .drop_duplicates('row')
+            top_term[positions[worst['row'].to_numpy()]] = worst['term'].to_numpy()
+
+        review, block = self.thresholds
+        tiers = np.array(TIERS, dtype=object)[
+            np.digitize(score, [review, block], right=False)
+        ]
+        result = pd.DataFrame({
+            'score': score,
+            'max_severity': max_severity,
+            'matches': matches,
+            'top_term': top_term,
+            'tier': tiers,
+        }, index=series.index)
+        result['top_category'] = result['top_term'].map(self._categories)
+        return result
@@ -0,0 +1,244 @@
+"""
+Chunked CSV scanning with bounded memory.
+
+Large chat exports are read in fixed-size chunks and pushed through a
+generator pipeline (read -> flag -> accumulate/write), so only one chunk is
+alive at a time. Confusion-matrix counts (profanity_filter.metrics), example
+rows and the flagged-row CSV are all built incrementally. Parquet inputs
+and outputs (profanity_filter.columnar) stream the same way.
+"""
+
+from profanity_filter import profiling
+
+DEFAULT_CHUNKSIZE = 100_000
+MAX_EXAMPLES = 30
+
+
+def iter_csv_chunks(filepath, columns, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Yield DataFrame chunks containing only the requested columns.
+
+    Args:
+        filepath: CSV (or Parquet) file to read
+        columns: Columns to load (everything else is skipped while parsing)
+        chunksize: Rows per chunk; None loads the whole file as one chunk
+    """
+    import pandas as pd
+
+    from profanity_filter import columnar
+
+    if columnar.is_parquet(filepath):
+        if chunksize is None:
+            yield columnar.read_table(filepath, columns)
+        else:
+            yield from columnar.iter_parquet_chunks(filepath, columns, chunksize)
+        return
+
+    if chunksize is None:
+        yield pd.read_csv(filepath, usecols=columns)
+        return
+
+    with pd.read_csv(filepath, usecols=columns, chunksize=chunksize) as reader:
+        yield from reader
+
+
+def text_chunks(chunks, text_column):
+    """
+    Give text_column a string dtype in every chunk as it streams past.
+
+    A chunk whose messages are all missing (or all numbers) is parsed as
+    float/int, which has no .str; see matcher.as_text.
+    """
+    from profanity_filter.matcher import as_text
+
+    for chunk in chunks:
+        chunk[text_column] = as_text(chunk[text_column])
+        yield chunk
+
+
+def flag_chunks(chunks, word_filter, text_column):
+    """Add a boolean 'flagged' column to every chunk as it streams past."""
+    for chunk in chunks:
+        chunk['flagged'] = word_filter.flag_series(chunk[text_column])
+        yield chunk
+
+
+def flag_unique(chunks, flag_stage, text_column, deduplicator):
+    """
+    Run flag_stage on each chunk's unique messages only, then fan flags out.
+
+    Args:
+        chunks: Iterable of DataFrame chunks
+        flag_stage: flag_chunks-like callable(chunks) yielding chunks in order
+                    with a 'flagged' column
+        text_column: Column to deduplicate on
+        deduplicator: profanity_filter.dedup.Deduplicator (stats accumulate on it)
+    """
+    from collections import deque
+
+    pending = deque()
+
+    def representatives():
+        for chunk in chunks:
+            with profiling.stage('dedup'):
+                groups = deduplicator(chunk[text_column])
+            pending.append((chunk, groups))
+            yield groups.representatives(chunk[text_column]).to_frame()
+
+    for flagged_representatives in flag_stage(representatives()):
+        chunk, groups = pending.popleft()
+        chunk['flagged'] = groups.expand(flagged_representatives['flagged'].to_numpy())
+        yield chunk
+
+
+def scan_csv(filepath, word_filter, text_column, label_column=None,
+             output_file=None, chunksize=DEFAULT_CHUNKSIZE, max_examples=MAX_EXAMPLES,
+             workers=1, explain=False, scorer=None, deduplicator=None, redactor=None):
+    """
+    Flag every row of a CSV file, keeping memory bounded by the chunk size.
+
+    Args:
+        filepath: Input CSV (or Parquet)
+        word_filter: ProfanityFilter used to flag text_column
+        text_column: Column holding the message / username
+        label_column: Optional label column (1.0 = toxic, 0.0 = clean)
+        output_file: If set, flagged rows are appended here chunk by chunk
+                     (CSV, or Parquet for a .parquet path)
+        chunksize: Rows per chunk; None loads the whole file at once
+        max_examples: How many flagged / false-positive rows to keep for display
+        workers: Flag chunks in this many processes (chunksize defaults to
+                 DEFAULT_CHUNKSIZE when workers > 1)
+        explain: Add a 'matches' column (word_filter.describe) to flagged rows
+        scorer: Optional SeverityScorer; adds 'score' and 'tier' columns to
+                flagged rows (and a 'tier' breakdown when labels are given)
+        deduplicator: Optional Deduplicator; only one message per duplicate
+                      group (within a chunk) is flagged, see flag_unique
+        redactor: Optional Redactor; adds a 'redacted' column (text_column
+                  with matched words masked) to flagged rows
+
+    Returns:
+        dict: 'total', 'flagged', 'flagged_examples', 'false_positive_examples'
+              and, when label_column is given, 'tp', 'fp', 'tn', 'fn' plus a
+              ConfusionAccumulator under 'confusion' with 'length' and 'word'
+              (and, with a scorer, 'tier') breakdowns
+    """
+    columns = [text_column] if label_column is None else [text_column, label_column]
+    output_columns = columns + ['flagged'] + (['matches'] if explain else []) + \
+        (['score', 'tier'] if scorer is not None else []) + \
+        (['redacted'] if redactor is not None else [])
+
+    result = {
+        'total': 0,
+        'flagged': 0,
+        'flagged_examples': [],
+        'false_positive_examples': [],
+    }
+    if label_column is not None:
+        from profanity_filter.metrics import (
+            ConfusionAccumulator,
+            length_bucket_ids,
+            length_bucket_labels,
+        )
+
+        confusion = ConfusionAccumulator()
+        length_labels = length_bucket_labels()
+        words = word_filter.words
+        word_ids = {word: index for index, word in enumerate(words)}
+
+    if workers > 1:
+        from profanity_filter.parallel import flag_chunks_parallel
+
+        chunks = iter_csv_chunks(filepath, columns, chunksize or DEFAULT_CHUNKSIZE)
+
+        def flag_stage(stage_chunks):
+            return flag_chunks_parallel(stage_chunks, word_filter, text_column, workers)
+    else:
+        chunks = iter_csv_chunks(filepath, columns, chunksize)
+
+        def flag_stage(stage_chunks):
+            return flag_chunks(stage_chunks, word_filter, text_column)
+
+    chunks = profiling.get_profiler().timed_iter('csv_load', text_chunks(chunks, text_column))
+    if deduplicator is not None:
+        flagged_chunks = flag_unique(chunks, flag_stage, text_column, deduplicator)
+    else:
+        flagged_chunks = flag_stage(chunks)
+
+    out = None
+    if output_file:
+        from profanity_filter.columnar import ChunkWriter
+
+        out = ChunkWriter(output_file)
+    try:
+        for chunk in flagged_chunks:
+            flagged = chunk['flagged']
+            flagged_rows = chunk[flagged]
+            if explain:
+                with profiling.stage('explain'):
+                    flagged_rows = flagged_rows.assign(
+                        matches=flagged_rows[text_column].map(word_filter.describe)
+                    )
+            if scorer is not None:
+                with profiling.stage('score'):
+                    scores = scorer.score_series(flagged_rows[text_column])
+                    flagged_rows = flagged_rows.assign(score=scores['score'].round(4),
+                                                       tier=scores['tier'])
+            if redactor is not None:
+                with profiling.stage('redact'):
+                    flagged_rows = flagged_rows.assign(
+                        redacted=flagged_rows[text_column].map(redactor.redact)
+                    )
+
+            result['total'] += len(chunk)
+            result['flagged'] += len(flagged_rows)
+            _keep_examples(result['flagged_examples'], flagged_rows, max_examples)
+            profiling.count('chunks')
+            profiling.count('rows', len(chunk))
+            profiling.count('flagged', len(flagged_rows))
+
+            if label_column is not None:
+                with profiling.stage('metrics'):
+                    labels = chunk[label_column].to_numpy()
+                    confusion.update(labels, flagged.to_numpy())
+                    lengths = chunk[text_column].str.len().fillna(0).to_numpy()
+                    confusion.update_grouped('length', labels, flagged.to_numpy(),
+                                             length_bucket_ids(lengths), length_labels)
+
+                    # Per-word breakdown only needs the flagged rows (all predicted toxic)
+                    matched = word_filter.first_words(flagged_rows[text_column])
+                    confusion.update_grouped('word', flagged_rows[label_column].to_numpy(),
+                                             flagged_rows['flagged'].to_numpy(),
+                                             matched.map(word_ids).fillna(-1).to_numpy(), words)
+
+                    if scorer is not None:
+                        from profanity_filter.scoring import TIERS
+
+                        tier_ids = flagged_rows['tier'].map(
+                            {name: i for i, name in enumerate(TIERS)})
+                        confusion.update_grouped('tier', flagged_rows[label_column].to_numpy(),
+                                                 flagged_rows['flagged'].to_numpy(),
+                                                 tier_ids.to_numpy(), TIERS)
+
+                    _keep_examples(result['false_positive_examples'],
+                                   chunk[flagged & (chunk[label_column] == 0.0)], max_examples)
+
+            if out is not None:
+                with profiling.stage('output_write'):
+                    out.write(flagged_rows[output_columns])
+    finally:
+        if out is not None:
+            out.close()
+
+    if label_column is not None:
+        metrics = confusion.metrics()
+        result.update({key: metrics[key] for key in ('tp', 'fp', 'tn', 'fn')})
+        result['confusion'] = confusion
+
+    return result
+
+
+def _keep_examples(examples, rows, max_examples):
+    """Append rows to examples until max_examples is reached."""
+    room = max_examples - len(examples)
+    if room > 0:
+        examples.extend(rows.head(room).to_dict('records'))
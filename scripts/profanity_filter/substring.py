@@ -0,0 +1,222 @@
+"""
+Substring-aware username scanning (Aho-Corasick).
+
+Usernames are concatenated ("xXshitlordXx"), so the word-boundary regex used
+for chat messages misses them. UsernameScanner finds every embedded listed
+word, with offsets, in one linear pass per name using an Aho-Corasick
+automaton. An allow-list of innocent words ("classic", "hello") is compiled
+into the same automaton: a profane match lying entirely inside an allowed
+word is dropped.
+
+Most names are clean, so bulk scanning first runs the combined substring
+regex (C speed) and only walks the automaton for names it hits.
+"""
+
+import threading
+from pathlib import Path
+
+from profanity_filter.filter import DEFAULT_WORDS_FILE, is_missing
+from profanity_filter.matcher import WordMatcher, as_text, load_profanity_words
+
+DEFAULT_ALLOWLIST_FILE = Path('data/username_allowlist.txt')
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over a fixed list of words.
+
+    Matching is O(len(text) + matches) regardless of the number of words,
+    and reports overlapping matches ("shitshit" -> two "shit").
+    """
+
+    def __init__(self, words):
+        """
+        Args:
+            words: Iterable of literal (lowercased) words
+        """
+        self.words = list(dict.fromkeys(word for word in words if word))
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        for index, word in enumerate(self.words):
+            state = 0
+            for char in word:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] += (index,)
+
+        # Breadth-first failure links; outputs inherit the failure state's
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+                queue.append(child)
+
+    def __len__(self):
+        return len(self.words)
+
+    def iter_matches(self, text):
+        """
+        Yield (start, end, word_index) for every occurrence of every word.
+
+        Args:
+            text: Already-lowercased string
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        words = self.words
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in out[state]:
+                end = position + 1
+                yield end - len(words[index]), end, index
+
+
+class UsernameScanner:
+    """
+    Thread-safe substring scanner with an allow-list.
+
+    Drop-in for ProfanityFilter in streaming.scan_csv (check, flag_series,
+    describe, pickling for worker processes).
+
+    Example:
+        scanner = UsernameScanner.from_files()
+        scanner.find("xXshitlordXx")  # [{'word': 'shit', 'start': 2, 'end': 6}]
+        scanner.check("classic_gamer")  # False ("ass" is inside allowed "classic")
+    """
+
+    def __init__(self, words, allow_words=()):
+        """
+        Args:
+            words: Iterable of profanity words
+            allow_words: Innocent words that may contain a profanity word
+        """
+        self._words = list(words)
+        self._allow_words = list(allow_words)
+        self._matcher = None
+        self._automaton = None
+        self._profane_count = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'words': self._words, 'allow_words': self._allow_words}
+
+    def __setstate__(self, state):
+        self.__init__(state['words'], state['allow_words'])
+
+    @classmethod
+    def from_files(cls, words_file=DEFAULT_WORDS_FILE, allowlist_file=DEFAULT_ALLOWLIST_FILE):
+        """Build a scanner from a word list and an allow-list file (missing allow-list = empty)."""
+        allow_words = load_profanity_words(allowlist_file) if Path(allowlist_file).exists() else []
+        return cls(load_profanity_words(words_file), allow_words)
+
+    @classmethod
+    def from_dictionary(cls, path):
+        """
+        Build a scanner from the word list and allow-list stored in a compiled dictionary.
+
+        Entries the compiler skipped as non-word ("a$$") are kept: substring
+        matching has no token boundaries to trip over.
+        """
+        from profanity_filter.compiled import CompiledFilter
+
+        dictionary = CompiledFilter(path)
+        words = dictionary.words + dictionary.meta.get('skipped', [])
+        return cls(words, dictionary.allow_words)
+
+    @property
+    def matcher(self):
+        """Boundary-free WordMatcher used as the prefilter (automaton is built alongside)."""
+        matcher = self._matcher
+        if matcher is None:
+            with self._lock:
+                if self._matcher is None:
+                    prefilter = WordMatcher(self._words, word_boundaries=False)
+                    allowed = [w for w in dict.fromkeys(self._allow_words) if w not in prefilter.words]
+                    self._profane_count = len(prefilter.words)
+                    self._automaton = AhoCorasick(prefilter.words + allowed)
+                    self._matcher = prefilter
+                matcher = self._matcher
+        return matcher
+
+    @property
+    def automaton(self):
+        """The AhoCorasick automaton: profanity words first, then allow-listed words."""
+        self.matcher
+        return self._automaton
+
+    @property
+    def words(self):
+        return self.matcher.words
+
+    @property
+    def allow_words(self):
+        return list(self._allow_words)
+
+    @property
+    def pattern(self):
+        """Substring regex source (a superset of the final matches, before the allow-list)."""
+        return self.matcher.pattern
+
+    def find(self, name):
+        """
+        Every embedded profanity word not covered by an allowed word.
+
+        Returns:
+            list: Dicts with 'word', 'start' and 'end' (offsets into the
+                  lowercased name), in order of end position
+        """
+        if is_missing(name):
+            return []
+        lowered = name.lower()
+        if self.matcher.regex.search(lowered) is None:
+            return []
+
+        automaton, profane_count = self._automaton, self._profane_count
+        hits, allowed = [], []
+        for start, end, index in automaton.iter_matches(lowered):
+            if index < profane_count:
+                hits.append((start, end, index))
+            else:
+                allowed.append((start, end))
+        return [
+            {'word': automaton.words[index], 'start': start, 'end': end}
+            for start, end, index in hits
+            if not any(a_start <= start and end <= a_end for a_start, a_end in allowed)
+        ]
+
+    def check(self, name):
+        """Return True if name contains a profanity word outside the allow-list."""
+        return bool(self.find(name))
+
+    def check_many(self, names):
+        return [self.check(name) for name in names]
+
+    def explain(self, name):
+        return self.find(name)
+
+    def describe(self, name):
+        """One-line explanation, e.g. "'ass' at 1-4"."""
+        return '; '.join(f"'{m['word']}' at {m['start']}-{m['end']}" for m in self.find(name))
+
+    def flag_series(self, series):
+        """Vectorized check(): regex prefilter over the Series, automaton only on hits."""
+        flagged = as_text(series).str.lower().str.contains(self.pattern, regex=True, na=False)
+        positions = flagged.to_numpy().nonzero()[0]
+        if len(positions):
+            flagged.iloc[positions] = [self.check(name) for name in series.iloc[positions]]
+        return flagged
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Export a dataset with profanity masked instead of dropping flagged lines.
+
+Every row is written; matched words in the message column are masked
+("you idiot" -> "you i****"). The output format follows its suffix
+(.csv or .parquet).
+
+Usage:
+    python scripts/redact_messages.py
+    python scripts/redact_messages.py --normalize --keep 0 --output results/redacted.parquet
+"""
+
+import argparse
+import time
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.columnar import resolve_dataset
+from profanity_filter.fuzzy import FuzzyFilter
+from profanity_filter.redact import DEFAULT_KEEP, DEFAULT_MASK, Redactor, redact_file
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Mask profanity in a chat dataset")
+    parser.add_argument('--input', default=None,
+                        help="CSV or Parquet (default: data/gametox.parquet if converted, "
+                             "else data/gametox.csv)")
+    parser.add_argument('--output', default='results/redacted_messages.csv',
+                        help="Output CSV or Parquet (default: results/redacted_messages.csv)")
+    parser.add_argument('--column', default='message',
+                        help="Message column to mask (default: message)")
+    parser.add_argument('--normalize', action='store_true',
+                        help="Also mask obfuscated words (sh1t, f.u.c.k)")
+    parser.add_argument('--fuzzy', type=int, default=0, metavar='K',
+                        help="Also mask misspellings within edit distance K")
+    parser.add_argument('--mask', default=DEFAULT_MASK,
+                        help=f"Mask character (default: {DEFAULT_MASK})")
+    parser.add_argument('--keep', type=int, default=DEFAULT_KEEP,
+                        help=f"Leading characters left readable (default: {DEFAULT_KEEP})")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    input_file = args.input or resolve_dataset('data/gametox.csv')
+    if args.fuzzy:
+        word_filter = FuzzyFilter.from_file('data/profanity_words.txt', max_distance=args.fuzzy,
+                                            normalize=args.normalize)
+    else:
+        word_filter = ProfanityFilter.from_file('data/profanity_words.txt',
+                                                normalize=args.normalize)
+    redactor = Redactor(word_filter, mask=args.mask, keep=args.keep)
+
+    start = time.perf_counter()
+    stats = redact_file(input_file, args.output, redactor, text_column=args.column)
+    seconds = time.perf_counter() - start
+    print(f"✓ Wrote {stats['rows']:,} rows to {args.output} "
+          f"({stats['redacted']:,} redacted) in {seconds:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Train the local linear classifier tier (profanity_filter.linear).
+
+Trains logistic regression over hashed character n-grams on GameTox,
+leaving out every message of the 50-message evaluation sample so that
+compare_approaches.py stays a fair comparison. A holdout split is scored
+against the word-list regex, and batch throughput is measured before the
+model is saved.
+
+Usage:
+    python scripts/train_linear_model.py
+    python scripts/train_linear_model.py --input data/gametox.csv --output data/linear_model.npz
+"""
+
+import argparse
+import time
+
+from profanity_filter import ProfanityFilter
+from profanity_filter.columnar import resolve_dataset
+from profanity_filter.linear import DEFAULT_MODEL_FILE, LinearClassifier, load_training_data
+from profanity_filter.metrics import calculate_metrics
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train the hashed n-gram linear classifier")
+    parser.add_argument('--input', default=None,
+                        help="Labelled messages, CSV or Parquet (default: data/gametox.parquet "
+                             "if converted, else data/gametox.csv)")
+    parser.add_argument('--exclude', default='data/gametox_sample_50.csv',
+                        help="Messages never trained on (default: data/gametox_sample_50.csv)")
+    parser.add_argument('--output', default=str(DEFAULT_MODEL_FILE),
+                        help="Model file (default: data/linear_model.npz)")
+    parser.add_argument('--holdout', type=float, default=0.2,
+                        help="Fraction of rows held out for evaluation (default: 0.2)")
+    parser.add_argument('--epochs', type=int, default=100,
+                        help="Training epochs (default: 100)")
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help="Probability threshold for TOXIC (default: 0.5)")
+    args = parser.parse_args()
+    args.input = args.input or resolve_dataset('data/gametox.csv')
+    return args
+
+
+def main():
+    args = parse_args()
+
+    print("=" * 70)
+    print("TRAINING LINEAR CLASSIFIER (hashed character n-grams)")
+    print("=" * 70)
+    train, holdout = load_training_data(args.input, args.exclude, args.holdout)
+    print(f"Training rows: {len(train):,} ({int(train['label'].sum()):,} toxic)")
+    print(f"Holdout rows:  {len(holdout):,}")
+    print()
+
+    start = time.perf_counter()
+    model = LinearClassifier.train(train['message'], train['label'], epochs=args.epochs,
+                                   threshold=args.threshold)
+    print(f"✓ Trained in {time.perf_counter() - start:.1f}s")
+    print()
+
+    word_filter = ProfanityFilter.from_file('data/profanity_words.txt')
+    messages = holdout['message'].tolist()
+    start = time.perf_counter()
+    linear_predictions = model.predict(messages)
+    linear_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    regex_predictions = word_filter.check_many(messages)
+    regex_seconds = time.perf_counter() - start
+
+    print(f"{'Holdout':<10} {'Accuracy':<10} {'Precision':<10} {'Recall':<10} {'F1':<8} {'Msgs/s':<12}")
+    print("-" * 70)
+    for name, predictions, seconds in [('regex', regex_predictions, regex_seconds),
+                                       ('linear', linear_predictions, linear_seconds)]:
+        metrics = calculate_metrics(holdout['label'], predictions)
+        print(f"{name:<10} {metrics['accuracy']:<10.3f} {metrics['precision']:<10.3f} "
+              f"{metrics['recall']:<10.3f} {metrics['f1']:<8.3f} "
+              f"{len(messages) / max(seconds, 1e-9):<12,.0f}")
+    print()
+
+    model.save(args.output)
+    print(f"Model saved to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()